@@ -2,8 +2,7 @@
 
 goFile=$1
 
-python3 parser.py --input=$goFile --csv="symTab.csv" --code="3AC.code"
-python3 codeGen.py
+python3 driver.py --input=$goFile --csv="symTab.csv" --code="3AC.code"
 
 nasm -f elf32 "assembly.asm" -o "assembly.o"
 gcc -m32 "assembly.o" -o "a.out"
@@ -0,0 +1,140 @@
+r'''
+Compiles many Go files across a pool of worker processes. Every worker owns
+one parser.Compiler, so the PLY tables are loaded once per process and each
+file still starts from fresh parser state.
+Run from src/assn4:
+    python3 batch.py [--jobs=N] [--until=asm] [--outdir=out] [codeGen.py options] dir|file.go ...
+For a file dir/a.go, outdir gets a.csv and a.code (and a.asm, a.dot), under
+the path of a.go relative to the common directory of all inputs. Errors are
+collected from the workers and reported together at the end.
+'''
+
+import argparse
+import contextlib
+import copy
+import io
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+import parser as goParser
+from codeGen import addArguments, generate, writeAssembly
+
+# state of a worker process, set up by initWorker
+compiler = None
+options = None
+
+
+def goFiles(paths):
+    # the .go files named by paths, directories are searched recursively
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            files += [os.path.join(root, name) for name in sorted(names) if name.endswith('.go')]
+    return files
+
+
+def initWorker(options_):
+    global compiler, options
+    compiler = goParser.Compiler()
+    options = options_
+
+
+def compileFile(job):
+    r'''
+    compiles job = (goFile, outBase) in a worker, returns (goFile, status,
+    errors, seconds) with status 'ok', 'error' (errors holds the Errors
+    entries) or 'crash' (errors holds the traceback)
+    '''
+    goFile, outBase = job
+    start = time.perf_counter()
+    status = 'ok'
+    errors = []
+    # Errors prints as it goes, keep that out of the shared stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            in_file = open(goFile, 'r')
+            data = in_file.read()
+            in_file.close()
+            parsed = compiler.compile(data)
+            if parsed is None:
+                status = 'error'
+                errors = list(compiler.errors.error)
+            else:
+                helper, rootNode = parsed
+                os.makedirs(os.path.dirname(outBase), exist_ok=True)
+                csv_file = open(outBase + '.csv', 'w+')
+                goParser.generateCSV(csv_file, helper)
+                csv_file.close()
+                goParser.writeCode(outBase + '.code', rootNode)
+                if options.until == 'asm':
+                    result = copy.copy(options)
+                    result.dot = outBase + '.dot' if options.dot == 't' else None
+                    writeAssembly(generate(helper, rootNode, result), outBase + '.asm')
+        except Exception:
+            status = 'crash'
+            errors = [traceback.format_exc()]
+    return goFile, status, errors, time.perf_counter() - start
+
+
+def report(results, elapsed, jobs):
+    counts = {'ok': 0, 'error': 0, 'crash': 0}
+    byType = {}
+    for goFile, status, errors, seconds in results:
+        counts[status] += 1
+        if status == 'error':
+            print('%s: %d errors' % (goFile, len(errors)))
+            for err_ in errors:
+                print('    [%s]: %s (line: %s)' % (err_['type'], err_['msg'], err_['lineno']))
+                byType[err_['type']] = byType.get(err_['type'], 0) + 1
+        elif status == 'crash':
+            print('%s: compiler crashed' % goFile)
+            print('    ' + errors[0].strip().split('\n')[-1])
+    if len(byType) > 0:
+        print('errors by type:')
+        for type_ in sorted(byType, key=lambda type_: -byType[type_]):
+            print('    %s: %d' % (type_, byType[type_]))
+    print('%d files: %d ok, %d with errors, %d crashed' % (len(results), counts['ok'], counts['error'], counts['crash']))
+    print('%.2fs on %d processes, %.1f files/sec' % (elapsed, jobs, len(results) / max(elapsed, 1e-9)))
+    return counts['ok'] == len(results)
+
+
+def main():
+    argParser = argparse.ArgumentParser(description='Compiles Go files in parallel')
+    argParser.add_argument('inputs', nargs='+', help='.go files and directories with .go files')
+    argParser.add_argument('--outdir', dest='outdir', help='Location of the output files', default='out')
+    argParser.add_argument('--until', dest='until', help='stop after the 3AC/CSV or go on to the assembly [3ac/asm]', default='asm')
+    argParser.add_argument('--jobs', dest='jobs', help='number of worker processes', default=os.cpu_count())
+    argParser.add_argument('--dot', dest='dot', help='write the control flow graph of every file [t/F]', default='f')
+    addArguments(argParser, singleFile=False)
+    result = argParser.parse_args()
+    assert(result.until in ['3ac', 'asm'])
+
+    files = goFiles(result.inputs)
+    if len(files) == 0:
+        print('no .go files found')
+        sys.exit(1)
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(goFile)) for goFile in files])
+    jobs = []
+    for goFile in files:
+        name = os.path.relpath(os.path.abspath(goFile), base)[:-len('.go')]
+        jobs.append((goFile, os.path.join(result.outdir, name)))
+
+    numJobs = max(1, min(int(result.jobs), len(jobs)))
+    start = time.perf_counter()
+    with multiprocessing.Pool(numJobs, initWorker, (result,)) as pool:
+        results = pool.map(compileFile, jobs, chunksize=1)
+    elapsed = time.perf_counter() - start
+
+    if not report(results, elapsed, numJobs):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
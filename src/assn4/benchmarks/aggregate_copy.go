@@ -0,0 +1,42 @@
+// Copies a 1000 element array and a small struct in a loop. Arguments are
+// never popped by the caller, so the array is passed by value only once.
+package main;
+
+type point struct {
+    x int;
+    y int;
+    z int;
+};
+
+func fill(n int) [1000]int {
+    var arr [1000]int;
+    for i := 0; i < 1000; i++ {
+        arr[i] = i * n;
+    };
+    return arr;
+};
+
+func last(a [1000]int) int {
+    x := a[999];
+    return x;
+};
+
+func shift(p type point) type point {
+    p.x = p.x + 1;
+    return p;
+};
+
+func main(){
+    var a [1000]int;
+    var b [1000]int;
+    var p type point;
+    var q type point;
+    a = fill(3);
+    for i := 0; i < 20000; i++ {
+        b = a;
+        a = b;
+        q = shift(p);
+        p = q;
+    };
+    print last(b), p.x;
+};
@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Runtime of aggregate copies (assignment, parameters, return values) for
+# different --unroll thresholds of codeGen.py: 0 copies everything with
+# rep movsd, a large value unrolls every copy.
+# Run from src/assn4:  ./benchmarks/aggregate_copy.sh [file.go ...]
+
+array=("$@")
+if [ ${#array[@]} -eq 0 ]; then
+    array=(benchmarks/aggregate_copy.go wtest/function_param.go)
+fi
+
+TIMEFORMAT=%R
+for goFile in "${array[@]}"
+do
+    echo ""
+    echo "==================================="
+    echo $goFile
+    python3 parser.py --input=$goFile --csv="symTab.csv" --code="3AC.code" --pickle=t > /dev/null
+
+    for unroll in 0 8 100000
+    do
+        python3 codeGen.py --unroll=$unroll
+        insns=$(sed -n '/^section .text/,$p' assembly.asm | grep -c '^    ')
+
+        nasm -f elf32 "assembly.asm" -o "assembly.o"
+        gcc -m32 "assembly.o" -o "a.out"
+        runtime=$( { time ./a.out > /dev/null; } 2>&1 )
+
+        echo "unroll=$unroll: instructions=$insns runtime=${runtime}s"
+    done
+done
+
+rm -f "symTab.csv" "3AC.code" "assembly.o" "a.out" "rootNode.p" "helper.p"
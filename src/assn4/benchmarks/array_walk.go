@@ -0,0 +1,20 @@
+// Sequential walks over arrays: fill, sum and reversed copy
+package main;
+
+func main(){
+    var a [1000]int;
+    var b [1000]int;
+    for i := 0; i < 1000; i++ {
+        a[i] = i * 3;
+    };
+    sum := 0;
+    for k := 0; k < 100; k++ {
+        for i := 0; i < 1000; i++ {
+            sum = sum + a[i];
+        };
+    };
+    for i := 999; i >= 0; i-- {
+        b[999 - i] = a[i];
+    };
+    print sum, b[0], b[999];
+};
@@ -0,0 +1,103 @@
+'''
+Micro benchmark for CodeGenerator.genCode: builds a synthetic 3AC stream
+for a single function and reports the code generation cost per instruction.
+The second figure stubs out every emitter, leaving only the dispatch in
+genCode and the loop in addFunc.
+Run from src/assn4:  python3 benchmarks/dispatch.py [instructions] [runs]
+'''
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structures import Helper, Node
+from codeGen import CodeGenerator
+
+BINOPS = ['+int', '-int', '*int', '/int', '==int', '!=int', '<int', '>int',
+          '<=int', '>=int', '||', '&&']
+
+
+def synthetic(numInstr, numVars=64, seed=335):
+    rand = random.Random(seed)
+    helper = Helper()
+    helper.newScope()
+    helper.newScope(0)
+    helper.symbolTables[1].updateMetadata('name', 'func')
+    helper.makeSymTabFunc('main')
+    names = [helper.newVar('int') for _ in range(numVars)]
+    helper.symbolTables[0].functions['main1'] = 1
+
+    rootNode = Node('rootNode')
+    rootNode.code.append(['main1::'])
+    rootNode.scopeInfo.append([''])
+    labels = 0
+    for idx in range(numInstr):
+        kind = rand.random()
+        a, b, c = rand.choice(names), rand.choice(names), rand.choice(names)
+        if kind < 0.55:
+            rootNode.code.append([rand.choice(BINOPS), a, b, c])
+            rootNode.scopeInfo.append(['', 1, 1, 1])
+        elif kind < 0.70:
+            rootNode.code.append(['=', a, b])
+            rootNode.scopeInfo.append(['', 1, 1])
+        elif kind < 0.75:
+            rootNode.code.append(['=', a, rand.randint(0, 100)])
+            rootNode.scopeInfo.append(['', 1, 'int_literal'])
+        elif kind < 0.82:
+            rootNode.code.append([rand.choice(['++', '--']), a, a])
+            rootNode.scopeInfo.append(['', 1, 1])
+        elif kind < 0.88:
+            rootNode.code.append(['if', a, '==', 'False', 'goto', 'label' + str(labels)])
+            rootNode.scopeInfo.append(['', 1, '', '', '', ''])
+        elif kind < 0.92:
+            rootNode.code.append(['label' + str(labels)])
+            rootNode.scopeInfo.append([''])
+            labels += 1
+        elif kind < 0.96:
+            rootNode.code.append(['print_int', a])
+            rootNode.scopeInfo.append(['', 1])
+        else:
+            rootNode.code.append(['&int', a, b])
+            rootNode.scopeInfo.append(['', 1, 1])
+    rootNode.code.append(['label' + str(labels)])
+    rootNode.scopeInfo.append([''])
+    return helper, rootNode
+
+
+EMITTERS = ['add_op', 'sub_op', 'mul_op', 'div_op', 'relops_cmp', 'logical',
+            'assign_op', 'inc_dec', 'if_op', 'print_int', 'ampersand_op']
+
+
+def stubEmitters(codeGen):
+    for name in EMITTERS:
+        setattr(codeGen, name, lambda instr, scopeInfo, funcScope: ['nop'])
+    if hasattr(codeGen, 'initDispatch'):
+        # the table holds bound methods, rebuild it with the stubs
+        codeGen.initDispatch()
+
+
+def measure(numInstr, runs, stub):
+    best = None
+    for run in range(runs):
+        helper, rootNode = synthetic(numInstr)
+        codeGen = CodeGenerator(helper, rootNode)
+        if stub:
+            stubEmitters(codeGen)
+        start = time.perf_counter()
+        codeGen.getCode()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best * 1e6 / numInstr
+
+
+if __name__ == '__main__':
+    numInstr = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print('instructions: %d, best of %d runs' % (numInstr, runs))
+    print('full codegen:  %.2f us per instruction' % measure(numInstr, runs, False))
+    print('dispatch only: %.2f us per instruction' % measure(numInstr, runs, True))
@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Compares the x87 and sse float code of codeGen.py: static instruction
+# count, fpu/xmm instructions and runtime of the generated binaries.
+# Run from src/assn4:  ./benchmarks/float.sh [file.go ...]
+
+array=("$@")
+if [ ${#array[@]} -eq 0 ]; then
+    array=(benchmarks/float_math.go benchmarks/float_loop.go)
+fi
+
+TIMEFORMAT=%R
+for goFile in "${array[@]}"
+do
+    echo ""
+    echo "==================================="
+    echo $goFile
+    python3 parser.py --input=$goFile --csv="symTab.csv" --code="3AC.code" --pickle=t > /dev/null
+
+    for mode in x87 sse
+    do
+        python3 codeGen.py --float=$mode
+        insns=$(sed -n '/^section .text/,$p' assembly.asm | grep -c '^    ')
+        floatops=$(grep -cE '^    (f[a-z]+|[a-z]+ss|cvtss2sd|movsd) ' assembly.asm)
+
+        nasm -f elf32 "assembly.asm" -o "assembly.o"
+        gcc -m32 "assembly.o" -o "a.out"
+        runtime=$( { time ./a.out > /dev/null; } 2>&1 )
+
+        echo "$mode: instructions=$insns float_instructions=$floatops runtime=${runtime}s"
+    done
+done
+
+rm -f "symTab.csv" "3AC.code" "assembly.o" "a.out" "rootNode.p" "helper.p"
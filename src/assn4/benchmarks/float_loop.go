@@ -0,0 +1,18 @@
+// Loops whose conditions compare floats, run through the x87 compare path
+package main;
+
+func main(){
+    count := 0;
+    for x := 0.0; x < 1000.0; x = x + 0.25 {
+        count = count + 1;
+    };
+
+    y := 1.0;
+    for i := 0; i < 100; i++ {
+        if y >= 2.0 {
+            y = y - 1.0;
+        };
+        y = y * 1.5;
+    };
+    print count;
+};
@@ -0,0 +1,16 @@
+// Float arithmetic in a loop: a polynomial, a division and a negation per step
+package main;
+
+func main(){
+    x := 0.0;
+    s := 0.0;
+    for i := 0; i < 20000; i++ {
+        y := x * x * 0.5 - x / 3.0 + 1.25;
+        if y > 2.0 {
+            y = -y;
+        };
+        s = s + y;
+        x = x + 0.001;
+    };
+    print s, x;
+};
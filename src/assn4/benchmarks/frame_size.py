@@ -0,0 +1,76 @@
+'''
+Stress test for the frame sizes: a struct with many fields and functions
+with many locals spread over nested blocks. Prints the time spent parsing
+(which sizes every scope when it ends) and generating code (which sizes
+every frame), and the frame size of each function as a check.
+Run from src/assn4:  python3 benchmarks/frame_size.py [runs] [fields] [locals]
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+import codeGen
+from parser import Compiler
+
+FUNCTIONS = 10
+DEPTH = 5
+
+
+def program(fields, locals_):
+    lines = ['package main;', '', 'type big struct {']
+    lines += ['    f%d int;' % field for field in range(fields)]
+    lines += ['};', '']
+    for func in range(FUNCTIONS):
+        lines += ['func work%d(a int, b int) int {' % func, '    var s type big;', '    sum := a + b;']
+        for level in range(DEPTH):
+            indent = '    ' * (level + 1)
+            for local in range(locals_ // DEPTH):
+                lines.append(indent + 'x%d_%d := sum + %d;' % (level, local, local))
+                lines.append(indent + 'sum = sum + x%d_%d + s.f%d;' % (level, local, local % fields))
+            lines.append(indent + 'if sum > 0 {')
+        for level in range(DEPTH, 0, -1):
+            lines.append('    ' * level + '};')
+        lines += ['    return sum;', '};', '']
+    lines += ['func main() {', '    print work0(1, 2);', '};']
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    fields = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    locals_ = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    data = program(fields, locals_)
+    compiler = Compiler()
+    argParser = argparse.ArgumentParser()
+    codeGen.addArguments(argParser)
+    options = argParser.parse_args([])
+
+    parseTime = None
+    genTime = None
+    for run in range(runs):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            helper, rootNode = compiler.compile(data)
+        parsed = time.perf_counter()
+        sizes = [helper.getWidth(scope) + helper.getLargest(scope) for scope in sorted(helper.getFuncScopes())]
+        codeGen.generate(helper, rootNode, options)
+        generated = time.perf_counter()
+        if parseTime is None or parsed - start < parseTime:
+            parseTime = parsed - start
+        if genTime is None or generated - parsed < genTime:
+            genTime = generated - parsed
+
+    print('%d fields, %d functions with %d locals, %d lines' % (fields, FUNCTIONS, locals_, data.count('\n')))
+    print('frame sizes: ' + ' '.join(str(size) for size in sizes))
+    print('best of %d runs: parse %.1f ms, codegen %.1f ms' % (runs, parseTime * 1000, genTime * 1000))
+
+
+if __name__ == '__main__':
+    main()
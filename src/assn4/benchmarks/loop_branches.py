@@ -0,0 +1,69 @@
+'''
+Counts the branches of every loop in the 3AC with and without JumpThreader.
+A loop is found from a back edge of the control flow graph, the count is the
+number of 'goto' and 'if' instructions in its blocks, ie. the branches taken
+per iteration for a loop without control flow in its body. The inner loop of
+a nest is counted as part of the outer one.
+Run from src/assn4:  python3 benchmarks/loop_branches.py [file.go ...]
+'''
+
+import os
+import pickle as pkl
+import sys
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cfg import ControlFlowGraph, functionRanges
+from constFold import ConstantFolder
+from jumpThread import JumpThreader
+from profile_codegen import parse
+
+
+def loopBranches(code):
+    result = []
+    for name, start, end in functionRanges(code):
+        graph = ControlFlowGraph(code, start + 1, end)
+        # back edges of the same header form one loop
+        loops = {}
+        for header, blocks in graph.naturalLoops():
+            loops.setdefault(header.start, set()).update(blocks)
+        for headerStart in sorted(loops):
+            branches = 0
+            for index in loops[headerStart]:
+                block = graph.blocks[index]
+                for instr in code[block.start:block.end]:
+                    if instr[0] in ['goto', 'if']:
+                        branches += 1
+            result.append((name, branches))
+    return result
+
+
+def measure(goFile):
+    parsed = parse(goFile)
+    if parsed is None:
+        print('%s: parser.py failed, skipped' % goFile)
+        return
+    blob = pkl.dumps(parsed)
+
+    counts = []
+    for jumps in [False, True]:
+        helper, rootNode = pkl.loads(blob)
+        ConstantFolder(helper, rootNode).run()
+        if jumps:
+            JumpThreader(helper, rootNode).run()
+        counts.append(loopBranches(rootNode.code))
+
+    print('==================================')
+    print(goFile)
+    for before, after in zip(counts[0], counts[1]):
+        print('%-12s branches per iteration: %d -> %d' % (before[0], before[1], after[1]))
+
+
+if __name__ == '__main__':
+    goFiles = sys.argv[1:]
+    if len(goFiles) == 0:
+        goFiles = ['benchmarks/loops.go', 'benchmarks/loop_sum.go', 'wtest/bubble_sort.go']
+    for goFile in goFiles:
+        measure(goFile)
@@ -0,0 +1,91 @@
+'''
+Instructions per iteration of the innermost loops in the generated x86,
+with one optimization turned off and on:
+  fuse    relational operators fused into conditional jumps
+  reduce  induction variable strength reduction with scaled addressing
+A loop is a backward jump to a label with no other label in between, its
+size is the number of instructions from the label to the jump.
+Run from src/assn4:  python3 benchmarks/loop_insns.py [--compare=reduce] [file.go ...]
+'''
+
+import os
+import pickle as pkl
+import sys
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from codeGen import CodeGenerator
+from constFold import ConstantFolder
+from deadCode import DeadCodeEliminator
+from jumpThread import JumpThreader
+from strengthReduce import StrengthReducer
+from profile_codegen import parse
+
+
+def compile(blob, backend, compare, enabled):
+    # the pipeline of codeGen.py with its default options
+    helper, rootNode = pkl.loads(blob)
+    ConstantFolder(helper, rootNode).run()
+    JumpThreader(helper, rootNode).run()
+    if compare != 'reduce' or enabled:
+        StrengthReducer(helper, rootNode).run()
+    DeadCodeEliminator(helper, rootNode).run()
+    codeGen = CodeGenerator(helper, rootNode, backend)
+    if compare == 'fuse':
+        codeGen.fuseBranches = enabled
+    else:
+        codeGen.scaleIndexes = enabled
+    codeGen.getCode()
+    codeGen.peephole()
+    return codeGen.asmCode
+
+
+def innerLoops(asmCode):
+    loops = []
+    labels = {}
+    for idx, line in enumerate(asmCode):
+        if line[-1:] == ':':
+            labels[line[:-1]] = idx
+            continue
+        parts = line.split(' ')
+        if parts[0][:1] == 'j' and len(parts) == 2 and parts[1] in labels:
+            start = labels[parts[1]]
+            if all(asmCode[pos][-1:] != ':' for pos in range(start + 1, idx)):
+                loops.append((parts[1], idx - start))
+    return loops
+
+
+def measure(goFile, compare):
+    parsed = parse(goFile)
+    if parsed is None:
+        print('%s: parser.py failed, skipped' % goFile)
+        return
+    blob = pkl.dumps(parsed)
+
+    print('==================================')
+    print(goFile + ': ' + compare + ' off -> on')
+    for backend in ['stack', 'regalloc']:
+        # labels differ between the runs, loops are matched by position
+        before = innerLoops(compile(blob, backend, compare, False))
+        after = innerLoops(compile(blob, backend, compare, True))
+        for loop, (old, new) in enumerate(zip(before, after)):
+            print('%-8s loop %d: %d -> %d instructions per iteration' % (backend, loop, old[1], new[1]))
+
+
+if __name__ == '__main__':
+    compare = 'fuse'
+    goFiles = []
+    for arg in sys.argv[1:]:
+        if arg[:10] == '--compare=':
+            compare = arg[10:]
+        else:
+            goFiles.append(arg)
+    if len(goFiles) == 0 and compare == 'reduce':
+        goFiles = ['benchmarks/array_walk.go', 'wtest/bubble_sort.go', 'wtest/mat_mul.go']
+    elif len(goFiles) == 0:
+        goFiles = ['benchmarks/loop_sum.go', 'benchmarks/loops.go', 'benchmarks/float_loop.go',
+                   'wtest/bubble_sort.go']
+    for goFile in goFiles:
+        measure(goFile, compare)
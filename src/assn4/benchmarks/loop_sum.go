@@ -0,0 +1,11 @@
+// Tight integer loop, every value fits in a register
+package main;
+
+func main(){
+    sum := 0;
+    for i := 0; i < 100000000; i++ {
+        x := i * 3;
+        sum = sum + x - i;
+    };
+    print sum;
+};
@@ -0,0 +1,24 @@
+// Loop shapes the parser generates: a counted loop, a nested loop and an if
+// without else inside a loop
+package main;
+
+func main(){
+    sum := 0;
+    for i := 0; i < 1000; i++ {
+        sum = sum + i;
+    };
+
+    for i := 0; i < 30; i++ {
+        for j := 0; j < 30; j++ {
+            sum = sum + i * j;
+        };
+    };
+
+    big := 0;
+    for i := 0; i < 1000; i++ {
+        if i > 300 {
+            big = big + 1;
+        };
+    };
+    print sum, big;
+};
@@ -0,0 +1,56 @@
+'''
+Parse time of generated programs with deeply nested blocks: every level
+declares a variable, and the innermost block reads the variables of all
+levels, so each identifier is resolved through the whole scope stack.
+Run from src/assn4:  python3 benchmarks/nested_scopes.py [runs] [depth ...]
+'''
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+from parser import Compiler
+
+
+def program(depth, statements=20):
+    lines = ['package main;', '', 'func main() {', '    sum := 0;']
+    for level in range(depth):
+        lines.append('    ' * (level + 1) + 'v%d := %d;' % (level, level))
+        lines.append('    ' * (level + 1) + 'if v%d >= 0 {' % level)
+    indent = '    ' * (depth + 1)
+    for statement in range(statements):
+        for level in range(0, depth, 4):
+            lines.append(indent + 'sum = sum + v%d;' % level)
+    for level in range(depth, 0, -1):
+        lines.append('    ' * level + '};')
+    lines += ['    print sum;', '};']
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    depths = [int(arg) for arg in sys.argv[2:]] or [10, 50, 100, 200]
+    compiler = Compiler()
+    print('best of ' + str(runs) + ' runs (ms)')
+    print('%6s %8s %8s' % ('depth', 'lines', 'parse'))
+    for depth in depths:
+        data = program(depth)
+        best = None
+        for run in range(runs):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                parsed = compiler.compile(data)
+            elapsed = time.perf_counter() - start
+            assert(parsed is not None)
+            if best is None or elapsed < best:
+                best = elapsed
+        print('%6d %8d %8.1f' % (depth, data.count('\n'), best * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+'''
+Parse time of large generated programs, where the 3AC of the statements
+is joined as the blocks nest: 'flat' is one function with many
+statements, 'loops' many functions with loops nested a few levels deep
+and 'deep' a single chain of nested loops.
+Run from src/assn4:  python3 benchmarks/parse_time.py [runs] [size]
+'''
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+from parser import Compiler
+
+
+def loopNest(depth, body, indent=1):
+    lines = []
+    for level in range(depth):
+        lines.append('    ' * (indent + level) + 'for i%d := 0; i%d < 3; i%d++ {' % (level, level, level))
+    for statement in body:
+        lines.append('    ' * (indent + depth) + statement)
+    for level in range(depth - 1, -1, -1):
+        lines.append('    ' * (indent + level) + '};')
+    return lines
+
+
+def funcName(idx):
+    # digits would clash with the name + scope labels of the functions
+    return 'work' + ''.join(chr(ord('a') + int(digit)) for digit in str(idx))
+
+
+def flat(size):
+    lines = ['package main;', '', 'func main() {', '    sum := 0;']
+    lines += ['    sum = sum + %d * sum;' % idx for idx in range(size)]
+    lines += ['    print sum;', '};']
+    return lines
+
+
+def loops(size):
+    lines = ['package main;', '']
+    for func in range(size // 20):
+        lines += ['func %s(n int) int {' % funcName(func), '    sum := n;']
+        lines += loopNest(4, ['sum = sum + i0 * i1 + i2 - i3;'] * 5)
+        lines += ['    return sum;', '};', '']
+    lines += ['func main() {', '    print %s(1);' % funcName(0), '};']
+    return lines
+
+
+def deep(size):
+    lines = ['package main;', '', 'func main() {', '    sum := 0;']
+    lines += loopNest(size // 10, ['sum = sum + 1;'])
+    lines += ['    print sum;', '};']
+    return lines
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    compiler = Compiler()
+    print('best of ' + str(runs) + ' runs (ms)')
+    print('%-6s %8s %8s %8s' % ('shape', 'lines', '3AC', 'parse'))
+    for shape in [flat, loops, deep]:
+        data = '\n'.join(shape(size)) + '\n'
+        best = None
+        for run in range(runs):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                helper, rootNode = compiler.compile(data)
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        print('%-6s %8d %8d %8.1f' % (shape.__name__, data.count('\n'), len(rootNode.code), best * 1000))
+
+
+if __name__ == '__main__':
+    main()
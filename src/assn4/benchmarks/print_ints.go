@@ -0,0 +1,8 @@
+// Prints a million integers, four per print statement
+package main;
+
+func main(){
+    for i := 0; i < 250000; i++ {
+        print i, i*2, i*3, -i;
+    };
+};
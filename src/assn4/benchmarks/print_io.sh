@@ -0,0 +1,36 @@
+#!/bin/bash
+
+# Compares the printf and buffered I/O of codeGen.py: static instruction
+# count, library calls and runtime of the generated binaries.
+# Run from src/assn4:  ./benchmarks/print_io.sh [file.go ...]
+
+array=("$@")
+if [ ${#array[@]} -eq 0 ]; then
+    array=(benchmarks/print_ints.go)
+fi
+
+gcc -m32 -O2 -c runtime.c -o runtime.o
+
+TIMEFORMAT=%R
+for goFile in "${array[@]}"
+do
+    echo ""
+    echo "==================================="
+    echo $goFile
+    python3 parser.py --input=$goFile --csv="symTab.csv" --code="3AC.code" --pickle=t > /dev/null
+
+    for io in printf buffered
+    do
+        python3 codeGen.py --io=$io
+        insns=$(sed -n '/^section .text/,$p' assembly.asm | grep -c '^    ')
+        calls=$(grep -c '^    call \(printf\|puts\|scanf\|rt_\)' assembly.asm)
+
+        nasm -f elf32 "assembly.asm" -o "assembly.o"
+        gcc -m32 "assembly.o" runtime.o -o "a.out"
+        runtime=$( { time ./a.out > /dev/null; } 2>&1 )
+
+        echo "$io: instructions=$insns io_calls=$calls runtime=${runtime}s"
+    done
+done
+
+rm -f "symTab.csv" "3AC.code" "assembly.o" "runtime.o" "a.out" "rootNode.p" "helper.p"
@@ -0,0 +1,89 @@
+'''
+Profiles CodeGenerator.getCode on real programs. Every input is parsed by
+one parser.Compiler and code generation is profiled with cProfile.
+Run from src/assn4:  python3 benchmarks/profile_codegen.py [file.go ...]
+Without arguments the three largest programs in tests/ that compile are used.
+'''
+
+import contextlib
+import cProfile
+import os
+import pickle as pkl
+import pstats
+import sys
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+from codeGen import CodeGenerator
+from parser import Compiler
+
+compiler = None
+
+
+def largestTests():
+    testDir = os.path.join(srcDir, 'tests')
+    files = [os.path.join(testDir, f) for f in os.listdir(testDir) if f.endswith('.go')]
+    files.sort(key=lambda f: os.path.getsize(f), reverse=True)
+    return files
+
+
+def parse(goFile):
+    # returns (helper, rootNode) or None, error messages are dropped
+    global compiler
+    if compiler is None:
+        compiler = Compiler()
+    with open(os.devnull, 'w') as devNull, contextlib.redirect_stdout(devNull):
+        try:
+            return compiler.compile(open(goFile).read())
+        except Exception:
+            # some errors still crash the grammar actions
+            return None
+
+
+def profile(goFile, runs=20):
+    parsed = parse(goFile)
+    if parsed is None:
+        print('%s: parser.py failed, skipped' % goFile)
+        return False
+    blob = pkl.dumps(parsed)
+
+    # emitters mutate the 3AC, so every run gets a fresh copy
+    best = None
+    for run in range(runs):
+        helper, rootNode = pkl.loads(blob)
+        codeGen = CodeGenerator(helper, rootNode)
+        start = time.perf_counter()
+        codeGen.getCode()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    profiler = cProfile.Profile()
+    for run in range(runs):
+        helper, rootNode = pkl.loads(blob)
+        codeGen = CodeGenerator(helper, rootNode)
+        profiler.enable()
+        codeGen.getCode()
+        profiler.disable()
+
+    print('==================================')
+    print('%s: %d 3AC instructions, best of %d runs %.3f ms'
+          % (goFile, len(rootNode.code), runs, best * 1e3))
+    stats = pstats.Stats(profiler)
+    stats.sort_stats('tottime').print_stats(12)
+    return True
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        for goFile in sys.argv[1:]:
+            profile(goFile)
+    else:
+        done = 0
+        for goFile in largestTests():
+            if done == 3:
+                break
+            if profile(goFile):
+                done += 1
@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Compares the stack and regalloc backends of codeGen.py: static instruction
+# count, ebp relative memory operands and runtime of the generated binaries.
+# Run from src/assn4:  ./benchmarks/regalloc.sh [file.go ...]
+
+array=("$@")
+if [ ${#array[@]} -eq 0 ]; then
+    array=(benchmarks/loop_sum.go ../../tests/input3/fibonacci.go)
+fi
+
+TIMEFORMAT=%R
+for goFile in "${array[@]}"
+do
+    echo ""
+    echo "==================================="
+    echo $goFile
+    python3 parser.py --input=$goFile --csv="symTab.csv" --code="3AC.code" --pickle=t > /dev/null
+
+    for backend in stack regalloc
+    do
+        python3 codeGen.py --backend=$backend
+        insns=$(sed -n '/^section .text/,$p' assembly.asm | grep -c '^    ')
+        memops=$(grep -c '\[ebp' assembly.asm)
+
+        nasm -f elf32 "assembly.asm" -o "assembly.o"
+        gcc -m32 "assembly.o" -o "a.out"
+        runtime=$( { time ./a.out > /dev/null; } 2>&1 )
+
+        echo "$backend: instructions=$insns memory_operands=$memops runtime=${runtime}s"
+    done
+done
+
+rm -f "symTab.csv" "3AC.code" "assembly.o" "a.out" "rootNode.p" "helper.p"
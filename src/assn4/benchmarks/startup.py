@@ -0,0 +1,81 @@
+'''
+Compiler startup cost: building the PLY lexer and parser with cold tables
+(generated into an empty directory, as on the first run after a grammar
+change) and warm tables (read from plytables/), next to the time spent
+compiling a program. Every run is a fresh process, except for 'reused'
+where one parser.Compiler compiles the program again and again.
+Run from src/assn4:  python3 benchmarks/startup.py [runs] [file.go]
+'''
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+import codeGen
+from parser import Compiler
+
+# prints the seconds spent importing parser.py, building the lexer/parser
+# and compiling the program
+RUN = r'''
+import sys, time
+start = time.perf_counter()
+import parser as goParser
+import codeGen
+imported = time.perf_counter()
+if sys.argv[1] == 'cold':
+    compiler = goParser.Compiler(sys.argv[3])
+else:
+    compiler = goParser.Compiler()
+built = time.perf_counter()
+helper, rootNode = compiler.compile(open(sys.argv[2]).read())
+argParser = codeGen.argparse.ArgumentParser()
+codeGen.addArguments(argParser)
+codeGen.generate(helper, rootNode, argParser.parse_args([]))
+compiled = time.perf_counter()
+print('%f %f %f' % (imported - start, built - imported, compiled - built))
+'''
+
+
+def measure(mode, goFile):
+    with tempfile.TemporaryDirectory() as tableDir:
+        out = subprocess.run([sys.executable, '-c', RUN, mode, os.path.abspath(goFile), tableDir],
+                             cwd=srcDir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             universal_newlines=True).stdout
+    return [float(x) for x in out.split()]
+
+
+def reuse(goFile, runs):
+    compiler = Compiler()
+    argParser = codeGen.argparse.ArgumentParser()
+    codeGen.addArguments(argParser)
+    options = argParser.parse_args([])
+    data = open(goFile).read()
+    best = None
+    for run in range(runs):
+        start = time.perf_counter()
+        helper, rootNode = compiler.compile(data)
+        codeGen.generate(helper, rootNode, options)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    goFile = sys.argv[2] if len(sys.argv) > 2 else os.path.join(srcDir, 'wtest', 'quicksort.go')
+    print(goFile + ', best of ' + str(runs) + ' runs (ms)')
+    print('%-6s %8s %8s %8s' % ('tables', 'import', 'build', 'compile'))
+    for mode in ['cold', 'warm']:
+        best = [min(times) for times in zip(*[measure(mode, goFile) for run in range(runs)])]
+        print('%-6s %8.1f %8.1f %8.1f' % (mode, best[0] * 1000, best[1] * 1000, best[2] * 1000))
+    print('%-6s %8s %8s %8.1f' % ('reused', '-', '-', reuse(goFile, runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
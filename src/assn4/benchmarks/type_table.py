@@ -0,0 +1,60 @@
+'''
+Size of the type table the parser leaves in Helper.type, the pickled
+helper.p and the CSV symbol tables, for the given programs and for a
+generated one that indexes, dereferences and selects fields in many
+statements.
+Run from src/assn4:  python3 benchmarks/type_table.py [statements] [file.go ...]
+'''
+
+import contextlib
+import io
+import os
+import pickle
+import sys
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, srcDir)
+
+from parser import Compiler, generateCSV
+
+
+def program(statements):
+    lines = ['package main;', '',
+             'type point struct {', '    x int;', '    y int;', '};', '',
+             'func main() {',
+             '    var points [100](type point);',
+             '    var grid [10][10]int;',
+             '    var p *(type point);',
+             '    sum := 0;',
+             '    p = &points[0];']
+    for idx in range(statements):
+        lines.append('    sum = sum + points[%d].x + grid[%d][%d] + (*p).y;' % (idx % 100, idx % 10, idx % 7))
+    lines += ['    print sum;', '};']
+    return '\n'.join(lines) + '\n'
+
+
+def measure(compiler, name, data):
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed = compiler.compile(data)
+    if parsed is None:
+        print('%-34s compilation errors' % name)
+        return
+    helper, rootNode = parsed
+    csv_file = io.StringIO()
+    generateCSV(csv_file, helper)
+    print('%-34s %8d %10d %10d' % (name, len(helper.type), len(pickle.dumps(helper)), len(csv_file.getvalue())))
+
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    goFiles = sys.argv[2:] or [os.path.join(srcDir, 'wtest', 'quicksort.go'), os.path.join(srcDir, 'tests', 'graph_as_adjacency_list.go')]
+    compiler = Compiler()
+    print('%-34s %8s %10s %10s' % ('program', 'types', 'helper.p', 'csv'))
+    for goFile in goFiles:
+        data = open(goFile).read()
+        measure(compiler, os.path.relpath(goFile, srcDir), data)
+    measure(compiler, 'generated, %d statements' % statements, program(statements))
+
+
+if __name__ == '__main__':
+    main()
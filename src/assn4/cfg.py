@@ -0,0 +1,266 @@
+def isMarker(instr):
+    # 'name::' starts a function, see CodeGenerator.addFunc
+    return len(instr) == 1 and instr[0][-2:] == '::'
+
+
+def isLabel(instr):
+    # a bare return is the only 1-element instruction that is not a label
+    return len(instr) == 1 and instr[0] != 'return'
+
+
+def functionRanges(code):
+    r'''
+    yields (name, start, end) for every function in the 3AC:
+    code[start] is the 'name::' marker and code[start+1:end] the body
+    '''
+    start = 0
+    while start < len(code):
+        end = start + 1
+        while end < len(code) and not isMarker(code[end]):
+            end += 1
+        yield code[start][0].split(':')[0], start, end
+        start = end
+
+
+class BasicBlock:
+    def __init__(self, index, start):
+        self.index = index
+        # instructions code[start:end]
+        self.start = start
+        self.end = start
+        self.label = None
+        self.succ = []
+        self.pred = []
+        # immediate dominator (a BasicBlock), None for the entry and unreachable blocks
+        self.idom = None
+        self.reachable = False
+
+    def name(self):
+        if self.label is not None:
+            return self.label
+        return 'B' + str(self.index)
+
+
+class ControlFlowGraph:
+    r'''
+    Basic blocks of the 3AC in code[start:end] (usually one function body)
+    with successor/predecessor edges and dominators.
+    Labels are 1-element lists other than ['return'] (see isLabel), jumps
+    are ['goto', L] and ['if', x, '==', 'False', 'goto', L]; 'return' and
+    ['return', x] leave the function.
+    '''
+    def __init__(self, code, start, end):
+        self.code = code
+        self.start = start
+        self.end = end
+        self.blocks = []
+        # instruction index -> block
+        self.blockOf = {}
+        self.labels = {}
+        self.build()
+        self.computeDominators()
+
+    def build(self):
+        block = None
+        for idx in range(self.start, self.end):
+            instr = self.code[idx]
+            if block is None or isLabel(instr):
+                # a label starts a block, so does anything after a jump
+                block = BasicBlock(len(self.blocks), idx)
+                self.blocks.append(block)
+                if isLabel(instr):
+                    block.label = instr[0]
+                    self.labels[instr[0]] = block
+            block.end = idx + 1
+            self.blockOf[idx] = block
+            if instr[0] in ['goto', 'if', 'return']:
+                block = None
+
+        for pos, block in enumerate(self.blocks):
+            last = self.code[block.end - 1]
+            targets = []
+            if last[0] == 'goto':
+                targets.append(last[1])
+            elif last[0] == 'if':
+                targets.append(last[5])
+            if last[0] not in ['goto', 'return'] and pos + 1 < len(self.blocks):
+                self.addEdge(block, self.blocks[pos + 1])
+            for label in targets:
+                if label in self.labels:
+                    self.addEdge(block, self.labels[label])
+
+    def addEdge(self, src, dst):
+        if dst not in src.succ:
+            src.succ.append(dst)
+            dst.pred.append(src)
+
+    def reversePostorder(self):
+        # iterative DFS from the entry block, only reachable blocks
+        if len(self.blocks) == 0:
+            return []
+        order = []
+        seen = set([0])
+        stack = [(self.blocks[0], 0)]
+        while len(stack) > 0:
+            block, pos = stack.pop()
+            if pos < len(block.succ):
+                stack.append((block, pos + 1))
+                succ = block.succ[pos]
+                if succ.index not in seen:
+                    seen.add(succ.index)
+                    stack.append((succ, 0))
+            else:
+                order.append(block)
+        order.reverse()
+        return order
+
+    def computeDominators(self):
+        r'''
+        Cooper, Harvey, Kennedy: "A Simple, Fast Dominance Algorithm".
+        Iterates over the reverse postorder, which converges in a couple of
+        passes for the reducible graphs the parser produces.
+        '''
+        order = self.reversePostorder()
+        if len(order) == 0:
+            return
+        rpo = {}
+        for pos, block in enumerate(order):
+            rpo[block.index] = pos
+            block.reachable = True
+        entry = order[0]
+        idom = {entry.index: entry}
+
+        def intersect(a, b):
+            while a is not b:
+                while rpo[a.index] > rpo[b.index]:
+                    a = idom[a.index]
+                while rpo[b.index] > rpo[a.index]:
+                    b = idom[b.index]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for block in order[1:]:
+                new = None
+                for pred in block.pred:
+                    if pred.index in idom:
+                        new = pred if new is None else intersect(pred, new)
+                if idom.get(block.index) is not new:
+                    idom[block.index] = new
+                    changed = True
+
+        for block in order[1:]:
+            block.idom = idom[block.index]
+
+    def dominates(self, a, b):
+        # True if every path from the entry to b goes through a
+        while b is not None:
+            if b is a:
+                return True
+            b = b.idom
+        return False
+
+    def naturalLoops(self):
+        r'''
+        returns a list of (header, blocks) for every back edge latch -> header,
+        blocks being the set of indices of blocks in the loop. A header with
+        several back edges (eg. 'continue') appears once per edge.
+        '''
+        loops = []
+        for latch in self.blocks:
+            for header in latch.succ:
+                if not self.dominates(header, latch):
+                    continue
+                blocks = set([header.index])
+                stack = [latch]
+                while len(stack) > 0:
+                    block = stack.pop()
+                    if block.index in blocks:
+                        continue
+                    blocks.add(block.index)
+                    stack += block.pred
+                loops.append((header, blocks))
+        return loops
+
+    def depth(self, block):
+        # number of strict dominators of block
+        depth = 0
+        while block.idom is not None:
+            block = block.idom
+            depth += 1
+        return depth
+
+    def liveness(self, defUse):
+        r'''
+        defUse: instruction index -> (defs, uses)
+        returns liveIn, liveOut: instruction index -> set of live variables
+        '''
+        gen = {}
+        kill = {}
+        for block in self.blocks:
+            gen_ = set()
+            kill_ = set()
+            for idx in range(block.end - 1, block.start - 1, -1):
+                defs, uses = defUse[idx]
+                gen_ -= set(defs)
+                kill_ |= set(defs)
+                gen_ |= set(uses)
+            gen[block.index] = gen_
+            kill[block.index] = kill_
+
+        blockIn = {block.index: set() for block in self.blocks}
+        blockOut = {block.index: set() for block in self.blocks}
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(self.blocks):
+                out = set()
+                for succ in block.succ:
+                    out |= blockIn[succ.index]
+                in_ = (out - kill[block.index]) | gen[block.index]
+                if in_ != blockIn[block.index] or out != blockOut[block.index]:
+                    blockIn[block.index] = in_
+                    blockOut[block.index] = out
+                    changed = True
+
+        liveIn = {}
+        liveOut = {}
+        for block in self.blocks:
+            live = set(blockOut[block.index])
+            for idx in range(block.end - 1, block.start - 1, -1):
+                liveOut[idx] = live
+                defs, uses = defUse[idx]
+                live = (live - set(defs)) | set(uses)
+                liveIn[idx] = live
+        return liveIn, liveOut
+
+    def dot(self, name):
+        r'''
+        returns the graph as a list of lines of a DOT subgraph
+        '''
+        lines = ['subgraph "cluster_' + name + '" {', '    label="' + name + '";']
+        for block in self.blocks:
+            text = []
+            for idx in range(block.start, block.end):
+                text.append(' '.join(str(x) for x in self.code[idx]).replace('"', '\\"'))
+            node = '"' + name + '.' + block.name() + '"'
+            style = '' if block.reachable else ', style=dashed'
+            lines.append('    ' + node + ' [shape=box, label="' + '\\l'.join(text) + '\\l"' + style + '];')
+            for succ in block.succ:
+                lines.append('    ' + node + ' -> "' + name + '.' + succ.name() + '";')
+            if block.idom is not None:
+                lines.append('    ' + node + ' -> "' + name + '.' + block.idom.name() + '" [style=dotted, color=gray];')
+        lines.append('}')
+        return lines
+
+
+def dotFile(code, path):
+    # writes the CFG of every function in the 3AC to path
+    lines = ['digraph cfg {', 'node [fontname="monospace"];']
+    for name, start, end in functionRanges(code):
+        lines += ControlFlowGraph(code, start + 1, end).dot(name)
+    lines.append('}')
+    outfile = open(path, 'w')
+    outfile.write('\n'.join(lines) + '\n')
+    outfile.close()
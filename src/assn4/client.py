@@ -0,0 +1,63 @@
+r'''
+Compiles a Go file on a running server.py. Takes the --input/--csv/--code
+options of parser.py and --output for the assembly; every other option is
+passed to the server's code generator, as for driver.py:
+    python3 client.py --input=file.go --csv=a.csv --code=a.code [--output=assembly.asm] [codeGen.py options]
+Only the standard library is imported here, the compiler stays loaded in
+the server.
+'''
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+SOCKET = os.path.join(tempfile.gettempdir(), 'gocompile-%d.sock' % os.getuid())
+
+
+def request(path, message):
+    # sends one request to the server at path, returns its response
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(path)
+    connection.sendall(json.dumps(message).encode('utf-8'))
+    connection.shutdown(socket.SHUT_WR)
+    chunks = []
+    while True:
+        chunk = connection.recv(1 << 16)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    connection.close()
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def main():
+    argParser = argparse.ArgumentParser(description='Compiles a Go file on server.py')
+    argParser.add_argument('--input', dest='in_file_location', help='Location of the input .go file', required=True)
+    argParser.add_argument('--csv', dest='csv_file_location', help='Location of the output .csv file for symbol tables', default=None)
+    argParser.add_argument('--code', dest='code_file_location', help='Location of the output .code file for 3AC', default=None)
+    argParser.add_argument('--output', dest='output', help='Location of the output assembly file, none for no assembly', default=None)
+    argParser.add_argument('--socket', dest='socket', help='path of the server.py socket', default=SOCKET)
+    result, args = argParser.parse_known_args()
+
+    in_file = open(result.in_file_location, 'r')
+    data = in_file.read()
+    in_file.close()
+
+    response = request(result.socket, {'source': data, 'asm': result.output is not None, 'args': args})
+    sys.stdout.write(response['log'])
+    if response['status'] != 'ok':
+        sys.exit(1)
+
+    outputs = [(result.csv_file_location, 'csv'), (result.code_file_location, 'code'), (result.output, 'asm')]
+    for path, key in outputs:
+        if path is not None:
+            out_file = open(path, 'w')
+            out_file.write(response[key])
+            out_file.close()
+
+
+if __name__ == '__main__':
+    main()
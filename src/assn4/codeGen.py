@@ -2,22 +2,119 @@ import pickle as pkl
 import random
 import string
 import struct
+import re
 from data_structures import Helper, Node
+from regAlloc import RegisterAllocator
+from peephole import PeepholeOptimizer
+from constFold import ConstantFolder
+from deadCode import DeadCodeEliminator
+from jumpThread import JumpThreader
+from strengthReduce import StrengthReducer
+from cfg import isMarker, dotFile
+import argparse
 
 def binary(num):
     return ''.join('{:0>8b}'.format(c) for c in struct.pack('!f', num))
 
 asmCode = []
 
+# lowered together into one rt_print call with --io=buffered
+PRINT_OPS = ['print_int', 'print_float', 'print_string']
+
+# characters kept inside quotes of a db string
+PRINTABLE = set(chr(c) for c in range(0x20, 0x7f)) - set('"')
+
+# condition code of each relational operator. fcomip compares src2 against
+# src1 and sets CF/ZF like an unsigned compare, hence below/above for floats
+INT_CC = {'==': 'e', '!=': 'ne', '<': 'l', '>': 'g', '<=': 'le', '>=': 'ge'}
+FLOAT_CC = {'==': 'e', '!=': 'ne', '<': 'a', '>': 'b', '<=': 'ae', '>=': 'be'}
+# ucomiss compares src1 against src2, again like an unsigned compare
+SSE_CC = {'==': 'e', '!=': 'ne', '<': 'b', '>': 'a', '<=': 'be', '>=': 'ae'}
+NEGATE_CC = {'e': 'ne', 'ne': 'e', 'l': 'ge', 'ge': 'l', 'g': 'le', 'le': 'g',
+             'a': 'be', 'be': 'a', 'b': 'ae', 'ae': 'b'}
+
+# element sizes x86 addressing can scale an index by
+SCALES = {1: 0, 2: 1, 4: 2, 8: 3}
+
+# aggregates of at most this many dwords are copied with unrolled moves,
+# bigger ones with rep movsd
+UNROLL_WORDS = 8
+
+class FrameLayout:
+    r'''
+    Stack frame of one function, built once when addFunc starts.
+    Maps (scope, ident) of every variable declared in the function (or its
+    nested scopes) to (ebp displacement, size, type), so the emitters never
+    walk the symbol tables per operand.
+    '''
+    def __init__(self, helper, funcScope, scopes):
+        self.helper = helper
+        self.funcScope = funcScope
+        self.paramSize = helper.getParamWidth(funcScope)
+        # everything except the parameters, which the caller pushed
+        metadata = helper.symbolTables[funcScope].metadata
+        if 'frame_size' in metadata:
+            # compacted by DeadCodeEliminator
+            self.frameSize = metadata['frame_size']
+        else:
+            self.frameSize = helper.getWidth(funcScope) - self.paramSize + helper.getLargest(funcScope)
+        self.slots = {}
+        for scope in scopes:
+            for ident, info in helper.symbolTables[scope].table.items():
+                self.slots[(scope, ident)] = self.resolve(info)
+
+    def resolve(self, info):
+        offset = 0
+        if 'is_arg' in info:
+            if 'parent' not in info:
+                offset = 8 + self.paramSize - info['size'] - info['offset']
+            else:
+                offset = 8 + self.paramSize - info['offset']
+        else:
+            if 'parent' in info:
+                offset = info['offset']
+            else:
+                offset = -(info['offset'] + info['size'] - self.paramSize)
+        if offset >= 0:
+            offset = '+'+str(offset)
+        else:
+            offset = str(offset)
+        return (offset, info.get('size'), info['type'])
+
+    def slot(self, ident, scope):
+        slot_ = self.slots.get((scope, ident))
+        if slot_ is None:
+            # declared outside the function (eg. global scope)
+            slot_ = self.resolve(self.helper.symbolTables[scope].table[ident])
+            self.slots[(scope, ident)] = slot_
+        return slot_
+
+    def offset(self, ident, scope):
+        return self.slot(ident, scope)[0]
+
+    def size(self, ident, scope):
+        return self.slot(ident, scope)[1]
+
+    def type(self, ident, scope):
+        return self.slot(ident, scope)[2]
+
 class CodeGenerator:
-    def __init__(self, helper, rootNode):
+    def __init__(self, helper, rootNode, backend='stack', floatMode='x87', io='printf'):
         self.asmCode = []
         self.asmCode.append('global main')
         self.asmCode.append('extern printf')
         self.asmCode.append('extern scanf')
         self.asmCode.append('extern malloc')
+        self.asmCode.append('extern puts')
+        # 'printf' calls libc for every value, 'buffered' calls the runtime
+        # in runtime.c, which has to be linked in
+        assert(io in ['printf', 'buffered'])
+        self.io = io
+        if io == 'buffered':
+            self.asmCode.append('extern rt_print')
+            self.asmCode.append('extern rt_scan_int')
+            self.asmCode.append('extern rt_scan_string')
         # self.asmCode.append('extern gets')
-        # self.asmCode.append('extern puts')
         # self.asmCode.append('extern farray_print')
         self.asmCode.append('section .data')
         self.asmCode.append('temp dq 0')
@@ -25,7 +122,10 @@ class CodeGenerator:
         self.asmCode.append('farray_print db "%f ", 0x0a, 0x00')
         self.asmCode.append('print_line db "", 0x0a, 0x00')
         self.asmCode.append('scan_int db "%d", 0')
-        self.dataIndex = 6
+        # pooled literals are inserted here by getCode
+        self.dataIndex = len(self.asmCode)
+        # ('float', bits) or ('string', text) -> label in the data section
+        self.literals = {}
         self.codeIndex = 0
         self.asmCode.append('section .text')
         self.helper = helper
@@ -35,26 +135,134 @@ class CodeGenerator:
         self.relops = ['==int', '!=int', '<=int', '>=int', '>int', '<int']
         self.frelops = ['==float', '!=float', '<=float', '>=float', '>float', '<float']
 
-    def ebpOffset(self, ident, identScope, funcScope):
-        paramSize = helper.getParamWidth(funcScope)
+        # 'stack' keeps every variable in its frame slot, 'regalloc' runs
+        # linear scan over each function and keeps hot scalars in registers
+        assert(backend in ['stack', 'regalloc'])
+        self.backend = backend
+        # 'x87' computes floats on the fpu stack, 'sse' with scalar xmm
+        # instructions
+        assert(floatMode in ['x87', 'sse'])
+        self.floatMode = floatMode
+        self.unrollWords = UNROLL_WORDS
+        # relational operators emitted together with the following 'if'
+        self.fuseBranches = True
+        self.fused = set()
+        # 'idx * size' multiplies folded into the addressing of the next instruction
+        self.scaleIndexes = True
+        self.scaled = set()
+        self.live = None
+        self.allocator = RegisterAllocator(helper, self.code, self.scopeInfo)
+        self.regMap = {}
+        self.frame = None
+        self.scopeGroups = None
+        # (scope, ident) of every temporary holding an address
+        self.references = set()
+        for scope, symTab in enumerate(self.helper.symbolTables):
+            for ident, info in symTab.table.items():
+                if 'reference' in info:
+                    self.references.add((scope, ident))
+        # per instruction reference flags of the operands, filled by addFunc
+        self.operands = [None] * len(self.code)
+        self.flags = None
+        self.initDispatch()
 
-        offset = 0
-        if 'is_arg' in self.helper.symbolTables[identScope].table[ident]:
-            if 'parent' not in self.helper.symbolTables[identScope].table[ident]:
-                offset = 8 + paramSize - self.helper.symbolTables[identScope].table[ident]['size'] - self.helper.symbolTables[identScope].table[ident]['offset']
-            else:
-                offset = 8 + paramSize - self.helper.symbolTables[identScope].table[ident]['offset']
-
-        else:
-            if 'parent' in self.helper.symbolTables[identScope].table[ident]:
-                # parent = self.helper.symbolTables[identScope].table[ident]['parent']
-                # parentScope = self.helper.symbolTables[identScope].table[ident]['parentScope']
-                offset = self.helper.symbolTables[identScope].table[ident]['offset']
-            else:
-                offset = -(self.helper.symbolTables[identScope].table[ident]['offset'] + self.helper.symbolTables[identScope].table[ident]['size'] - paramSize)
-        if offset >= 0:
-            return '+'+str(offset)
-        return str(offset)
+    def ebpOffset(self, ident, identScope, funcScope):
+        if self.frame is None or self.frame.funcScope != funcScope:
+            self.frame = self.frameLayout(funcScope)
+        return self.frame.offset(ident, identScope)
+
+    def frameLayout(self, funcScope):
+        if self.scopeGroups is None:
+            self.scopeGroups = self.helper.getFuncScopes()
+        return FrameLayout(self.helper, funcScope, self.scopeGroups.get(funcScope, [funcScope]))
+
+    def location(self, ident, identScope, funcScope):
+        # register given by the allocator, otherwise the stack slot
+        reg = self.regMap.get((identScope, ident))
+        if reg is not None:
+            return reg
+        return '[ebp' + self.ebpOffset(ident, identScope, funcScope) + ']'
+
+    def funcEnd(self, start):
+        # index of the next function marker (or end of code)
+        end = start
+        while end < len(self.code):
+            if isMarker(self.code[end]):
+                break
+            end += 1
+        return end
+
+    def liveOut(self, start, end):
+        # variables live after every instruction of code[start:end], once per function
+        if self.live is None or self.live[0] != start:
+            defUse = {idx: self.allocator.defUse(self.code[idx], self.scopeInfo[idx]) for idx in range(start, end)}
+            self.live = (start, self.allocator.liveness(start, end, defUse)[1])
+        return self.live[1]
+
+    def fusedRelops(self, start, end):
+        r'''
+        indices of relational operators in code[start:end] that are directly
+        followed by an 'if' on their result and whose result is dead after it
+        '''
+        pairs = []
+        for idx in range(start, end - 1):
+            instr = self.code[idx]
+            branch = self.code[idx + 1]
+            if instr[0] not in self.relops and instr[0] not in self.frelops:
+                continue
+            if branch[0] != 'if' or branch[1] != instr[1] or self.scopeInfo[idx + 1][1] != self.scopeInfo[idx][1]:
+                continue
+            if self.operands[idx][1] == 0 and self.operands[idx + 1][1] == 0:
+                pairs.append(idx)
+        if len(pairs) == 0:
+            return set()
+
+        liveOut = self.liveOut(start, end)
+        return set(idx for idx in pairs if (self.scopeInfo[idx][1], self.code[idx][1]) not in liveOut[idx + 1])
+
+    def scaledIndexes(self, start, end):
+        r'''
+        indices of 'idx * size' multiplies in code[start:end] that only feed
+        the array address computation after them, with size 1, 2, 4 or 8.
+        Both are emitted as a single lea with a scaled index.
+        '''
+        pairs = []
+        for idx in range(start, end - 1):
+            instr = self.code[idx]
+            add = self.code[idx + 1]
+            if instr[0] != '*int' or len(instr) != 4 or self.scopeInfo[idx][3] != 'literal':
+                continue
+            if instr[3] not in SCALES or not isinstance(self.scopeInfo[idx][2], int):
+                continue
+            if add[0] != '+int' or len(add) != 4 or add[3] != instr[1] or self.scopeInfo[idx + 1][3] != self.scopeInfo[idx][1]:
+                continue
+            if self.operands[idx][1] == 0 and self.allocator.isAggregateAdd(add, self.scopeInfo[idx + 1]):
+                if self.helper.getBaseType(self.frame.type(add[2], self.scopeInfo[idx + 1][2]))[0] == 'array':
+                    pairs.append(idx)
+        if len(pairs) == 0:
+            return set()
+
+        liveOut = self.liveOut(start, end)
+        return set(idx for idx in pairs if (self.scopeInfo[idx][1], self.code[idx][1]) not in liveOut[idx + 1])
+
+    def fusedDefUse(self, start, end):
+        r'''
+        defs and uses of the instructions emitted together with their
+        neighbour, for the register allocator
+        '''
+        overrides = {}
+        for idx in self.fused:
+            # the result of the compare is never stored
+            overrides[idx] = ([], self.allocator.defUse(self.code[idx], self.scopeInfo[idx])[1])
+            overrides[idx + 1] = ([], [])
+        for idx in self.scaled:
+            # the index is read by the lea, the product is never stored
+            product = (self.scopeInfo[idx][1], self.code[idx][1])
+            defs, uses = self.allocator.defUse(self.code[idx + 1], self.scopeInfo[idx + 1])
+            uses = [key for key in uses if key != product]
+            overrides[idx] = ([], [])
+            overrides[idx + 1] = (defs, uses + self.allocator.defUse(self.code[idx], self.scopeInfo[idx])[1])
+        return overrides
 
     def addFunc(self,name):
         funcScope = self.helper.symbolTables[0].functions[name]
@@ -65,10 +273,24 @@ class CodeGenerator:
         # standard prologue
         self.add_prologue()
 
+        # resolve every variable's ebp displacement once for the whole function
+        self.frame = self.frameLayout(funcScope)
+
         # update stack pointer to store all the varaibles(except parameters) in current sym table
-        self.asmCode.append('sub esp, '+str(helper.getWidth(funcScope) - helper.getParamWidth(funcScope) + helper.getLargest(funcScope)))
+        self.asmCode.append('sub esp, '+str(self.frame.frameSize))
 
         self.codeIndex += 1
+        end = self.funcEnd(self.codeIndex)
+        for idx in range(self.codeIndex, end):
+            if len(self.code[idx]) > 1 and self.code[idx][0] != 'goto':
+                self.operands[idx] = self.setFlags(self.code[idx], self.scopeInfo[idx])
+        self.live = None
+        self.fused = self.fusedRelops(self.codeIndex, end) if self.fuseBranches else set()
+        self.scaled = self.scaledIndexes(self.codeIndex, end) if self.scaleIndexes else set()
+        if self.backend == 'regalloc':
+            self.regMap = self.allocator.allocate(self.codeIndex, end, self.fusedDefUse(self.codeIndex, end))
+        else:
+            self.regMap = {}
         while True:
             if self.codeIndex >= len(self.code):
                 break
@@ -92,6 +314,18 @@ class CodeGenerator:
         self.add_epilogue()
 
 
+    def blockCopy(self, size):
+        # copies size bytes from [esi] to [edi], clobbers ecx, edx, esi and edi
+        words = int(size / 4)
+        if words > self.unrollWords:
+            return ['mov ecx, ' + str(words), 'rep movsd']
+        code_ = []
+        for idx in range(words):
+            disp = '+' + str(4 * idx) if idx > 0 else ''
+            code_.append('mov edx, [esi' + disp + ']')
+            code_.append('mov [edi' + disp + '], edx')
+        return code_
+
     def add_prologue(self):
         self.asmCode.append('push ebp')
         self.asmCode.append('mov ebp, esp')
@@ -104,39 +338,34 @@ class CodeGenerator:
     def unary_minus(self, instr, scopeInfo, funcScope):
         dst = instr[1]
         src1 = instr[2]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
         code.append('mov esi, 0')
         code.append('sub esi, edi')
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], edi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], esi')
+            code.append('mov ' + dstLoc + ', esi')
         return code
 
     def unary_fminus(self, instr, scopeInfo, funcScope):
         dst = instr[1]
         src1 = instr[2]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
         src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
 
-        binaryCode = binary(float(0.0))
-
         code = []
-        code.append('mov edi, 0b' + str(binaryCode))
-        code.append('mov [ebp' + str(dstOffset) + '], edi')
-
-        code.append('fld dword [ebp' + str(dstOffset) + ']')
+        code.append('fldz')
         # if flag[2] == 1:
         #     code.append('mov edi, [edi]')
         # code.append('mov esi, 0')
@@ -151,13 +380,11 @@ class CodeGenerator:
         return code
 
     def setFlags(self, instr, scopeInfo):
-        flag = [0 for x in instr]
-        for i in range(1,len(instr)):
-            try:
-                if 'reference' in self.helper.symbolTables[scopeInfo[i]].get(instr[i]):
+        flag = [0] * len(instr)
+        if self.references:
+            for i in range(1, min(len(instr), len(scopeInfo))):
+                if (scopeInfo[i], instr[i]) in self.references:
                     flag[i] = 1
-            except:
-                pass
         return flag
 
     def add_op(self, instr, scopeInfo, funcScope):
@@ -165,14 +392,12 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
-
-        info_src1 = self.helper.symbolTables[scopeInfo[2]].get(src1)
+        flag = self.flags
 
-        baseType = helper.getBaseType(info_src1['type'])
+        baseType = self.helper.getBaseType(self.frame.type(src1, scopeInfo[2]))
         if baseType[0] == 'struct':
             objOffset = self.ebpOffset(src1, scopeInfo[2], funcScope)
-            dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
+            dstLoc = self.location(dst, scopeInfo[1], funcScope)
             code_ = []
             if flag[2] == 1:
                 code_.append('mov edx, [ebp'+str(objOffset)+']')
@@ -189,19 +414,21 @@ class CodeGenerator:
             else:
                 code_.append('mov esi, ebp')
             code_.append('add esi, edx')
-            code_.append('mov [ebp' + str(dstOffset) + '], esi')
+            code_.append('mov ' + dstLoc + ', esi')
             return code_
+        elif baseType[0] == 'array' and self.codeIndex - 1 in self.scaled:
+            return self.scaled_add(instr, scopeInfo, funcScope)
         elif baseType[0] == 'array':
             objOffset = self.ebpOffset(src1, scopeInfo[2], funcScope)
-            dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-            src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+            dstLoc = self.location(dst, scopeInfo[1], funcScope)
+            src2Loc = self.location(src2, scopeInfo[3], funcScope)
             code_ = []
             if flag[2] == 1:
                 code_.append('mov edx, [ebp'+str(objOffset)+']')
                 # dont add ebp
             else:
                 code_.append('mov edx, '+str(objOffset))
-            code_.append('mov esi, [ebp'+str(src2Offset)+']')
+            code_.append('mov esi, ' + src2Loc)
             if flag[3] == 1:
                 code_.append('mov esi, [esi]')
             code_.append('add edx, esi')
@@ -211,21 +438,21 @@ class CodeGenerator:
             else:
                 code_.append('mov esi, ebp')
             code_.append('add esi, edx')
-            code_.append('mov [ebp' + str(dstOffset) + '], esi')
+            code_.append('mov ' + dstLoc + ', esi')
             return code_
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
         if isinstance(scopeInfo[3], int):
-            src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+            src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
 
         if isinstance(scopeInfo[3], int):
-            code.append('mov esi, [ebp' + str(src2Offset) + ']')
+            code.append('mov esi, ' + src2Loc)
             if flag[3] == 1:
                 code.append('mov esi, [esi]')
         else:
@@ -234,12 +461,32 @@ class CodeGenerator:
         code.append('add edi, esi')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], edi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
+            code.append('mov ' + dstLoc + ', edi')
         return code
 
+    def scaled_add(self, instr, scopeInfo, funcScope):
+        # dst = &array[idx], for 'mul idx, size' just before
+        mul = self.code[self.codeIndex - 1]
+        mulScope = self.scopeInfo[self.codeIndex - 1]
+        flag = self.flags
+        objOffset = self.ebpOffset(instr[2], scopeInfo[2], funcScope)
+        dstLoc = self.location(instr[1], scopeInfo[1], funcScope)
+
+        code_ = ['mov edi, ' + self.location(mul[2], mulScope[2], funcScope)]
+        if self.operands[self.codeIndex - 1][2] == 1:
+            code_.append('mov edi, [edi]')
+        index = 'edi' if mul[3] == 1 else 'edi*' + str(mul[3])
+        if flag[2] == 1:
+            code_.append('mov edx, [ebp'+str(objOffset)+']')
+            code_.append('lea esi, [edx+' + index + ']')
+        else:
+            code_.append('lea esi, [ebp+' + index + objOffset + ']')
+        code_.append('mov ' + dstLoc + ', esi')
+        return code_
+
     def fadd_op(self, instr, scopeInfo, funcScope):
 
         dst = instr[1]
@@ -257,15 +504,7 @@ class CodeGenerator:
         if isinstance(scopeInfo[3], int):
             code.append('fadd dword [ebp' + str(src2Offset) + ']')
         else:
-            binaryCode = binary(float(src2))
-
-            code.append('mov edi, 0b' + str(binaryCode))
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
-
-            # rand_str = ''.join(random.choice(string.ascii_lowercase) for _ in range(4))
-            # self.asmCode.insert(8, str(rand_str) + ': dq ' + str(src2))
-            # self.dataIndex += 1
-            code.append('fadd dword [ebp' + str(dstOffset) + ']')
+            code.append('fadd dword ' + self.floatLiteral(src2))
         # code.append('faddp')
         code.append('fstp dword [ebp' + str(dstOffset) + ']')
         return code
@@ -275,20 +514,20 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
         if isinstance(scopeInfo[3], int):
-            src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+            src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
 
         if isinstance(scopeInfo[3], int):
-            code.append('mov esi, [ebp' + str(src2Offset) + ']')
+            code.append('mov esi, ' + src2Loc)
             if flag[3] == 1:
                 code.append('mov esi, [esi]')
         else:
@@ -296,10 +535,10 @@ class CodeGenerator:
         code.append('sub edi, esi')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], edi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
+            code.append('mov ' + dstLoc + ', edi')
         return code
 
     def fsub_op(self, instr, scopeInfo, funcScope):
@@ -319,15 +558,7 @@ class CodeGenerator:
         if isinstance(scopeInfo[3], int):
             code.append('fsub dword [ebp' + str(src2Offset) + ']')
         else:
-            binaryCode = binary(float(src2))
-
-            code.append('mov edi, 0b' + str(binaryCode))
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
-
-            # rand_str = ''.join(random.choice(string.ascii_lowercase) for _ in range(4))
-            # self.asmCode.insert(8, str(rand_str) + ': dq ' + str(src2))
-            # self.dataIndex += 1
-            code.append('fsub dword [ebp+' + str(dstOffset) + ']')
+            code.append('fsub dword ' + self.floatLiteral(src2))
         # code.append('fsubp')
         code.append('fstp dword [ebp' + str(dstOffset) + ']')
         return code
@@ -336,31 +567,39 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
+        if self.codeIndex in self.scaled:
+            # emitted by scaled_add
+            return ['none']
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
         if isinstance(scopeInfo[3], int):
-            src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+            src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
 
         if isinstance(scopeInfo[3], int):
-            code.append('mov esi, [ebp' + str(src2Offset) + ']')
+            code.append('mov esi, ' + src2Loc)
             if flag[3] == 1:
                 code.append('mov esi, [esi]')
+            code.append('imul edi, esi')
+        elif type(src2) == int and src2 > 0 and src2 & (src2 - 1) == 0:
+            # power of two, element sizes of arrays mostly
+            if src2 > 1:
+                code.append('shl edi, ' + str(src2.bit_length() - 1))
         else:
             code.append('mov esi, ' + str(src2))
-        code.append('imul edi, esi')
+            code.append('imul edi, esi')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], edi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
+            code.append('mov ' + dstLoc + ', edi')
         return code
 
     def fmul_op(self, instr, scopeInfo, funcScope):
@@ -378,15 +617,7 @@ class CodeGenerator:
         if isinstance(scopeInfo[3], int):
             code.append('fmul dword [ebp' + str(src2Offset) + ']')
         else:
-            binaryCode = binary(float(src2))
-
-            code.append('mov edi, 0b' + str(binaryCode))
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
-
-            # rand_str = ''.join(random.choice(string.ascii_lowercase) for _ in range(4))
-            # self.asmCode.insert(8, str(rand_str) + ': dq ' + str(src2))
-            # self.dataIndex += 1
-            code.append('fmul dword [ebp' + str(dstOffset) + ']')
+            code.append('fmul dword ' + self.floatLiteral(src2))
         # code.append('fmulp st1, st0')
         code.append('fstp dword [ebp' + str(dstOffset) + ']')
         return code
@@ -395,27 +626,27 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
         if isinstance(scopeInfo[3], int):
-            src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+            src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
         code.append('xor edx, edx')
-        code.append('mov eax, [ebp' + str(src1Offset) + ']')
+        code.append('mov eax, ' + src1Loc)
         if isinstance(scopeInfo[3], int):
-            code.append('mov ebx, [ebp' + str(src2Offset) + ']')
+            code.append('mov ebx, ' + src2Loc)
         else:
             code.append('mov ebx, ' + str(src2))
         code.append('idiv ebx')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], eax')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], eax')
+            code.append('mov ' + dstLoc + ', eax')
         return code
 
     def fdiv_op(self, instr, scopeInfo, funcScope):
@@ -433,15 +664,7 @@ class CodeGenerator:
         if isinstance(scopeInfo[3], int):
             code.append('fdiv dword [ebp' + str(src2Offset) + ']')
         else:
-            binaryCode = binary(float(src2))
-
-            code.append('mov edi, 0b' + str(binaryCode))
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
-
-            # rand_str = ''.join(random.choice(string.ascii_lowercase) for _ in range(4))
-            # self.asmCode.insert(8, str(rand_str) + ': dq ' + str(src2))
-            # self.dataIndex += 1
-            code.append('fdiv dword [ebp' + str(dstOffset) + ']')
+            code.append('fdiv dword ' + self.floatLiteral(src2))
         # code.append('fmulp st1, st0')
         code.append('fstp dword [ebp' + str(dstOffset) + ']')
         return code
@@ -451,7 +674,7 @@ class CodeGenerator:
         src = instr[2]
         code = []
         instr[1] = dst
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
         srcOffset = self.ebpOffset(src, scopeInfo[2], funcScope)
@@ -470,36 +693,27 @@ class CodeGenerator:
         dst = instr[1]
         src = instr[2]
         code = []
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         if dst[0] == '*':
             return self.pointer_assign(instr, scopeInfo, funcScope)
 
-        data_ = helper.symbolTables[scopeInfo[1]].get(instr[1])
-        baseType = helper.getBaseType(data_['type'])
+        baseType = self.helper.getBaseType(self.frame.type(instr[1], scopeInfo[1]))
 
         if baseType[0] in ['struct', 'array']:
             offset1 = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
             offset2 = self.ebpOffset(instr[2], scopeInfo[2], funcScope)
 
-            self.counter += 1
-            label = 'looping' + str(self.counter)
-            iters = int(data_['size'] / 4)
-            code_ = ['mov esi, ebp', 'mov ebx, ebp']
-            code_.append('add esi, '+offset1)
-            code_.append('add ebx, '+offset2)
+            code_ = []
             if flag[2] == 1:
-                code_.append('mov ebx, [ebp' + offset2 + ']')
+                code_.append('mov esi, [ebp' + offset2 + ']')
+            else:
+                code_.append('lea esi, [ebp' + offset2 + ']')
             if flag[1] == 1:
-                code_.append('mov esi, [ebp' + offset1 + ']')
-            code_.append('mov cx, '+str(iters))
-            code_.append(label + ':')
-            code_.append('mov edx, [ebx]')
-            code_.append('mov [esi], edx')
-            code_.append('add esi, 4')
-            code_.append('add ebx, 4')
-            code_.append('dec cx')
-            code_.append('jnz '+label)
+                code_.append('mov edi, [ebp' + offset1 + ']')
+            else:
+                code_.append('lea edi, [ebp' + offset1 + ']')
+            code_ += self.blockCopy(self.frame.size(instr[1], scopeInfo[1]))
             return code_
 
         if baseType == ['float']:
@@ -523,24 +737,27 @@ class CodeGenerator:
                 code.append('mov [ebp' + dstOffset + '], edi')
         else:
             if isinstance(scopeInfo[2], int):
-                dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-                srcOffset = self.ebpOffset(src, scopeInfo[2], funcScope)
-                code.append('mov edi, [ebp' + srcOffset + ']')
+                dstLoc = self.location(dst, scopeInfo[1], funcScope)
+                srcLoc = self.location(src, scopeInfo[2], funcScope)
+                code.append('mov edi, ' + srcLoc)
                 if flag[2] == 1:
                     code.append('mov edi, [edi]')
                 if flag[1] == 1:
-                    code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+                    code.append('mov esi, ' + dstLoc)
                     code.append('mov [esi], edi')
                 else:
-                    code.append('mov [ebp' + str(dstOffset) + '], edi')
+                    code.append('mov ' + dstLoc + ', edi')
             else:
-                dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
+                dstLoc = self.location(dst, scopeInfo[1], funcScope)
+                if baseType == ['string']:
+                    # the address of the pooled characters
+                    src = self.stringLiteral(src)
                 code.append('mov edi, ' + str(src))
                 if flag[1] == 1:
-                    code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+                    code.append('mov esi, ' + dstLoc)
                     code.append('mov [esi], edi')
                 else:
-                    code.append('mov [ebp' + str(dstOffset) + '], edi')
+                    code.append('mov ' + dstLoc + ', edi')
 
         return code
 
@@ -550,7 +767,7 @@ class CodeGenerator:
         # *t1 += t2
         code = []
         instr[1] = dst
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
         srcOffset = self.ebpOffset(src, scopeInfo[2], funcScope)
@@ -575,33 +792,24 @@ class CodeGenerator:
         return code
 
     def assign_ptr_rhs(self, instr, scopeInfo, funcScope):
-        sz = helper.symbolTables[scopeInfo[1]].get(instr[1])['size']
+        sz = self.frame.size(instr[1], scopeInfo[1])
         dst = instr[1]
         src = instr[2]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         offset1 = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
         offset2 = self.ebpOffset(instr[2], scopeInfo[2], funcScope)
 
-        self.counter += 1
-        label = 'looping' + str(self.counter)
-        iters = int(sz / 4)
-        code_ = ['mov esi, ebp', 'mov ebx, ebp']
-        code_.append('add esi, '+offset1)
-        code_.append('add ebx, [ebp' + offset2 + ']')
+        code_ = ['mov esi, ebp']
+        code_.append('add esi, [ebp' + offset2 + ']')
         if flag[2] == 1:
-            code_.append('mov ebx, [ebp' + offset2 + ']')
-            code_.append('mov ebx, [ebx]')
+            code_.append('mov esi, [ebp' + offset2 + ']')
+            code_.append('mov esi, [esi]')
         if flag[1] == 1:
-            code_.append('mov esi, [ebp' + offset1 + ']')
-        code_.append('mov cx, '+str(iters))
-        code_.append(label + ':')
-        code_.append('mov edx, [ebx]')
-        code_.append('mov [esi], edx')
-        code_.append('add esi, 4')
-        code_.append('add ebx, 4')
-        code_.append('dec cx')
-        code_.append('jnz '+label)
+            code_.append('mov edi, [ebp' + offset1 + ']')
+        else:
+            code_.append('lea edi, [ebp' + offset1 + ']')
+        code_ += self.blockCopy(sz)
         return code_
 
 
@@ -610,6 +818,7 @@ class CodeGenerator:
             return self.assign_op_ptr(instr, scopeInfo, funcScope)
         instr.insert(2,instr[1])
         scopeInfo.insert(2, scopeInfo[1])
+        self.flags.insert(2, self.flags[1])
         return self.add_op(instr, scopeInfo, funcScope)
 
     def sub_assign_op(self, instr, scopeInfo, funcScope):
@@ -617,6 +826,7 @@ class CodeGenerator:
             return self.assign_op_ptr(instr, scopeInfo, funcScope)
         instr.insert(2,instr[1])
         scopeInfo.insert(2, scopeInfo[1])
+        self.flags.insert(2, self.flags[1])
         return self.sub_op(instr, scopeInfo, funcScope)
 
     def mul_assign_op(self, instr, scopeInfo, funcScope):
@@ -624,6 +834,7 @@ class CodeGenerator:
             return self.assign_op_ptr(instr, scopeInfo, funcScope)
         instr.insert(2,instr[1])
         scopeInfo.insert(2, scopeInfo[1])
+        self.flags.insert(2, self.flags[1])
         return self.mul_op(instr, scopeInfo, funcScope)
 
     def div_assign_op(self, instr, scopeInfo, funcScope):
@@ -631,12 +842,13 @@ class CodeGenerator:
             return self.assign_op_ptr(instr, scopeInfo, funcScope)
         instr.insert(2,instr[1])
         scopeInfo.insert(2, scopeInfo[1])
+        self.flags.insert(2, self.flags[1])
         return self.div_op(instr, scopeInfo, funcScope)
 
     def ampersand_op(self, instr, scopeInfo, funcScope):
         dst = instr[1]
         src = instr[2]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
         srcOffset = self.ebpOffset(src, scopeInfo[2], funcScope)
@@ -660,46 +872,50 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
-        src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
+        src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        fused = self.codeIndex in self.fused
+        if fused and flag[2] == 0 and flag[3] == 0 and (src1Loc[0] != '[' or src2Loc[0] != '['):
+            # one of the sources is in a register
+            code.append('cmp ' + src1Loc + ', ' + src2Loc)
+            code.append(self.fusedJump(INT_CC[instr[0][:-3]]))
+            return code
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
-        code.append('mov esi, [ebp' + str(src2Offset) + ']')
+        if fused and flag[3] == 0:
+            # only the following 'if' reads dst, jump on the flags instead
+            code.append('cmp edi, ' + src2Loc)
+            code.append(self.fusedJump(INT_CC[instr[0][:-3]]))
+            return code
+        code.append('mov esi, ' + src2Loc)
         if flag[3] == 1:
             code.append('mov esi, [esi]')
+        if fused:
+            code.append('cmp edi, esi')
+            code.append(self.fusedJump(INT_CC[instr[0][:-3]]))
+            return code
         code.append('xor eax, eax')
         code.append('cmp edi, esi')
-        if instr[0] == '==int':
-            code.append('sete al')
-        elif instr[0] == '!=int':
-            code.append('setne al')
-        elif instr[0] == '<int':
-            code.append('setl al')
-        elif instr[0] == '>int':
-            code.append('setg al')
-        elif instr[0] == '<=int':
-            code.append('setle al')
-        elif instr[0] == '>=int':
-            code.append('setge al')
+        code.append('set' + INT_CC[instr[0][:-3]] + ' al')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], eax')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], eax')
+            code.append('mov ' + dstLoc + ', eax')
         return code
 
     def relops_fcmp(self, instr, scopeInfo, funcScope):
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
         dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
         src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
@@ -712,23 +928,17 @@ class CodeGenerator:
         code.append('fld dword [ebp' + str(src2Offset) + ']')
         # if flag[3] == 1:
         #     code.append('mov esi, [esi]')
+        if self.codeIndex in self.fused:
+            code.append('fcomip')
+            code.append('fstp dword [temp]')
+            code.append(self.fusedJump(FLOAT_CC[instr[0][:-5]]))
+            return code
         code.append('xor eax, eax')
         code.append('fcomip')
         # code.append('sahf')
         code.append('fstp dword [temp]')
         # code.append('mov al, c0')
-        if instr[0] == '==float':
-            code.append('sete al')
-        elif instr[0] == '!=float':
-            code.append('setne al')
-        elif instr[0] == '<float':
-            code.append('setl al')
-        elif instr[0] == '>float':
-            code.append('setg al')
-        elif instr[0] == '<=float':
-            code.append('setle al')
-        elif instr[0] == '>=float':
-            code.append('setge al')
+        code.append('set' + FLOAT_CC[instr[0][:-5]] + ' al')
 
         if flag[1] == 1:
             code.append('mov esi, [ebp'+ str(dstOffset) + ']')
@@ -737,12 +947,19 @@ class CodeGenerator:
             code.append('mov [ebp' + str(dstOffset) + '], eax')
         return code
 
+    def fusedJump(self, cc):
+        # the jump of the 'if' following a fused relational operator
+        branch = self.code[self.codeIndex + 1]
+        if branch[3] == 'False':
+            cc = NEGATE_CC[cc]
+        return 'j' + cc + ' ' + branch[5]
+
     def print_int(self, instr, scopeInfo, funcScope):
         src = instr[1]
-        srcOffset = self.ebpOffset(src, scopeInfo[1], funcScope)
-        flag = self.setFlags(instr, scopeInfo)
+        srcLoc = self.location(src, scopeInfo[1], funcScope)
+        flag = self.flags
         code = []
-        code.append('mov esi, [ebp' + srcOffset + ']')
+        code.append('mov esi, ' + srcLoc)
         if flag[1] == 1:
             code.append('mov esi, [esi]')
         code.append('push esi')
@@ -755,7 +972,7 @@ class CodeGenerator:
     def print_float(self, instr, scopeInfo, funcScope):
         src = instr[1]
         srcOffset = self.ebpOffset(src, scopeInfo[1], funcScope)
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
         code = []
         # code.append('mov esi, [ebp' + srcOffset + ']')
         # if flag[1] == 1:
@@ -769,7 +986,7 @@ class CodeGenerator:
         code.append('fld dword [ebp' + srcOffset + ']')
         code.append('fstp qword [temp]')
         code.append('push dword [temp+4]')
-        code.append('push dword [temp+4]')
+        code.append('push dword [temp]')
         code.append('push dword farray_print')
         code.append('call printf')
         code.append('add esp, 12')
@@ -778,7 +995,7 @@ class CodeGenerator:
 
     def print_string(self, instr, scopeInfo, funcScope):
         src = instr[1]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
         srcOffset = self.ebpOffset(src, scopeInfo[1], funcScope)
         code = []
 
@@ -791,7 +1008,7 @@ class CodeGenerator:
 
     def scan_int(self, instr, scopeInfo, funcScope):
         src = instr[1]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
         srcOffset = self.ebpOffset(src, scopeInfo[1], funcScope)
         code = []
         code.append('lea esi, [ebp' + srcOffset + ']')
@@ -806,7 +1023,7 @@ class CodeGenerator:
 
     def scan_string(self, instr, scopeInfo, funcScope):
         src = instr[1]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
         srcOffset = self.ebpOffset(src, scopeInfo[1], funcScope)
         code = []
 
@@ -822,49 +1039,57 @@ class CodeGenerator:
         return code
 
     def param(self, instr, scopeInfo, funcScope):
-        data_ = helper.symbolTables[scopeInfo[1]].get(instr[1])
-        baseType = helper.getBaseType(data_['type'])
-        flag = self.setFlags(instr, scopeInfo)
+        size_ = self.frame.size(instr[1], scopeInfo[1])
+        baseType = self.helper.getBaseType(self.frame.type(instr[1], scopeInfo[1]))
+        flag = self.flags
         offset = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
         if baseType[0] in ['int', 'bool', 'float', 'string']:
+            loc = self.location(instr[1], scopeInfo[1], funcScope)
             if flag[1] == 1:
                 return [
-                    'mov edx, [ebp' + offset + ']',
+                    'mov edx, ' + loc,
                     'mov edx, [edx]',
                     'push edx',
                 ]
             else:
-                return ['mov edx, [ebp' + offset + ']', 'push edx']
+                return ['mov edx, ' + loc, 'push edx']
         else:
-            self.counter += 1
-            label = 'looping' + str(self.counter)
-            iters = int(data_['size'] / 4)
-            code_ = ['mov esi, ebp']
-            code_.append('add esi, '+offset)
+            # the callee sees the aggregate at the same layout as in memory
+            words = int(size_ / 4)
+            code_ = []
             if flag[1] == 1:
-                code_.append('mov esi, [ebp'+offset+']')
-            code_.append('add esi, ' + str(data_['size'] - 4))
-            code_.append('mov cx, '+str(iters))
-            code_.append(label + ':')
-            code_.append('mov edx, [esi]')
-            code_.append('push edx')
-            code_.append('sub esi, 4')
-            code_.append('dec cx')
-            code_.append('jnz '+label)
+                code_.append('mov esi, [ebp' + offset + ']')
+            else:
+                code_.append('lea esi, [ebp' + offset + ']')
+            if words > self.unrollWords:
+                code_.append('sub esp, ' + str(4 * words))
+                code_.append('mov edi, esp')
+                code_ += self.blockCopy(size_)
+            else:
+                for idx in range(words - 1, -1, -1):
+                    disp = '+' + str(4 * idx) if idx > 0 else ''
+                    code_.append('push dword [esi' + disp + ']')
             return code_
 
     def if_op(self, instr, scopeInfo, funcScope):
         var = instr[1]
         jLabel = instr[5]
         code = []
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
+        if self.codeIndex - 1 in self.fused:
+            # emitted by the relational operator before
+            return ['none']
 
-        varOffset = self.ebpOffset(var, scopeInfo[1], funcScope)
-        code.append('mov edi, [ebp' + varOffset + ']')
+        varLoc = self.location(var, scopeInfo[1], funcScope)
+        code.append('mov edi, ' + varLoc)
         if flag[1] == 1:
             code.append('mov edi, [edi]')
         code.append('cmp edi, 0')
-        code.append('je ' + jLabel)
+        if instr[3] == 'True':
+            # inverted by JumpThreader
+            code.append('jne ' + jLabel)
+        else:
+            code.append('je ' + jLabel)
 
         return code
 
@@ -879,17 +1104,17 @@ class CodeGenerator:
         dst = instr[1]
         src1 = instr[2]
         src2 = instr[3]
-        flag = self.setFlags(instr, scopeInfo)
+        flag = self.flags
 
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        src1Offset = self.ebpOffset(src1, scopeInfo[2], funcScope)
-        src2Offset = self.ebpOffset(src2, scopeInfo[3], funcScope)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        src1Loc = self.location(src1, scopeInfo[2], funcScope)
+        src2Loc = self.location(src2, scopeInfo[3], funcScope)
 
         code = []
-        code.append('mov edi, [ebp' + str(src1Offset) + ']')
+        code.append('mov edi, ' + src1Loc)
         if flag[2] == 1:
             code.append('mov edi, [edi]')
-        code.append('mov esi, [ebp' + str(src2Offset) + ']')
+        code.append('mov esi, ' + src2Loc)
         if flag[3] == 1:
             code.append('mov esi, [esi]')
 
@@ -899,38 +1124,27 @@ class CodeGenerator:
             code.append('and edi, esi')
 
         if flag[1] == 1:
-            code.append('mov esi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov esi, ' + dstLoc)
             code.append('mov [esi], edi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], edi')
+            code.append('mov ' + dstLoc + ', edi')
         return code
 
     def getRetVal(self, instr, scopeInfo, funcScope):
-        data_ = helper.symbolTables[scopeInfo[1]].get(instr[1])
         offset = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
 
-        self.counter += 1
-        label = 'looping' + str(self.counter)
-        iters = int(data_['size'] / 4)
-        code_ = ['mov esi, ebp']
-        code_.append('add esi, '+offset)
-        code_.append('mov cx, '+str(iters))
-        code_.append(label + ':')
-        code_.append('mov edx, [eax]')
-        code_.append('mov [esi], edx')
-        code_.append('add esi, 4')
-        code_.append('add eax, 4')
-        code_.append('dec cx')
-        code_.append('jnz '+label)
+        # eax points at the return value in the callee's frame
+        code_ = ['mov esi, eax', 'lea edi, [ebp' + offset + ']']
+        code_ += self.blockCopy(self.frame.size(instr[1], scopeInfo[1]))
         return code_
 
     def inc_dec(self, instr, scopeInfo, funcScope):
         dst = instr[1]
-        dstOffset = self.ebpOffset(dst, scopeInfo[1], funcScope)
-        flag = self.setFlags(instr, scopeInfo)
+        dstLoc = self.location(dst, scopeInfo[1], funcScope)
+        flag = self.flags
 
         code = []
-        code.append('mov esi, [ebp' + dstOffset + ']')
+        code.append('mov esi, ' + dstLoc)
         if flag[1] == 1:
             code.append('mov esi, [esi]')
         if instr[0] == '++':
@@ -939,95 +1153,283 @@ class CodeGenerator:
             code.append('dec esi')
 
         if flag[1] == 1:
-            code.append('mov edi, [ebp'+ str(dstOffset) + ']')
+            code.append('mov edi, ' + dstLoc)
             code.append('mov [edi], esi')
         else:
-            code.append('mov [ebp' + str(dstOffset) + '], esi')
+            code.append('mov ' + dstLoc + ', esi')
+        return code
+
+    def ptr_add(self, instr, scopeInfo, funcScope):
+        # moves the address held in instr[1] by instr[2] bytes (see StrengthReducer)
+        dstLoc = self.location(instr[1], scopeInfo[1], funcScope)
+        if dstLoc[0] == '[':
+            return ['add dword ' + dstLoc + ', ' + str(instr[2])]
+        return ['add ' + dstLoc + ', ' + str(instr[2])]
+
+    def minus_op(self, instr, scopeInfo, funcScope):
+        # '-int' is binary with two sources, unary otherwise
+        if len(instr) == 4:
+            return self.sub_op(instr, scopeInfo, funcScope)
+        return self.unary_minus(instr, scopeInfo, funcScope)
+
+    def fminus_op(self, instr, scopeInfo, funcScope):
+        if len(instr) == 4:
+            return self.fsub_op(instr, scopeInfo, funcScope)
+        return self.unary_fminus(instr, scopeInfo, funcScope)
+
+    def literal(self, kind, value, prefix):
+        key = (kind, value)
+        if key not in self.literals:
+            self.literals[key] = prefix + '_' + str(len(self.literals))
+        return self.literals[key]
+
+    def floatLiteral(self, value):
+        # memory operand of a float literal, one dd per distinct value
+        bits = struct.unpack('<I', struct.pack('<f', float(value)))[0]
+        return '[' + self.literal('float', bits, 'float') + ']'
+
+    def stringLiteral(self, value):
+        # label of a nul terminated copy of a string literal ("..." with quotes)
+        return self.literal('string', value, 'string')
+
+    def dataLines(self):
+        lines = []
+        for (kind, value), label in self.literals.items():
+            if kind == 'float':
+                lines.append(label + ' dd 0x%08x' % value)
+                continue
+            # printable runs stay quoted, escapes become byte values
+            text = value[1:-1].encode('latin1', 'backslashreplace').decode('unicode_escape')
+            parts = []
+            for run in re.findall(r'[ !#-~]+|[^ !#-~]', text):
+                parts.append('"' + run + '"' if run[0] in PRINTABLE else '0x%02x' % ord(run))
+            lines.append(label + ' db ' + ', '.join(parts + ['0x00']))
+        return lines
+
+    def floatOperand(self, instr, scopeInfo, pos, funcScope, reg):
+        r'''
+        returns (code, memory operand) of a float source or destination,
+        reg holds the address if the operand is a reference
+        '''
+        if not isinstance(scopeInfo[pos], int):
+            return [], self.floatLiteral(instr[pos])
+        offset = self.ebpOffset(instr[pos], scopeInfo[pos], funcScope)
+        if self.flags[pos] == 1:
+            return ['mov ' + reg + ', [ebp' + offset + ']'], '[' + reg + ']'
+        return [], '[ebp' + offset + ']'
+
+    def sse_arith(self, instr, scopeInfo, funcScope):
+        if len(instr) == 3:
+            return self.sse_neg(instr, scopeInfo, funcScope)
+        code1, src1 = self.floatOperand(instr, scopeInfo, 2, funcScope, 'esi')
+        code2, src2 = self.floatOperand(instr, scopeInfo, 3, funcScope, 'edi')
+        codeDst, dst = self.floatOperand(instr, scopeInfo, 1, funcScope, 'esi')
+        op = {'+': 'addss', '-': 'subss', '*': 'mulss', '/': 'divss'}[instr[0][0]]
+        code = code1 + ['movss xmm0, dword ' + src1] + code2
+        code.append(op + ' xmm0, dword ' + src2)
+        return code + codeDst + ['movss dword ' + dst + ', xmm0']
+
+    def sse_neg(self, instr, scopeInfo, funcScope):
+        # flips the sign bit, no need for the fpu or a mask in memory
+        codeSrc, src = self.floatOperand(instr, scopeInfo, 2, funcScope, 'esi')
+        codeDst, dst = self.floatOperand(instr, scopeInfo, 1, funcScope, 'esi')
+        code = codeSrc + ['mov edi, ' + src, 'xor edi, 0x80000000']
+        return code + codeDst + ['mov ' + dst + ', edi']
+
+    def sse_fcmp(self, instr, scopeInfo, funcScope):
+        code1, src1 = self.floatOperand(instr, scopeInfo, 2, funcScope, 'esi')
+        code2, src2 = self.floatOperand(instr, scopeInfo, 3, funcScope, 'edi')
+        code = code1 + ['movss xmm0, dword ' + src1] + code2
+        code.append('ucomiss xmm0, dword ' + src2)
+        cc = SSE_CC[instr[0][:-5]]
+        if self.codeIndex in self.fused:
+            code.append(self.fusedJump(cc))
+            return code
+        code.append('set' + cc + ' al')
+        code.append('movzx edi, al')
+        codeDst, dst = self.floatOperand(instr, scopeInfo, 1, funcScope, 'esi')
+        return code + codeDst + ['mov ' + dst + ', edi']
+
+    def sse_assign(self, instr, scopeInfo, funcScope):
+        if instr[1][0] == '*' or not isinstance(scopeInfo[2], int):
+            return self.assign_op(instr, scopeInfo, funcScope)
+        if self.helper.getBaseType(self.frame.type(instr[1], scopeInfo[1])) != ['float']:
+            return self.assign_op(instr, scopeInfo, funcScope)
+        codeSrc, src = self.floatOperand(instr, scopeInfo, 2, funcScope, 'esi')
+        codeDst, dst = self.floatOperand(instr, scopeInfo, 1, funcScope, 'edi')
+        # a float is copied as 32 bits, no need for the fpu
+        return codeSrc + ['mov esi, ' + src] + codeDst + ['mov ' + dst + ', esi']
+
+    def sse_print_float(self, instr, scopeInfo, funcScope):
+        codeSrc, src = self.floatOperand(instr, scopeInfo, 1, funcScope, 'esi')
+        code = codeSrc + ['cvtss2sd xmm0, dword ' + src]
+        code.append('movsd qword [temp], xmm0')
+        code.append('push dword [temp+4]')
+        code.append('push dword [temp]')
+        code.append('push dword farray_print')
+        code.append('call printf')
+        code.append('add esp, 12')
+        return code
+
+    def printArg(self, idx, funcScope):
+        r'''
+        returns (code, kind, bytes) pushing the value printed by code[idx]
+        as an argument of rt_print
+        '''
+        instr = self.code[idx]
+        scopeInfo = self.scopeInfo[idx]
+        flag = self.operands[idx]
+        if instr[0] == 'print_float':
+            if self.floatMode == 'sse':
+                code, src = self.floatOperand(instr, scopeInfo, 1, funcScope, 'esi')
+                code.append('cvtss2sd xmm0, dword ' + src)
+                return code + ['sub esp, 8', 'movsd qword [esp], xmm0'], 'f', 8
+            offset = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
+            code = ['fld dword [ebp' + offset + ']']
+            if flag[1] == 1:
+                code = ['mov esi, [ebp' + offset + ']', 'fld dword [esi]']
+            # printf and rt_print take doubles
+            return code + ['sub esp, 8', 'fstp qword [esp]'], 'f', 8
+        kind = 'i' if instr[0] == 'print_int' else 's'
+        srcLoc = self.location(instr[1], scopeInfo[1], funcScope)
+        if flag[1] == 1:
+            return ['mov esi, ' + srcLoc, 'push dword [esi]'], kind, 4
+        if srcLoc[0] == '[':
+            return ['push dword ' + srcLoc], kind, 4
+        return ['push ' + srcLoc], kind, 4
+
+    def buffered_print(self, instr, scopeInfo, funcScope):
+        # consecutive print_* (a whole 'print a, b, c') become one rt_print call
+        if self.code[self.codeIndex - 1][0] in PRINT_OPS:
+            return ['none']
+        end = self.codeIndex
+        while end < len(self.code) and self.code[end][0] in PRINT_OPS:
+            end += 1
+        code = []
+        kinds = ''
+        size = 4
+        for idx in range(end - 1, self.codeIndex - 1, -1):
+            code_, kind, bytes_ = self.printArg(idx, funcScope)
+            code += code_
+            kinds = kind + kinds
+            size += bytes_
+        code.append('push dword ' + self.stringLiteral('"' + kinds + '"'))
+        code.append('call rt_print')
+        code.append('add esp, ' + str(size))
+        return code
+
+    def buffered_scan_int(self, instr, scopeInfo, funcScope):
+        srcOffset = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
+        code = []
+        if self.flags[1] == 1:
+            code.append('mov esi, [ebp' + srcOffset + ']')
+        else:
+            code.append('lea esi, [ebp' + srcOffset + ']')
+        code.append('push esi')
+        code.append('call rt_scan_int')
+        code.append('add esp, 4')
         return code
 
+    def buffered_scan_string(self, instr, scopeInfo, funcScope):
+        srcOffset = self.ebpOffset(instr[1], scopeInfo[1], funcScope)
+        code = []
+        code.append('call rt_scan_string')
+        if self.flags[1] == 1:
+            code.append('mov esi, [ebp' + srcOffset + ']')
+            code.append('mov [esi], eax')
+        else:
+            code.append('mov [ebp' + srcOffset + '], eax')
+        return code
+
+    def call_op(self, instr, scopeInfo, funcScope):
+        # function call
+        return ['call '+instr[1]]
+
+    def register(self, opcode, handler, prefix=False):
+        r'''
+        Maps a 3AC opcode to the emitter handling it. With prefix=True the
+        handler gets every opcode starting with the given character(s),
+        which is how '&int', '&float' ... all reach ampersand_op.
+        Backends override an opcode by registering it again.
+        '''
+        if prefix:
+            self.prefixDispatch[opcode] = handler
+        else:
+            self.dispatch[opcode] = handler
+
+    def initDispatch(self):
+        self.dispatch = {}
+        self.prefixDispatch = {}
+        self.register('+int', self.add_op)
+        self.register('+float', self.fadd_op)
+        self.register('-int', self.minus_op)
+        self.register('-float', self.fminus_op)
+        self.register('*int', self.mul_op)
+        self.register('*float', self.fmul_op)
+        self.register('/int', self.div_op)
+        self.register('/float', self.fdiv_op)
+
+        self.register('=', self.assign_op)
+        self.register('+=', self.add_assign_op)
+        self.register('-=', self.sub_assign_op)
+        self.register('*=', self.mul_assign_op)
+        self.register('/=', self.div_assign_op)
+
+        self.register('retval', self.getRetVal)
+        for op in self.relops:
+            self.register(op, self.relops_cmp)
+        for op in self.frelops:
+            self.register(op, self.relops_fcmp)
+
+        self.register('if', self.if_op)
+        self.register('goto', self.goto_op)
+        self.register('||', self.logical)
+        self.register('&&', self.logical)
+        self.register('--', self.inc_dec)
+        self.register('++', self.inc_dec)
+        self.register('+ptr', self.ptr_add)
+
+        self.register('print_int', self.print_int)
+        self.register('print_float', self.print_float)
+        self.register('print_string', self.print_string)
+        self.register('scan_int', self.scan_int)
+        self.register('scan_string', self.scan_string)
+        self.register('param', self.param)
+        self.register('call', self.call_op)
+
+        self.register('*pointer', self.assign_ptr_rhs)
+        self.register('&', self.ampersand_op, prefix=True)
+
+        if self.floatMode == 'sse':
+            for op in ['+float', '-float', '*float', '/float']:
+                self.register(op, self.sse_arith)
+            for op in self.frelops:
+                self.register(op, self.sse_fcmp)
+            self.register('=', self.sse_assign)
+            self.register('print_float', self.sse_print_float)
+
+        if self.io == 'buffered':
+            for op in PRINT_OPS:
+                self.register(op, self.buffered_print)
+            self.register('scan_int', self.buffered_scan_int)
+            self.register('scan_string', self.buffered_scan_string)
+
     def genCode(self, idx, funcScope):
-        # Check instruction type and call function accordingly
+        # Look up the emitter for the instruction's opcode and call it
         instr = self.code[idx]
         scopeInfo = self.scopeInfo[idx]
+        self.flags = self.operands[idx]
 
         if instr[0] == 'return':
             return []
         elif len(instr) == 1:
             return [instr[0]+':']
-        elif instr[0] == '+int':
-            return self.add_op(instr, scopeInfo, funcScope)
-        elif instr[0] == '+float':
-            return self.fadd_op(instr, scopeInfo, funcScope)
-        elif instr[0] == '-float':
-            if len(instr) == 4:
-                return self.fsub_op(instr, scopeInfo, funcScope)
-            else:
-                return self.unary_fminus(instr, scopeInfo, funcScope)
-        if instr[0] == '-int':
-            if len(instr) == 4:
-                return self.sub_op(instr, scopeInfo, funcScope)
-            else:
-                return self.unary_minus(instr, scopeInfo, funcScope)
-        if instr[0] == '*int':
-            return self.mul_op(instr, scopeInfo, funcScope)
-        if instr[0] == '*float':
-            return self.fmul_op(instr, scopeInfo, funcScope)
-        if instr[0] == '/int':
-            return self.div_op(instr, scopeInfo, funcScope)
-        if instr[0] == '/float':
-            return self.fdiv_op(instr, scopeInfo, funcScope)
-
-        if instr[0] == '=':
-            return self.assign_op(instr, scopeInfo, funcScope)
-        if instr[0] == '+=':
-            return self.add_assign_op(instr, scopeInfo, funcScope)
-        if instr[0] == '-=':
-            return self.sub_assign_op(instr, scopeInfo, funcScope)
-        if instr[0] == '*=':
-            return self.mul_assign_op(instr, scopeInfo, funcScope)
-        if instr[0] == '/=':
-            return self.div_assign_op(instr, scopeInfo, funcScope)
-
-        if instr[0] == 'retval':
-            return self.getRetVal(instr, scopeInfo, funcScope)
-
-        if instr[0] in self.relops:
-            return self.relops_cmp(instr, scopeInfo, funcScope)
-
-        if instr[0] in self.frelops:
-            return self.relops_fcmp(instr, scopeInfo, funcScope)
-
-        if instr[0] == 'if':
-            return self.if_op(instr, scopeInfo, funcScope)
-        if instr[0] == 'goto':
-            return self.goto_op(instr, scopeInfo, funcScope)
 
-        if instr[0] in [ '||' , '&&']:
-            return self.logical(instr, scopeInfo, funcScope)
-
-        if instr[0] in ['--', '++']:
-            return self.inc_dec(instr, scopeInfo, funcScope)
-
-        if instr[0] == 'print_int':
-            return self.print_int(instr, scopeInfo, funcScope)
-        if instr[0] == 'print_float':
-            return self.print_float(instr, scopeInfo, funcScope)
-        if instr[0] == 'print_string':
-            return self.print_string(instr, scopeInfo, funcScope)
-        elif instr[0] == 'scan_int':
-            return self.scan_int(instr, scopeInfo, funcScope)
-        elif instr[0] == 'scan_string':
-            return self.scan_string(instr, scopeInfo, funcScope)
-        elif instr[0] == 'param':
-            return self.param(instr, scopeInfo, funcScope)
-        elif instr[0] == 'call':
-            # function call
-            return ['call '+instr[1]]
-
-        if instr[0] == '*pointer':
-            return self.assign_ptr_rhs(instr, scopeInfo, funcScope)
-        if instr[0][0] == '&':
-            return self.ampersand_op(instr, scopeInfo, funcScope)
+        handler = self.dispatch.get(instr[0])
+        if handler is None:
+            handler = self.prefixDispatch.get(instr[0][0])
+        if handler is not None:
+            return handler(instr, scopeInfo, funcScope)
 
     def getCode(self):
         while True:
@@ -1035,28 +1437,102 @@ class CodeGenerator:
                 break
             funcName = self.code[self.codeIndex][0].split(':')
             self.addFunc(funcName[0])
+        self.asmCode[self.dataIndex:self.dataIndex] = self.dataLines()
         return self.asmCode
 
-if __name__=='__main__':
-    # Load files
-    rootNode = pkl.load(open('rootNode.p', 'rb'))
+    def peephole(self):
+        # rewrites the text section in place, returns the per rule counters
+        optimizer = PeepholeOptimizer()
+        start = self.asmCode.index('section .text') + 1
+        self.asmCode = optimizer.run(self.asmCode, start)
+        return optimizer.stats
+
+def addArguments(argParser, singleFile=True):
+    # options of the 3AC passes and the code generator, shared with driver.py and batch.py
+    if singleFile:
+        argParser.add_argument('--output', dest='output', help='Location of the output assembly file', default='assembly.asm')
+    argParser.add_argument('--backend', dest='backend', help='code generation backend [stack/regalloc]', default='stack')
+    argParser.add_argument('--float', dest='float', help='float code generation [x87/sse]', default='x87')
+    argParser.add_argument('--io', dest='io', help='print/scan through libc or the buffered runtime.c [printf/buffered]', default='printf')
+    argParser.add_argument('--fold', dest='fold', help='constant folding and propagation on the 3AC [T/f]', default='t')
+    argParser.add_argument('--jumps', dest='jumps', help='jump threading and branch simplification on the 3AC [T/f]', default='t')
+    argParser.add_argument('--reduce', dest='reduce', help='induction variable strength reduction for array walks [T/f]', default='t')
+    argParser.add_argument('--dce', dest='dce', help='dead code elimination and frame compaction on the 3AC [T/f]', default='t')
+    argParser.add_argument('--peephole', dest='peephole', help='run the peephole optimizer [T/f]', default='t')
+    argParser.add_argument('--unroll', dest='unroll', help='largest aggregate (in dwords) copied without rep movsd', default=UNROLL_WORDS)
+    argParser.add_argument('--fuse', dest='fuse', help='fuse relational operators with the following conditional jump [T/f]', default='t')
+    argParser.add_argument('--scale', dest='scale', help='scaled index addressing for array elements [T/f]', default='t')
+    argParser.add_argument('--stats', dest='stats', help='print optimizer counters [t/F]', default='f')
+    if singleFile:
+        argParser.add_argument('--dot', dest='dot', help='write the control flow graph of the optimized 3AC to this DOT file', default=None)
+
+def generate(helper, rootNode, result):
+    r'''
+    runs the 3AC passes and CodeGenerator selected by the parsed options
+    result (see addArguments), returns the x86 code as a list of lines
+    '''
     assert(len(rootNode.code) == len(rootNode.scopeInfo))
-    helper = pkl.load(open('helper.p', 'rb'))
-
-    # Now can use helper class functions
-
-    codeGen = CodeGenerator(helper, rootNode)
+    if result.fold != 'f':
+        counters = ConstantFolder(helper, rootNode).run()
+        if result.stats == 't':
+            for name in counters:
+                print('fold ' + name + ': ' + str(counters[name]))
+    if result.jumps != 'f':
+        counters = JumpThreader(helper, rootNode).run()
+        if result.stats == 't':
+            for name in counters:
+                print('jumps ' + name + ': ' + str(counters[name]))
+    if result.reduce != 'f':
+        counters = StrengthReducer(helper, rootNode).run()
+        if result.stats == 't':
+            for name in counters:
+                print('reduce ' + name + ': ' + str(counters[name]))
+    if result.dce != 'f':
+        counters = DeadCodeEliminator(helper, rootNode).run()
+        if result.stats == 't':
+            for name in counters:
+                print('dce ' + name + ': ' + str(counters[name]))
+    if result.dot is not None:
+        dotFile(rootNode.code, result.dot)
+
+    codeGen = CodeGenerator(helper, rootNode, result.backend, result.float, result.io)
+    codeGen.unrollWords = int(result.unroll)
+    codeGen.fuseBranches = result.fuse != 'f'
+    codeGen.scaleIndexes = result.scale != 'f'
 
-    outfile = open('assembly.asm', 'w')
     x86Code = codeGen.getCode()
-
+    if result.peephole != 'f':
+        counters = codeGen.peephole()
+        x86Code = codeGen.asmCode
+        if result.stats == 't':
+            for rule in counters:
+                print('peephole ' + rule + ': ' + str(counters[rule]) + ' instructions removed')
+
+    lines = []
     for code_ in x86Code:
         if code_.split(' ')[0] in ['global', 'section', 'extern']:
-            outfile.write(code_ + '\n')
+            lines.append(code_)
         elif code_[-1:] == ':' and 'main' in code_:
-            outfile.write('main:\n')
+            lines.append('main:')
         elif code_[-1:] == ':':
-            outfile.write(code_ + '\n')
+            lines.append(code_)
         else:
-            outfile.write('    '+code_+'\n')
+            lines.append('    ' + code_)
+    return lines
+
+def writeAssembly(lines, path):
+    outfile = open(path, 'w')
+    for line in lines:
+        outfile.write(line + '\n')
     outfile.close()
+
+if __name__=='__main__':
+    argParser = argparse.ArgumentParser(description='Generates x86 assembly from the helper.p and rootNode.p of parser.py --pickle=t')
+    addArguments(argParser)
+    result = argParser.parse_args()
+
+    # Load files
+    rootNode = pkl.load(open('rootNode.p', 'rb'))
+    helper = pkl.load(open('helper.p', 'rb'))
+
+    writeAssembly(generate(helper, rootNode, result), result.output)
@@ -0,0 +1,171 @@
+ARITH = {
+    '+int': lambda a, b: a + b,
+    '-int': lambda a, b: a - b,
+    '*int': lambda a, b: a * b,
+}
+
+RELOPS = {
+    '==int': lambda a, b: a == b,
+    '!=int': lambda a, b: a != b,
+    '<int': lambda a, b: a < b,
+    '>int': lambda a, b: a > b,
+    '<=int': lambda a, b: a <= b,
+    '>=int': lambda a, b: a >= b,
+}
+
+LOGICAL = {
+    '&&': lambda a, b: a & b,
+    '||': lambda a, b: a | b,
+}
+
+# opcodes that only read their operands
+READ_ONLY = set(['if', 'goto', 'param', 'call', 'return', 'print_int', 'print_float', 'print_string'])
+
+
+def wrap(value):
+    # 32 bit two's complement, like the generated code
+    value &= 0xffffffff
+    if value >= 0x80000000:
+        value -= 0x100000000
+    return value
+
+
+class ConstantFolder:
+    r'''
+    Constant folding and propagation over the 3AC, run before CodeGenerator.
+    Values are tracked inside straight line code (every label starts with
+    nothing known) for int/bool scalars that are local to a function, never
+    address taken and not a reference. Known operands are replaced by
+    literals, fully known expressions become assignments of a literal and
+    conditional jumps on a known value become a goto or disappear.
+    '''
+    def __init__(self, helper, rootNode):
+        self.helper = helper
+        self.rootNode = rootNode
+        self.stats = {'folded': 0, 'propagated': 0, 'branches': 0, 'removed': 0}
+        self.addressTaken = set()
+        for instr, scopeInfo in zip(rootNode.code, rootNode.scopeInfo):
+            if instr[0][:1] == '&' and len(instr) > 2:
+                self.addressTaken.add((scopeInfo[2], instr[2]))
+        self.tracked = {}
+
+    def isTracked(self, ident, scope):
+        if not isinstance(scope, int) or scope == 0 or not isinstance(ident, str):
+            return False
+        key = (scope, ident)
+        if key not in self.tracked:
+            info = self.helper.symbolTables[scope].get(ident)
+            self.tracked[key] = (info is not None and key not in self.addressTaken
+                                 and 'reference' not in info and info.get('size') == 4
+                                 and self.helper.getBaseType(info['type'])[0] in ['int', 'bool'])
+        return self.tracked[key]
+
+    def value(self, instr, scopeInfo, pos, consts):
+        # known int value of an operand, or None
+        if scopeInfo[pos] in ['literal', 'int_literal']:
+            if isinstance(instr[pos], int) and not isinstance(instr[pos], bool):
+                return instr[pos]
+            return None
+        return consts.get((scopeInfo[pos], instr[pos]))
+
+    def assignLiteral(self, instr, scopeInfo, value):
+        return ['=', instr[1], value], ['', scopeInfo[1], 'int_literal']
+
+    def fold(self, instr, scopeInfo, consts):
+        r'''
+        returns the rewritten (instr, scopeInfo), or None to drop the instruction
+        '''
+        op = instr[0]
+        if len(instr) == 4 and (op in ARITH or op in RELOPS or op in LOGICAL or op == '/int'):
+            src1 = self.value(instr, scopeInfo, 2, consts)
+            src2 = self.value(instr, scopeInfo, 3, consts)
+            if src1 is not None and src2 is not None and self.isTracked(instr[1], scopeInfo[1]):
+                result = None
+                if op in ARITH:
+                    result = wrap(ARITH[op](src1, src2))
+                elif op in RELOPS:
+                    result = 1 if RELOPS[op](src1, src2) else 0
+                elif op in LOGICAL:
+                    result = LOGICAL[op](src1, src2)
+                elif src1 >= 0 and src2 > 0:
+                    # idiv after 'xor edx, edx' only agrees with C division here
+                    result = src1 // src2
+                if result is not None:
+                    self.stats['folded'] += 1
+                    return self.assignLiteral(instr, scopeInfo, result)
+            if op in ARITH or op == '/int':
+                # the emitters take a literal as the second source
+                if src2 is not None and isinstance(scopeInfo[3], int) and self.isTracked(instr[2], scopeInfo[2]):
+                    self.stats['propagated'] += 1
+                    return instr[:3] + [src2], scopeInfo[:3] + ['literal']
+                if (src1 is not None and src2 is None and op in ['+int', '*int']
+                        and isinstance(scopeInfo[3], int) and self.isTracked(instr[3], scopeInfo[3])):
+                    self.stats['propagated'] += 1
+                    return [op, instr[1], instr[3], src1], [scopeInfo[0], scopeInfo[1], scopeInfo[3], 'literal']
+            return instr, scopeInfo
+
+        if op == '-int' and len(instr) == 3:
+            src = self.value(instr, scopeInfo, 2, consts)
+            if src is not None and self.isTracked(instr[1], scopeInfo[1]):
+                self.stats['folded'] += 1
+                return self.assignLiteral(instr, scopeInfo, wrap(-src))
+            return instr, scopeInfo
+
+        if op == '=' and len(instr) == 3 and isinstance(scopeInfo[2], int):
+            src = self.value(instr, scopeInfo, 2, consts)
+            if src is not None and isinstance(scopeInfo[1], int) and instr[1][:1] != '*':
+                info = self.helper.symbolTables[scopeInfo[1]].get(instr[1])
+                if info is not None and self.helper.getBaseType(info['type'])[0] in ['int', 'bool']:
+                    self.stats['propagated'] += 1
+                    return self.assignLiteral(instr, scopeInfo, src)
+            return instr, scopeInfo
+
+        if op == 'if':
+            cond = self.value(instr, scopeInfo, 1, consts)
+            if cond is not None:
+                self.stats['branches'] += 1
+                if (cond == 0) == (instr[3] == 'False'):
+                    return ['goto', instr[5]], ['', '']
+                self.stats['removed'] += 1
+                return None
+        return instr, scopeInfo
+
+    def transfer(self, instr, scopeInfo, consts):
+        # update the known values after instr
+        op = instr[0]
+        if op in READ_ONLY or len(instr) < 2 or not isinstance(instr[1], str):
+            return
+        key = (scopeInfo[1], instr[1])
+        if not self.isTracked(instr[1], scopeInfo[1]):
+            return
+        value = None
+        if op == '=' and len(instr) == 3:
+            value = self.value(instr, scopeInfo, 2, consts)
+        elif op in ['++', '--'] and key in consts:
+            value = wrap(consts[key] + (1 if op == '++' else -1))
+        if value is None:
+            consts.pop(key, None)
+        else:
+            consts[key] = value
+
+    def run(self):
+        code = []
+        scopeInfos = []
+        consts = {}
+        for instr, scopeInfo in zip(self.rootNode.code, self.rootNode.scopeInfo):
+            if len(instr) == 1:
+                # function marker or label, other paths may reach it
+                consts = {}
+                code.append(instr)
+                scopeInfos.append(scopeInfo)
+                continue
+            folded = self.fold(instr, scopeInfo, consts)
+            if folded is None:
+                continue
+            instr, scopeInfo = folded
+            self.transfer(instr, scopeInfo, consts)
+            code.append(instr)
+            scopeInfos.append(scopeInfo)
+        self.rootNode.code[:] = code
+        self.rootNode.scopeInfo[:] = scopeInfos
+        return self.stats
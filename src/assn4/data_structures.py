@@ -1,4 +1,3 @@
-
 class Errors:
     def __init__(self):
         self.types = ['KeyError', 'Lexical Error']
@@ -37,7 +36,7 @@ class Errors:
 
 class SymbolTable:
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, index=None, sizeOf=None):
         self.typeDefs = {} # this is a dictionary of dictionary, in which each type name is key
                            # for each key, all the declarations are key in the new dict, with type, size tuple
                            # In this dictionary we will also store the total size
@@ -49,6 +48,13 @@ class SymbolTable:
         self.metadata['largest'] = 0
         self.maybe = []
         self.maybeScope = {}
+        # Helper.bindings, shared by all the tables of a Helper
+        self.index = index
+        # Helper.computeSize, keeps the total size of the symbols (width) and
+        # of the arguments (paramWidth) up to date as they are added
+        self.sizeOf = sizeOf
+        self.width = 0
+        self.paramWidth = 0
 
         # metadata has a key 'is_function' to check if the current symbol table is activation record.
 
@@ -73,6 +79,10 @@ class SymbolTable:
         if (not self.lookUp(id)):
             (self.table)[id] = {}
             (self.table)[id]['type'] = type_
+            if self.index is not None:
+                self.index.setdefault(id, []).append(self.metadata['scopeNo'])
+            if self.sizeOf is not None:
+                self.width += self.sizeOf(type_)
 
     # Returns the argument list of the variable else returns None
     # Note that type is always a key in argument list
@@ -85,10 +95,19 @@ class SymbolTable:
     # Updates the variable of id id with arg list of KEY key with VALUE value
     def update(self, id, key, value):
         try:
-            (self.table)[id][key] = value
-            return True
+            info = (self.table)[id]
         except KeyError:
             return False
+        if self.sizeOf is not None:
+            if key == 'type':
+                change = self.sizeOf(value) - self.sizeOf(info['type'])
+                self.width += change
+                if 'is_arg' in info:
+                    self.paramWidth += change
+            elif key == 'is_arg' and key not in info:
+                self.paramWidth += self.sizeOf(info['type'])
+        info[key] = value
+        return True
 
 
     def setParent(self, parent):
@@ -104,6 +123,8 @@ class Helper:
         self.labelCount = 0
         self.scope = 0
         self.scopeStack = []
+        # identifier -> scopes of scopeStack declaring it, innermost last
+        self.bindings = {}
         self.offsetStack = [0]
         self.symbolTables = []
         self.lastScope = 0
@@ -113,6 +134,19 @@ class Helper:
         self.type['bool'] = {'size': 4, 'type': ['bool']}
         self.type['string'] = {'size': 4, 'type': ['string']}
         self.type['float'] = {'size': 4, 'type': ['float']}
+        # interned form of every type, see internType. Each self.type entry
+        # keeps the one of its type as 'key', typeEntries finds the entry of
+        # an expanded type that is the type list of an entry
+        self.typeIndex = {}
+        self.typeEntries = {}
+        for entry in self.type.values():
+            self.setEntryKey(entry)
+        # freezeType of each unnamed type (struct names left as they are) -> its typeN name
+        self.unNamedTypes = {}
+        # struct name -> first typeN made while it was being defined
+        self.openStructs = {}
+        # interned form of an expanded type -> its size, see computeSize
+        self.typeSizes = {}
         # for structure type would be like 'type': ['struct', {'a': {'size': 4, 'type': ['int'], offset: 4}}]
         # array would be like type['arr'] = {type: ['array', {'type': expanded form, 'len': 10}, 'size': }
         # slices like type['slice'] = {type: ['slice', {'type': expanded form, 'len': 10}], size}
@@ -129,9 +163,18 @@ class Helper:
         return self.type[type_]['type']
 
     def computeSize(self, type_):
-        # computes size for a expanded type
+        # computes size for a expanded type, once per interned type
         if isinstance(type_, str):
             return self.type[type_]['size']
+        key = self.typeKey(type_)
+        size = self.typeSizes.get(key)
+        if size is None:
+            size = self.walkSize(type_)
+            self.typeSizes[key] = size
+        return size
+
+    def walkSize(self, type_):
+        # size of an expanded type from the sizes of its parts
         if type_[0] == 'pointer':
             return 4
         elif type_[0] == 'struct':
@@ -152,16 +195,43 @@ class Helper:
     def addUnNamedType(self, type_):
         r'''
         Input: type in expanded form
-        this function adds this new type in type dictionary.
+        this function returns the name of this type in type dictionary, the
+        type is added only if no equal unnamed type is there already.
         This might be useful when the type does not have a explicit name.
         '''
         assert(isinstance(type_, list))
+        key = self.freezeType(type_, [], False)
+        typeName = self.unNamedTypes.get(key)
+        if typeName is not None:
+            return typeName
         typeName = 'type' + str(self.typeincr)
         self.typeincr += 1
-        sz = self.computeSize(type_)
-        self.type[typeName] = {'size': sz, 'type': type_}
+        self.type[typeName] = {'size': 0, 'type': type_}
+        self.setEntryKey(self.type[typeName])
+        self.type[typeName]['size'] = self.computeSize(type_)
+        self.unNamedTypes[key] = typeName
         return typeName
 
+    def openStruct(self, name):
+        # the fields of struct name refer to it as ['struct', name] until addType
+        self.type[name] = {'type': ['struct', name], 'size': 0}
+        # not in typeEntries, the key of this list changes with the definition
+        self.type[name]['key'] = self.internType(self.type[name]['type'])
+        self.openStructs[name] = self.typeincr
+
+    def addType(self, name, typeName):
+        r'''
+        declares the named type name as the type typeName. The types made
+        while a struct was being defined refer to it by name, they are
+        interned again now that the name resolves to the struct's fields.
+        '''
+        self.type[name] = self.type[typeName]
+        first = self.openStructs.pop(name, None)
+        if first is None:
+            return
+        for idx in range(first, self.typeincr):
+            self.setEntryKey(self.type['type' + str(idx)])
+
     def newVar(self, type_):
         # this type_ can be in compact or base format.
         var = 't' + str(self.varCount)
@@ -199,7 +269,7 @@ class Helper:
         self.offsetStack[-1] += size
 
     def newScope(self, parent=None):
-        newTable = SymbolTable(parent)
+        newTable = SymbolTable(parent, self.bindings, self.computeSize)
         newTable.updateMetadata('scopeNo', self.scope)
         self.symbolTables.append(newTable)
         self.scopeStack.append(self.scope)
@@ -215,6 +285,11 @@ class Helper:
             self.symbolTables[scope].metadata['largest'] += self.getWidth(self.getScope())
         self.lastScope = self.scopeStack.pop()
         self.popOffset()
+        for ident in self.symbolTables[self.lastScope].table:
+            scopes = self.bindings[ident]
+            scopes.remove(self.lastScope)
+            if len(scopes) == 0:
+                del self.bindings[ident]
 
     def getLargest(self, scope):
         return self.symbolTables[scope].metadata['largest']
@@ -234,10 +309,7 @@ class Helper:
             return False
 
         # Default case
-        for scope in self.scopeStack[::-1]:
-            if self.symbolTables[scope].lookUp(identifier) is True:
-                return True
-        return False
+        return identifier in self.bindings
 
     def checkType(self, identifier):
         if identifier in self.type:
@@ -246,27 +318,28 @@ class Helper:
 
     def findInfo(self, identifier, type_='default'):
         if type_ == 'global':
-            if self.symbolTables[0].get(identifier) is not None:
-                return self.symbolTables[0].get(identifier)
+            return self.symbolTables[0].get(identifier)
 
         else:
-            for scope in self.scopeStack[::-1]:
-                if self.symbolTables[scope].get(identifier) is not None:
-                    return self.symbolTables[scope].get(identifier)
+            scope = self.findScope(identifier)
+            if scope is not None:
+                return self.symbolTables[scope].table[identifier]
 
-            for scope in self.scopeStack[::-1]:
+            for scope in reversed(self.scopeStack):
                 if self.symbolTables[scope].typeDefs.get(identifier) is not None:
                     return self.symbolTables[scope].typeDefs.get(identifier)
         return None
 
     def findScope(self, identifier):
-        for scope in self.scopeStack[::-1]:
-            if self.symbolTables[scope].get(identifier) is not None:
-                return scope
+        # innermost open scope declaring identifier, None if there is none
+        scopes = self.bindings.get(identifier)
+        if scopes is not None:
+            return scopes[-1]
+        return None
 
     def getNearest(self, type_):
         # return nearest parent scope with name = type_(func, for), -1 if no such scope exist
-        for scope in self.scopeStack[::-1]:
+        for scope in reversed(self.scopeStack):
             if self.symbolTables[scope].metadata['name'] == type_:
                 return scope
         return -1
@@ -346,42 +419,62 @@ class Helper:
         else:
             return -1
 
-    def compareType(self, tp1, tp2):
-        # given 2 types (in compact form), checks wheather they denote same type or not
-        if isinstance(tp1, str):
-            tp1 = self.getBaseType(tp1)
-        if isinstance(tp2, str):
-            tp2 = self.getBaseType(tp2)
-
-        # This cancer code is just to handle the case of linked list (pointer to struct)
-        try:
-            if tp1[0] == 'pointer' and tp1[1][0] == 'struct' and isinstance(tp1[1][1], str):
-                tp1 = ['pointer', self.getBaseType(tp1[1][1])]
-        except:
-            pass
-        try:
-            if tp2[0] == 'pointer' and tp2[1][0] == 'struct' and isinstance(tp2[1][1], str):
-                tp2 = ['pointer', self.getBaseType(tp2[1][1])]
-        except:
-            pass
+    def resolveStruct(self, type_):
+        # replaces the name in a ['struct', name] type by the fields of that
+        # struct, its interned form stays the same
+        if isinstance(type_[1], str):
+            type_[1] = self.getBaseType(type_[1])[1]
 
-        try:
-            if tp1[0] == 'struct' and isinstance(tp1[1], str):
-                tp1 = self.getBaseType(tp1[1])
-        except:
-            pass
-        
-        try:
-            if tp2[0] == 'struct' and isinstance(tp2[1], str):
-                tp2 = self.getBaseType(tp2[1])
-        except:
-            pass
+    def freezeType(self, type_, path, resolve=True):
+        r'''
+        hashable copy of an expanded type, path holds the fields of the
+        enclosing structs. With resolve a named struct, once it is defined,
+        stands for its fields.
+        '''
+        if isinstance(type_, dict):
+            return ('{}',) + tuple((name, self.freezeType(type_[name], path, resolve)) for name in sorted(type_))
+        if not isinstance(type_, list):
+            return type_
+        if resolve and type_[0] == 'struct' and isinstance(type_[1], str) and type_[1] in self.type:
+            named = self.type[type_[1]]['type']
+            if named[0] == 'struct' and isinstance(named[1], dict):
+                type_ = named
+        if type_[0] == 'struct' and isinstance(type_[1], dict):
+            if id(type_[1]) in path:
+                # recursive struct, refer to the enclosing level
+                return ('cycle', path.index(id(type_[1])))
+            path.append(id(type_[1]))
+            key = ('struct', self.freezeType(type_[1], path, resolve))
+            path.pop()
+            return key
+        return tuple(self.freezeType(elem, path, resolve) for elem in type_)
+
+    def internType(self, type_):
+        # the tuple shared by all expanded types equal to type_
+        key = self.freezeType(type_, [])
+        return self.typeIndex.setdefault(key, key)
+
+    def setEntryKey(self, entry):
+        # interns the type of a self.type entry and stores it in the entry
+        entry['key'] = self.internType(entry['type'])
+        self.typeEntries[id(entry['type'])] = entry
+
+    def typeKey(self, type_):
+        r'''
+        interned form of a type (compact or expanded): equal types get the
+        same tuple object. It is stored in the self.type entries, only an
+        expanded type that belongs to no entry is interned here.
+        '''
+        if isinstance(type_, str):
+            return self.type[type_]['key']
+        entry = self.typeEntries.get(id(type_))
+        if entry is not None and entry['type'] is type_:
+            return entry['key']
+        return self.internType(type_)
 
-        # cancer ends, can do chemo now :P
-        if tp1 == tp2:
-            return True
-        else:
-            return False
+    def compareType(self, tp1, tp2):
+        # given 2 types (compact or expanded), checks wheather they denote same type or not
+        return self.typeKey(tp1) is self.typeKey(tp2)
 
     def checkArguments(self, name, arguments):
         # checks for a given function name and argument type list, matches with the function signature
@@ -406,21 +499,33 @@ class Helper:
         return 'arguments do not match any function signature'
 
     def getWidth(self, scope):
-        symTable = self.symbolTables[scope]
-        width = 0
-        for ident in symTable.table:
-            size_ = self.computeSize(symTable.get(ident)['type'])
-            width += size_
-        return width
+        # total size of the symbols of a scope
+        return self.symbolTables[scope].width
+
+    def getFuncScopes(self):
+        # returns a map, scope of a function -> list of scopes inside that function
+        owner = {}
+        for scope in range(len(self.symbolTables)):
+            chain = []
+            curr = scope
+            while curr is not None and curr not in owner:
+                if 'is_function' in self.symbolTables[curr].metadata:
+                    owner[curr] = curr
+                    break
+                chain.append(curr)
+                curr = self.symbolTables[curr].parent
+            func = owner.get(curr)
+            for link in chain:
+                owner[link] = func
+        groups = {}
+        for scope in sorted(owner):
+            if owner[scope] is not None:
+                groups.setdefault(owner[scope], []).append(scope)
+        return groups
 
     def getParamWidth(self, scope):
-        symTable = self.symbolTables[scope]
-        width = 0
-        for ident in symTable.table:
-            info = symTable.get(ident)
-            if 'is_arg' in info.keys():
-                width += self.type[info['type']]['size']
-        return width
+        # total size of the arguments of a function scope
+        return self.symbolTables[scope].paramWidth
 
     def debug(self):
         print('varCount:',self.varCount)
@@ -433,16 +538,57 @@ class Helper:
             print('symbolTable %d:'%table,self.symbolTables[table])
 
 
+class CodeBuffer(list):
+    r'''
+    3AC (or its scopeInfo) of a grammar node while it is being built. The
+    elements are instructions and whole CodeBuffers that were added with
+    +=, which links the other buffer in O(1) instead of copying it into
+    every enclosing statement list; insert(0, ..) moves the chunks of this
+    buffer, not the instructions under them. p_start flattens the program
+    once. A buffer added to another one is shared, so it must not change
+    afterwards.
+    '''
+    # buffers with more elements (instructions or links) than this are linked
+    LINK = 16
+
+    def __iadd__(self, other):
+        if other is self:
+            self.extend(list(other))
+        elif isinstance(other, CodeBuffer) and len(other) > CodeBuffer.LINK:
+            self.append(other)
+        else:
+            # a few elements are cheaper to copy than to link
+            self.extend(other)
+        return self
+
+    def __add__(self, other):
+        result = CodeBuffer([self])
+        result += other
+        return result
+
+    def flatten(self):
+        items = []
+        stack = [iter(self)]
+        while len(stack) > 0:
+            for item in stack[-1]:
+                if isinstance(item, CodeBuffer):
+                    stack.append(iter(item))
+                    break
+                items.append(item)
+            else:
+                stack.pop()
+        return items
+
 class Node:
     def __init__(self,name):
-        self.code = []
+        self.code = CodeBuffer()
         self.typeList = []
         self.placeList = []
         self.identList = []
         self.name = name
         self.sizeList = []
         self.extra = {}
-        self.scopeInfo = []
+        self.scopeInfo = CodeBuffer()
 
 class LineCount:
     def __init__(self):
@@ -0,0 +1,130 @@
+from regAlloc import RegisterAllocator, RELOPS, FRELOPS, identRe
+from cfg import functionRanges, isLabel
+
+# opcodes without side effects besides writing instr[1]
+PURE_OPS = set([
+    '+int', '-int', '*int', '+float', '-float', '*float', '/float',
+    '||', '&&', '=',
+]) | RELOPS | FRELOPS
+
+
+class DeadCodeEliminator:
+    r'''
+    Dead code elimination over the 3AC, run before CodeGenerator.
+    Per function it drops unreachable instructions (after a goto or return,
+    up to the next label) and, using the liveness of RegisterAllocator,
+    instructions whose only effect is writing a variable that is dead
+    afterwards. The frame is then compacted: only variables still named by
+    the function's code get a stack slot, and the resulting size is stored
+    as 'frame_size' in the function's metadata for FrameLayout.
+    '''
+    def __init__(self, helper, rootNode):
+        self.helper = helper
+        self.rootNode = rootNode
+        self.stats = {'unreachable': 0, 'dead': 0, 'slots': 0, 'bytes': 0}
+        self.addressTaken = set()
+        for instr, scopeInfo in zip(rootNode.code, rootNode.scopeInfo):
+            if instr[0][:1] == '&' and len(instr) > 2:
+                self.addressTaken.add((scopeInfo[2], instr[2]))
+
+    def isPure(self, instr):
+        op = instr[0]
+        if op in PURE_OPS or (op[:1] == '&' and op != '&&'):
+            return True
+        # unary minus
+        return op in ['-int', '-float'] and len(instr) == 3
+
+    def removable(self, allocator, instr, scopeInfo, liveOut):
+        if len(instr) < 3 or not self.isPure(instr) or instr[1][:1] == '*':
+            return False
+        if not allocator.isVar(instr, scopeInfo, 1):
+            return False
+        key = (scopeInfo[1], instr[1])
+        if key[0] == 0 or key in liveOut or key in self.addressTaken:
+            return False
+        if allocator.isReference(key) and not allocator.isAggregateAdd(instr, scopeInfo):
+            # a store through the address held in instr[1]
+            return False
+        # element addresses may outlive a struct/array, keep every write to them
+        return allocator.baseType(key) not in ['struct', 'array']
+
+    def unreachable(self, code, scopeInfo):
+        keptCode = []
+        keptScope = []
+        reachable = True
+        for instr, info in zip(code, scopeInfo):
+            if isLabel(instr):
+                reachable = True
+            elif not reachable:
+                self.stats['unreachable'] += 1
+                continue
+            keptCode.append(instr)
+            keptScope.append(info)
+            if instr[0] in ['goto', 'return']:
+                reachable = False
+        return keptCode, keptScope
+
+    def deadStores(self, code, scopeInfo):
+        while True:
+            allocator = RegisterAllocator(self.helper, code, scopeInfo)
+            defUse = {idx: allocator.defUse(code[idx], scopeInfo[idx]) for idx in range(len(code))}
+            liveIn, liveOut = allocator.liveness(0, len(code), defUse)
+            keep = [idx for idx in range(len(code))
+                    if not self.removable(allocator, code[idx], scopeInfo[idx], liveOut[idx])]
+            if len(keep) == len(code):
+                return code, scopeInfo
+            self.stats['dead'] += len(code) - len(keep)
+            code = [code[idx] for idx in keep]
+            scopeInfo = [scopeInfo[idx] for idx in keep]
+
+    def compact(self, funcScope, scopes, code):
+        # every identifier the code still mentions, '*t1' and '(float)t3' included
+        named = set()
+        for instr in code:
+            for operand in instr[1:]:
+                if isinstance(operand, str):
+                    named.add(operand)
+                    match = identRe.search(operand)
+                    if match is not None:
+                        named.add(match.group(0))
+
+        paramSize = self.helper.getParamWidth(funcScope)
+        metadata = self.helper.symbolTables[funcScope].metadata
+        oldSize = self.helper.getWidth(funcScope) - paramSize + self.helper.getLargest(funcScope)
+        locals_ = []
+        for scope in scopes:
+            for ident, info in self.helper.symbolTables[scope].table.items():
+                if 'is_arg' in info:
+                    continue
+                if ident in named:
+                    locals_.append((scope, info['offset'], ident))
+                else:
+                    self.stats['slots'] += 1
+
+        offset = paramSize
+        for scope, oldOffset, ident in sorted(locals_):
+            info = self.helper.symbolTables[scope].table[ident]
+            info['offset'] = offset
+            offset += info['size']
+        metadata['frame_size'] = offset - paramSize
+        self.stats['bytes'] += oldSize - metadata['frame_size']
+
+    def run(self):
+        funcScopes = self.helper.getFuncScopes()
+        code = self.rootNode.code
+        scopeInfo = self.rootNode.scopeInfo
+        newCode = []
+        newScopeInfo = []
+        for name, start, end in functionRanges(code):
+            funcScope = self.helper.symbolTables[0].functions[name]
+
+            # code[start] is the function marker
+            body, bodyScope = self.unreachable(code[start + 1:end], scopeInfo[start + 1:end])
+            body, bodyScope = self.deadStores(body, bodyScope)
+            self.compact(funcScope, funcScopes.get(funcScope, [funcScope]), body)
+
+            newCode += [code[start]] + body
+            newScopeInfo += [scopeInfo[start]] + bodyScope
+        code[:] = newCode
+        scopeInfo[:] = newScopeInfo
+        return self.stats
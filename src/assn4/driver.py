@@ -0,0 +1,49 @@
+r'''
+Compiles a Go file to x86 assembly in a single process: the lexer, the
+parser, the 3AC passes and CodeGenerator share the in-memory Helper and
+Node objects, nothing is pickled through the current directory.
+Run from src/assn4:
+    python3 driver.py --input=file.go [--output=assembly.asm] [codeGen.py options]
+--csv and --code also write the symbol tables and the 3AC like parser.py,
+--pickle=t writes helper.p and rootNode.p for a later codeGen.py run.
+'''
+
+import argparse
+import sys
+
+import parser as goParser
+from codeGen import addArguments, generate, writeAssembly
+
+
+def main():
+    argParser = argparse.ArgumentParser(description='Compiles a Go file to x86 assembly')
+    argParser.add_argument('--input', dest='in_file_location', help='Location of the input .go file', required=True)
+    argParser.add_argument('--csv', dest='csv_file_location', help='Location of the output .csv file for symbol tables', default=None)
+    argParser.add_argument('--code', dest='code_file_location', help='Location of the output .code file for 3AC', default=None)
+    argParser.add_argument('--pickle', dest='pickle', help='write helper.p and rootNode.p for codeGen.py [t/F]', default='f')
+    addArguments(argParser)
+    result = argParser.parse_args()
+
+    in_file = open(result.in_file_location, 'r')
+    data = in_file.read()
+    in_file.close()
+
+    parsed = goParser.parse(data)
+    if parsed is None:
+        sys.exit(1)
+    helper, rootNode = parsed
+
+    if result.csv_file_location is not None:
+        csv_file = open(result.csv_file_location, 'w+')
+        goParser.generateCSV(csv_file, helper)
+        csv_file.close()
+    if result.code_file_location is not None:
+        goParser.writeCode(result.code_file_location, rootNode)
+    if result.pickle == 't':
+        goParser.writePickles(helper, rootNode)
+
+    writeAssembly(generate(helper, rootNode, result), result.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+from cfg import ControlFlowGraph, functionRanges, isLabel
+
+# largest loop condition (in 3AC instructions) copied to the bottom of a loop
+ROTATE_LIMIT = 8
+
+INVERSE = {'False': 'True', 'True': 'False'}
+
+
+def isJump(instr):
+    return instr[0] in ['goto', 'if']
+
+
+def target(instr):
+    # label of a goto or if instruction
+    return instr[1] if instr[0] == 'goto' else instr[5]
+
+
+def retarget(instr, label):
+    if instr[0] == 'goto':
+        return ['goto', label]
+    return instr[:5] + [label]
+
+
+class JumpThreader:
+    r'''
+    Branch simplification over the 3AC, run before CodeGenerator.
+    Per function, until nothing changes:
+    jumps to a label that only jumps on are threaded to the final target,
+    'if c goto L1; goto L2; L1:' becomes 'if !c goto L2',
+    blocks entered by a goto (and not by falling through) are placed right
+    after that goto,
+    jumps to the next instruction, unreachable code and unused labels are
+    dropped, and a loop whose back edge is 'goto header' gets a copy of the
+    header's condition at the bottom, so every iteration takes a single
+    conditional jump. 'if c == True goto L' jumps when c is non zero.
+    '''
+    def __init__(self, helper, rootNode):
+        self.helper = helper
+        self.rootNode = rootNode
+        self.stats = {'threaded': 0, 'inverted': 0, 'moved': 0, 'rotated': 0,
+                      'jumps': 0, 'unreachable': 0, 'labels': 0}
+
+    def aliasLabels(self, code, scopeInfo):
+        # a run of labels is merged into its first label
+        alias = {}
+        keptCode = []
+        keptScope = []
+        for instr, info in zip(code, scopeInfo):
+            if isLabel(instr) and len(keptCode) > 0 and isLabel(keptCode[-1]):
+                alias[instr[0]] = alias.get(keptCode[-1][0], keptCode[-1][0])
+                self.stats['labels'] += 1
+                continue
+            keptCode.append(instr)
+            keptScope.append(info)
+        if len(alias) > 0:
+            for idx, instr in enumerate(keptCode):
+                if isJump(instr) and target(instr) in alias:
+                    keptCode[idx] = retarget(instr, alias[target(instr)])
+        return keptCode, keptScope
+
+    def thread(self, code):
+        # label -> label its block immediately jumps to
+        forward = {}
+        for idx in range(len(code) - 1):
+            if isLabel(code[idx]) and code[idx + 1][0] == 'goto':
+                forward[code[idx][0]] = code[idx + 1][1]
+
+        def final(label):
+            seen = set([label])
+            while label in forward and forward[label] not in seen:
+                label = forward[label]
+                seen.add(label)
+            return label
+
+        changed = False
+        for idx, instr in enumerate(code):
+            if isJump(instr):
+                label = final(target(instr))
+                if label != target(instr):
+                    code[idx] = retarget(instr, label)
+                    self.stats['threaded'] += 1
+                    changed = True
+        return changed
+
+    def invert(self, code, scopeInfo):
+        # if c == False goto L1 / goto L2 / L1:  ->  if c == True goto L2
+        changed = False
+        for idx in range(len(code) - 2):
+            instr = code[idx]
+            if (instr is not None and instr[0] == 'if' and code[idx + 1][0] == 'goto'
+                    and isLabel(code[idx + 2]) and code[idx + 2][0] == instr[5]):
+                code[idx] = instr[:3] + [INVERSE[instr[3]], 'goto', code[idx + 1][1]]
+                code[idx + 1] = None
+                self.stats['inverted'] += 1
+                changed = True
+        return changed
+
+    def sweep(self, code, scopeInfo):
+        r'''
+        drops jumps to the next instruction, unreachable code and labels
+        nobody jumps to (None entries are removed as well)
+        '''
+        used = set(target(instr) for instr in code if instr is not None and isJump(instr))
+        keptCode = []
+        keptScope = []
+        reachable = True
+        for idx, instr in enumerate(code):
+            if instr is None:
+                continue
+            if isLabel(instr):
+                if instr[0] not in used:
+                    self.stats['labels'] += 1
+                    continue
+                reachable = True
+            elif not reachable:
+                self.stats['unreachable'] += 1
+                continue
+            if isJump(instr):
+                nxt = idx + 1
+                while nxt < len(code) and code[nxt] is None:
+                    nxt += 1
+                if nxt < len(code) and isLabel(code[nxt]) and code[nxt][0] == target(instr):
+                    # 'if' only reads its condition, so it can go as well
+                    self.stats['jumps'] += 1
+                    continue
+            keptCode.append(instr)
+            keptScope.append(scopeInfo[idx])
+            if instr[0] in ['goto', 'return']:
+                reachable = False
+        return len(keptCode) != len(code), keptCode, keptScope
+
+    def place(self, code, scopeInfo):
+        r'''
+        moves one block that does not fall through (in or out) right after a
+        'goto' to it, returns the new lists or None
+        '''
+        graph = ControlFlowGraph(code, 0, len(code))
+        for block in graph.blocks[1:]:
+            before = graph.blocks[block.index - 1]
+            if block.label is None or code[block.end - 1][0] not in ['goto', 'return']:
+                continue
+            if code[before.end - 1][0] not in ['goto', 'return']:
+                # the block above falls through into this one
+                continue
+            preds = [pred for pred in block.pred
+                     if pred is not block and code[pred.end - 1][0] == 'goto']
+            if len(preds) == 0:
+                continue
+            order = [idx for idx in range(len(code)) if idx < block.start or idx >= block.end]
+            at = order.index(preds[0].end - 1) + 1
+            order[at:at] = range(block.start, block.end)
+            self.stats['moved'] += 1
+            return [code[idx] for idx in order], [scopeInfo[idx] for idx in order]
+        return None
+
+    def rotate(self, code, scopeInfo, rotated):
+        r'''
+        replaces one back edge 'goto header' by a copy of the header's
+        condition that jumps back into the loop body, returns the new lists
+        or None. rotated holds the headers done so far, each loop is rotated
+        once.
+        '''
+        graph = ControlFlowGraph(code, 0, len(code))
+        loops = []
+        for block in graph.blocks:
+            last = code[block.end - 1]
+            if last[0] != 'goto' or last[1] not in graph.labels or last[1] in rotated:
+                continue
+            header = graph.labels[last[1]]
+            if header is block or not graph.dominates(header, block):
+                continue
+            cond = code[header.end - 1]
+            size = header.end - header.start - 1
+            if cond[0] != 'if' or cond[5] == header.label or size > ROTATE_LIMIT:
+                continue
+            if header.index + 1 < len(graph.blocks):
+                loops.append((graph.depth(header), block, header))
+        if len(loops) == 0:
+            return None
+
+        # innermost loop first, its exit jump may let the outer latch be placed
+        depth, block, header = max(loops, key=lambda loop: loop[0])
+        cond = code[header.end - 1]
+        body = graph.blocks[header.index + 1]
+        label = body.label
+        if label is None:
+            # the loop body needs a label to jump back to
+            label = self.helper.newLabel()
+
+        # emitters rewrite their instruction in place, so copy every list
+        copy = [list(instr) for instr in code[header.start + 1:header.end - 1]]
+        copyScope = [list(info) for info in scopeInfo[header.start + 1:header.end - 1]]
+        copy.append(cond[:3] + [INVERSE[cond[3]], 'goto', label])
+        copyScope.append(list(scopeInfo[header.end - 1]))
+        copy.append(['goto', cond[5]])
+        copyScope.append(['', ''])
+
+        newCode = []
+        newScope = []
+        for idx in range(len(code)):
+            if idx == body.start and body.label is None:
+                newCode.append([label])
+                newScope.append([''])
+            if idx == block.end - 1:
+                newCode += copy
+                newScope += copyScope
+            else:
+                newCode.append(code[idx])
+                newScope.append(scopeInfo[idx])
+        rotated.add(header.label)
+        self.stats['rotated'] += 1
+        return newCode, newScope
+
+    def simplify(self, code, scopeInfo):
+        code, scopeInfo = self.aliasLabels(code, scopeInfo)
+        rotated = set()
+        while True:
+            changed = self.thread(code)
+            changed = self.invert(code, scopeInfo) or changed
+            swept, code, scopeInfo = self.sweep(code, scopeInfo)
+            if changed or swept:
+                continue
+            result = self.place(code, scopeInfo)
+            if result is None:
+                result = self.rotate(code, scopeInfo, rotated)
+            if result is None:
+                return code, scopeInfo
+            code, scopeInfo = result
+
+    def run(self):
+        code = self.rootNode.code
+        scopeInfo = self.rootNode.scopeInfo
+        newCode = []
+        newScopeInfo = []
+        for name, start, end in functionRanges(code):
+            # code[start] is the function marker
+            body, bodyScope = self.simplify(code[start + 1:end], scopeInfo[start + 1:end])
+            newCode += [code[start]] + body
+            newScopeInfo += [scopeInfo[start]] + bodyScope
+        code[:] = newCode
+        scopeInfo[:] = newScopeInfo
+        return self.stats
@@ -2,9 +2,13 @@ from ply import lex
 from ply.lex import TOKEN
 import ply.yacc as yacc
 from lexer import *
-from data_structures import Helper, Node
+import lexer as lexRules
+from data_structures import CodeBuffer, Errors, Helper, LineCount, Node
 import json
 import argparse
+import hashlib
+import importlib.util
+import os
 import sys
 
 # class DevNull:
@@ -34,7 +38,7 @@ precedence = (
     ('left', 'MUL', 'QUO', 'REM'),
 )
 
-# declarations
+# declarations, the state of the compilation in progress (see Compiler)
 helper = Helper()
 rootNode = Node('rootNode')
 helper.newScope()
@@ -46,8 +50,9 @@ def p_start(p):
     p[0] = p[1]
     p[0].name = 'start'
     global rootNode
-    rootNode.code += p[0].code
-    rootNode.scopeInfo += p[0].scopeInfo
+    # the only copy of the program's 3AC, the passes work on plain lists
+    rootNode.code = p[0].code.flatten()
+    rootNode.scopeInfo = p[0].scopeInfo.flatten()
 
 # -------------------------------------------------------
 
@@ -154,7 +159,7 @@ def p_struct_type(p):
 
 def p_structInit(p):
     '''structInit : epsilon'''
-    helper.type[p[-3]] = {'type': ['struct', p[-3]], 'size': 0}
+    helper.openStruct(p[-3])
 
 def p_structDeInit(p):
     '''structDeInit : epsilon'''
@@ -444,7 +449,7 @@ def p_alias_decl(p):
         compilation_errors.add("Redeclaration Error", line_number.get()+1,\
             "Alias %s already declared"%p[1])
     else:
-        helper.type[p[1]] = helper.type[p[3].typeList[0]]
+        helper.addType(p[1], p[3].typeList[0])
 # -------------------------------------------------------
 
 
@@ -457,7 +462,7 @@ def p_type_def(p):
         compilation_errors.add("Redeclaration Error", line_number.get()+1,\
             "Type %s already declared"%p[1])
     else:
-        helper.type[p[1]] = helper.type[p[2].typeList[0]]
+        helper.addType(p[1], p[2].typeList[0])
 # -------------------------------------------------------
 
 
@@ -723,8 +728,7 @@ def p_prim_expr(p):
         if True:
             baseType = helper.getBaseType(p[1].typeList[0])
             ident = p[2].extra['ident']
-            if isinstance(baseType[1], str):
-                baseType[1] = helper.getBaseType(baseType[1])[1]
+            helper.resolveStruct(baseType)
             if baseType[0] != 'struct':
                 compilation_errors.add('TypeMismatch', line_number.get()+1, 'Before the period we must have struct type')
             elif ident not in baseType[1]:
@@ -1074,7 +1078,7 @@ def p_assignment(p):
         for idx in range(len(p[3].typeList)):
             rawTp1 = helper.getBaseType(p[1].typeList[idx])
             rawTp2 = helper.getBaseType(p[3].typeList[idx])
-            if not helper.compareType(rawTp1, rawTp2):
+            if not helper.compareType(p[1].typeList[idx], p[3].typeList[idx]):
                 err_ = str(rawTp1) + ' assigned to ' + str(rawTp2)
                 compilation_errors.add('TypeMismatch', line_number.get()+1, err_)
             info = helper.findInfo(p[1].placeList[idx])
@@ -1300,8 +1304,8 @@ def p_break(p):
         compilation_errors.add('Scope Error', line_number.get()+1, 'break is not in a loop')
         return
     symTab = helper.symbolTables[scope_]
-    p[0].code = [['goto', symTab.metadata['end']]]
-    p[0].scopeInfo = [['', '']]
+    p[0].code = CodeBuffer([['goto', symTab.metadata['end']]])
+    p[0].scopeInfo = CodeBuffer([['', '']])
 
 def p_continue(p):
     '''ContinueStmt : CONTINUE'''
@@ -1311,8 +1315,8 @@ def p_continue(p):
         compilation_errors.add('Scope Error', line_number.get()+1, 'continue is not in a loop')
         return
     symTab = helper.symbolTables[scope_]
-    p[0].code = [['goto', symTab.metadata['update']]]
-    p[0].scopeInfo = [['', '']]
+    p[0].code = CodeBuffer([['goto', symTab.metadata['update']]])
+    p[0].scopeInfo = CodeBuffer([['', '']])
 
 # -----------------------------------------------------------
 
@@ -1439,7 +1443,7 @@ def getCodeString(codeList):
             str_ += (x + ' ')
         return str_
 
-def generateCSV(filename):
+def generateCSV(filename, helper):
     import csv
     csvfile = filename
     writer = csv.writer(csvfile)
@@ -1471,63 +1475,146 @@ def generateCSV(filename):
         writer.writerow(['======','======','======','======','======'])
         writer.writerow(['','','','',''])
 
-parser = argparse.ArgumentParser(description='Does Semantic Analysis and generates 3AC')
-
-parser.add_argument('--code', dest='code_file_location', help='Location of the output .code file for 3AC', required=True)
-
-parser.add_argument('--csv', dest='csv_file_location', help='Location of the output .csv file for symbol tables', required=True)
-
-parser.add_argument('--input', dest='in_file_location', help='Location of the input .go file', required=True)
-
-parser.add_argument('--debug', dest='isDebug', help='for dubugging mode [t/F]', required=False)
-
-result = parser.parse_args()
-code_file_location = str(result.code_file_location)
-csv_file_location = str(result.csv_file_location)
-in_file_location = str(result.in_file_location)
-isDebug = str(result.isDebug)
-
-
-# Build lexer
-lexer = lex.lex()
-
-# Read input file
-in_file = open(in_file_location,'r')
-
-
-# CSV output File
-csv_file = open(csv_file_location,"w+")
-
-# 3AC output file
-code_file = open(code_file_location,"w+")
-
-data = in_file.read()
-
-# Iterate to get tokens
-parser = yacc.yacc()
-res = parser.parse(data)
-
-# Dubug Mode
-if isDebug in ['true', 't','T','True']:
-    helper.debug()
-    print("===== 3AC ====")
-    assert(len(rootNode.code)==len(rootNode.scopeInfo))
-    for idx in range(len(rootNode.code)):
-        print("-------------------------")
-        print(rootNode.code[idx])
-        print(rootNode.scopeInfo[idx])
-
-if compilation_errors.size() > 0:
-    sys.exit()
-generateCSV(csv_file)
-
-for idx_ in range(len(rootNode.code)):
-    code_file.write(getCodeString(rootNode.code[idx_]))
-    code_file.write('\n')
-
-code_file.close()
-in_file.close()
-
-import pickle as pkl
-pkl.dump(rootNode, open('rootNode.p', 'wb'))
-pkl.dump(helper, open('helper.p', 'wb'))
+# generated PLY tables: lextab_<hash>.py and parsetab_<hash>.py
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plytables')
+
+def grammarHash():
+    r'''
+    hash of everything the PLY tables are built from: the tokens, the
+    precedence, the productions and the token regular expressions (in the
+    order PLY tries them, line numbers left out)
+    '''
+    rules = [(name, rule) for name, rule in globals().items() if name[:2] in ['p_', 't_']]
+    # p_ rules live in this file and t_ rules in lexer.py, never mix their lines
+    functions = sorted([(name[:2], rule.__code__.co_firstlineno, name, rule.__doc__ or '')
+                        for name, rule in rules if callable(rule)])
+    strings = sorted([(name, rule) for name, rule in rules if isinstance(rule, str)])
+    spec = [repr(tokens), repr(precedence)]
+    spec += [name + ' ' + doc for prefix, line, name, doc in functions]
+    spec += [name + ' ' + rule for name, rule in strings]
+    return hashlib.sha1('\n'.join(spec).encode()).hexdigest()[:16]
+
+def loadTable(tableDir, name):
+    # the table module tableDir/name.py, or its name if it was not generated yet
+    path = os.path.join(tableDir, name + '.py')
+    if not os.path.exists(path):
+        return name
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def build(tableDir=TABLE_DIR):
+    r'''
+    returns (lexer, parser). Both use optimize mode with tables read from
+    tableDir, missing tables are generated there first. PLY does not check
+    tables in optimize mode, the grammar hash in their file names does.
+    '''
+    key = grammarHash()
+    try:
+        os.makedirs(tableDir, exist_ok=True)
+    except OSError:
+        # read only, PLY warns and builds the tables in memory
+        pass
+    lexer = lex.lex(optimize=1, lextab=loadTable(tableDir, 'lextab_' + key), outputdir=tableDir)
+    parser = yacc.yacc(debug=False, optimize=True, tabmodule=loadTable(tableDir, 'parsetab_' + key),
+                       outputdir=tableDir)
+    return lexer, parser
+
+class Compiler:
+    r'''
+    Parses any number of Go sources in one process: the lexer and the
+    parser are built once, every compile() starts from a fresh Helper, root
+    Node, error list and line counter. The grammar actions here and in
+    lexer.py reach that state through the module level helper, rootNode,
+    compilation_errors and line_number, which compile() points at the
+    current compilation, so one Compiler is used by one thread at a time.
+    '''
+    def __init__(self, tableDir=TABLE_DIR):
+        self.lexer, self.parser = build(tableDir)
+        self.errors = None
+
+    def compile(self, data, isDebug=False):
+        r'''
+        runs the lexer and the parser over the source text data, returns
+        (helper, rootNode) with the symbol tables and the 3AC, None on
+        errors (kept in self.errors)
+        '''
+        global helper, rootNode, compilation_errors, line_number
+        helper = Helper()
+        rootNode = Node('rootNode')
+        helper.newScope()
+        compilation_errors = lexRules.compilation_errors = Errors()
+        line_number = lexRules.line_number = LineCount()
+        self.errors = compilation_errors
+        self.lexer.lineno = 1
+
+        res = self.parser.parse(data, lexer=self.lexer)
+
+        # Dubug Mode
+        if isDebug:
+            helper.debug()
+            print("===== 3AC ====")
+            assert(len(rootNode.code)==len(rootNode.scopeInfo))
+            for idx in range(len(rootNode.code)):
+                print("-------------------------")
+                print(rootNode.code[idx])
+                print(rootNode.scopeInfo[idx])
+
+        if compilation_errors.size() > 0:
+            return None
+        return helper, rootNode
+
+def parse(data, isDebug=False):
+    # a single compilation, see Compiler
+    return Compiler().compile(data, isDebug)
+
+def writeCode(filename, rootNode):
+    code_file = open(filename, "w+")
+    for idx_ in range(len(rootNode.code)):
+        code_file.write(getCodeString(rootNode.code[idx_]))
+        code_file.write('\n')
+    code_file.close()
+
+def writePickles(helper, rootNode):
+    # helper.p and rootNode.p in the current directory, read by codeGen.py
+    import pickle as pkl
+    pkl.dump(rootNode, open('rootNode.p', 'wb'))
+    pkl.dump(helper, open('helper.p', 'wb'))
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser(description='Does Semantic Analysis and generates 3AC')
+
+    argParser.add_argument('--code', dest='code_file_location', help='Location of the output .code file for 3AC', required=True)
+
+    argParser.add_argument('--csv', dest='csv_file_location', help='Location of the output .csv file for symbol tables', required=True)
+
+    argParser.add_argument('--input', dest='in_file_location', help='Location of the input .go file', required=True)
+
+    argParser.add_argument('--debug', dest='isDebug', help='for dubugging mode [t/F]', required=False)
+
+    argParser.add_argument('--pickle', dest='pickle', help='write helper.p and rootNode.p for codeGen.py [t/F]', default='f')
+
+    result = argParser.parse_args()
+    isDebug = str(result.isDebug) in ['true', 't','T','True']
+
+    # Read input file
+    in_file = open(str(result.in_file_location),'r')
+    data = in_file.read()
+    in_file.close()
+
+    parsed = parse(data, isDebug)
+    if parsed is None:
+        sys.exit()
+    helper, rootNode = parsed
+
+    # CSV output File
+    csv_file = open(str(result.csv_file_location),"w+")
+    generateCSV(csv_file, helper)
+    csv_file.close()
+
+    # 3AC output file
+    writeCode(str(result.code_file_location), rootNode)
+
+    if result.pickle == 't':
+        writePickles(helper, rootNode)
@@ -0,0 +1,155 @@
+import re
+
+REG32 = ['eax', 'ebx', 'ecx', 'edx', 'esi', 'edi']
+
+regRe = r'(e[abcd]x|e[sd]i)'
+memRe = r'(\[[^\]]+\])'
+storeRe = re.compile(r'^mov ' + memRe + r',\s*' + regRe + r'$')
+loadRe = re.compile(r'^mov ' + regRe + r',\s*' + memRe + r'$')
+moveRe = re.compile(r'^mov ' + regRe + r',\s*' + regRe + r'$')
+pushRe = re.compile(r'^push ' + regRe + r'$')
+popRe = re.compile(r'^pop ' + regRe + r'$')
+jmpRe = re.compile(r'^jmp (\S+)$')
+cmpRe = re.compile(r'^cmp ([^,]+),\s*(.+)$')
+setRe = re.compile(r'^set\w+ al$')
+eaxRe = re.compile(r'\b(eax|ax|al|ah)\b')
+# mov of an immediate or a register into a register
+setRegRe = re.compile(r'^mov ' + regRe + r',\s*(-?\d+|0b[01]+|' + regRe + r')$')
+
+
+def isLabel(line):
+    return line[-1:] == ':'
+
+
+class PeepholeOptimizer:
+    r'''
+    Peephole optimization over the x86 emitted by CodeGenerator.
+    A rule is called with (code, idx) and either returns None or a pair
+    (number of lines consumed at idx, replacement lines). Rules are tried in
+    order at every line, and the whole pass is repeated until no rule fires.
+    stats maps every rule name to the number of instructions it removed.
+
+    Rules rely on the conventions of codeGen.py: esi/edi are scratch registers
+    of a single emitter and eax only carries a value out of a relational
+    operator into its destination, so none of them are live across 3AC
+    instructions (see regAlloc.ALLOCATABLE).
+    '''
+    def __init__(self):
+        self.rules = []
+        self.stats = {}
+        self.register('store_load', self.storeLoad)
+        self.register('repeated_move', self.repeatedMove)
+        self.register('self_move', self.selfMove)
+        self.register('push_pop', self.pushPop)
+        self.register('call_cleanup', self.callCleanup)
+        self.register('jump_to_next', self.jumpToNext)
+        self.register('setcc_zero_extend', self.zeroExtend)
+
+    def register(self, name, rule):
+        self.rules.append((name, rule))
+        self.stats[name] = 0
+
+    def run(self, code, start=0):
+        r'''
+        code: list of asm lines, only code[start:] is rewritten
+        returns the optimized list
+        '''
+        while True:
+            changed = False
+            result = code[:start]
+            idx = start
+            while idx < len(code):
+                for name, rule in self.rules:
+                    match = rule(code, idx)
+                    if match is not None:
+                        used, replacement = match
+                        result += replacement
+                        self.stats[name] += used - len(replacement)
+                        idx += used
+                        changed = True
+                        break
+                else:
+                    result.append(code[idx])
+                    idx += 1
+            code = result
+            if not changed:
+                return code
+
+    def storeLoad(self, code, idx):
+        # mov [x], r1 / mov r2, [x]  ->  mov [x], r1 / mov r2, r1
+        if idx + 1 >= len(code):
+            return None
+        store = storeRe.match(code[idx])
+        if store is None:
+            return None
+        load = loadRe.match(code[idx + 1])
+        if load is None or load.group(2) != store.group(1):
+            return None
+        if load.group(1) == store.group(2):
+            return 2, [code[idx]]
+        return 2, [code[idx], 'mov ' + load.group(1) + ', ' + store.group(2)]
+
+    def repeatedMove(self, code, idx):
+        # mov r, x / mov [m], r / mov r, x  ->  drop the second mov r, x
+        if idx + 2 >= len(code) or code[idx] != code[idx + 2]:
+            return None
+        move = setRegRe.match(code[idx])
+        if move is None or move.group(1) == move.group(3):
+            return None
+        store = storeRe.match(code[idx + 1])
+        if store is None or store.group(2) != move.group(1):
+            return None
+        return 3, code[idx:idx + 2]
+
+    def selfMove(self, code, idx):
+        move = moveRe.match(code[idx])
+        if move is None or move.group(1) != move.group(2):
+            return None
+        return 1, []
+
+    def pushPop(self, code, idx):
+        if idx + 1 >= len(code):
+            return None
+        push = pushRe.match(code[idx])
+        pop = popRe.match(code[idx + 1])
+        if push is None or pop is None or push.group(1) != pop.group(1):
+            return None
+        return 2, []
+
+    def callCleanup(self, code, idx):
+        # call f / pop esi / pop esi  ->  call f / add esp, 8
+        if code[idx][:5] != 'call ':
+            return None
+        end = idx + 1
+        while end < len(code) and code[end] in ['pop esi', 'pop edi']:
+            end += 1
+        if end - idx - 1 < 2:
+            return None
+        return end - idx, [code[idx], 'add esp, ' + str(4 * (end - idx - 1))]
+
+    def jumpToNext(self, code, idx):
+        jmp = jmpRe.match(code[idx])
+        if jmp is None:
+            return None
+        target = jmp.group(1) + ':'
+        end = idx + 1
+        while end < len(code) and isLabel(code[end]):
+            if code[end] == target:
+                return 1, []
+            end += 1
+        return None
+
+    def zeroExtend(self, code, idx):
+        # xor eax, eax / cmp a, b / setcc al / mov r, eax
+        #   ->  cmp a, b / setcc al / movzx r, al
+        if code[idx] != 'xor eax, eax' or idx + 3 >= len(code):
+            return None
+        cmp = cmpRe.match(code[idx + 1])
+        if cmp is None or eaxRe.search(code[idx + 1]) is not None:
+            return None
+        if setRe.match(code[idx + 2]) is None:
+            return None
+        move = moveRe.match(code[idx + 3])
+        if move is None or move.group(2) != 'eax' or move.group(1) == 'eax':
+            return None
+        return 4, [code[idx + 1], code[idx + 2], 'movzx ' + move.group(1) + ', al']
@@ -0,0 +1,10 @@
+# lextab_f5cde6e7f85f272a.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD', 'ADD_ASSIGN', 'AND', 'AND_ASSIGN', 'ASSIGN', 'BOOL', 'BREAK', 'COMMA', 'CONST', 'CONTINUE', 'DEC', 'DEFINE', 'ELSE', 'EQL', 'FALSE', 'FLOAT', 'FLOAT_LITERAL', 'FOR', 'FUNC', 'GEQ', 'GTR', 'IDENT', 'IF', 'IMPORT', 'INC', 'INT', 'INT_LITERAL', 'LAND', 'LBRACE', 'LBRACK', 'LEQ', 'LOR', 'LPAREN', 'LSS', 'MUL', 'MUL_ASSIGN', 'NEQ', 'NIL', 'NOT', 'OR', 'OR_ASSIGN', 'PACKAGE', 'PERIOD', 'PRINT', 'QUO', 'QUO_ASSIGN', 'RBRACE', 'RBRACK', 'REM', 'REM_ASSIGN', 'RETURN', 'RPAREN', 'SCAN', 'SEMICOLON', 'SHL', 'SHL_ASSIGN', 'SHR', 'SHR_ASSIGN', 'STRING', 'STRING_LITERAL', 'STRUCT', 'SUB', 'SUB_ASSIGN', 'TRUE', 'TYPE', 'TYPECAST', 'VAR', 'XOR', 'XOR_ASSIGN'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENT>[_A-Za-z]([_A-Za-z]|[0-9])*)|(?P<t_NL>\\n+)|(?P<t_COMMENT>(//.*)|(/\\*(.|\\n)*?)\\*/)|(?P<t_STRING_LITERAL>(\\"(.|\\n)*?)\\")|(?P<t_FLOAT_LITERAL>([0-9]([0-9])*\\.([0-9]([0-9])*)?((e|E)(\\+|-)?[0-9]([0-9])*)?)|([0-9]([0-9])*(e|E)(\\+|-)?[0-9]([0-9])*)|(\\.[0-9]([0-9])*((e|E)(\\+|-)?[0-9]([0-9])*)?))|(?P<t_INT_LITERAL>[1-9][0-9]*|0[0-7]*|0[xX][0-9a-fA-F]+)|(?P<t_LOR>\\|\\|)|(?P<t_INC>\\+\\+)|(?P<t_ADD_ASSIGN>\\+=)|(?P<t_MUL_ASSIGN>\\*=)|(?P<t_ADD>\\+)|(?P<t_MUL>\\*)|(?P<t_SUB_ASSIGN>-=)|(?P<t_QUO_ASSIGN>/=)|(?P<t_REM_ASSIGN>%=)|(?P<t_OR>\\|)|(?P<t_XOR>\\^)|(?P<t_SHL><<)|(?P<t_SHR>>>)|(?P<t_LAND>&&)|(?P<t_DEC>--)|(?P<t_EQL>==)|(?P<t_NEQ>!=)|(?P<t_LEQ><=)|(?P<t_GEQ>>=)|(?P<t_DEFINE>:=)|(?P<t_LPAREN>\\()|(?P<t_LBRACK>\\[)|(?P<t_LBRACE>\\{)|(?P<t_PERIOD>\\.)|(?P<t_RPAREN>\\))|(?P<t_RBRACK>\\])|(?P<t_RBRACE>\\})|(?P<t_SUB>-)|(?P<t_QUO>/)|(?P<t_REM>%)|(?P<t_AND>&)|(?P<t_LSS><)|(?P<t_GTR>>)|(?P<t_ASSIGN>=)|(?P<t_NOT>!)|(?P<t_COMMA>,)|(?P<t_SEMICOLON>;)', [None, ('t_IDENT', 'IDENT'), None, ('t_NL', 'NL'), ('t_COMMENT', 'COMMENT'), None, None, None, ('t_STRING_LITERAL', 'STRING_LITERAL'), None, None, (None, 'FLOAT_LITERAL'), None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, (None, 'INT_LITERAL'), (None, 'LOR'), (None, 'INC'), (None, 'ADD_ASSIGN'), (None, 'MUL_ASSIGN'), (None, 'ADD'), (None, 'MUL'), (None, 'SUB_ASSIGN'), (None, 'QUO_ASSIGN'), (None, 'REM_ASSIGN'), (None, 'OR'), (None, 'XOR'), (None, 'SHL'), (None, 'SHR'), (None, 'LAND'), (None, 'DEC'), (None, 'EQL'), (None, 'NEQ'), (None, 'LEQ'), (None, 'GEQ'), (None, 'DEFINE'), (None, 'LPAREN'), (None, 'LBRACK'), (None, 'LBRACE'), (None, 'PERIOD'), (None, 'RPAREN'), (None, 'RBRACK'), (None, 'RBRACE'), (None, 'SUB'), (None, 'QUO'), (None, 'REM'), (None, 'AND'), (None, 'LSS'), (None, 'GTR'), (None, 'ASSIGN'), (None, 'NOT'), (None, 'COMMA'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
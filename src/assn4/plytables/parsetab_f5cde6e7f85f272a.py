@@ -0,0 +1,223 @@
+
+# parsetab_f5cde6e7f85f272a.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'rightASSIGNNOTleftLORleftLANDleftORleftXORleftANDleftEQLNEQleftLSSGTRLEQGEQleftSHLSHRleftADDSUBleftMULQUOREMADD ADD_ASSIGN AND AND_ASSIGN ASSIGN BOOL BREAK COMMA CONST CONTINUE DEC DEFINE ELSE EQL FALSE FLOAT FLOAT_LITERAL FOR FUNC GEQ GTR IDENT IF IMPORT INC INT INT_LITERAL LAND LBRACE LBRACK LEQ LOR LPAREN LSS MUL MUL_ASSIGN NEQ NIL NOT OR OR_ASSIGN PACKAGE PERIOD PRINT QUO QUO_ASSIGN RBRACE RBRACK REM REM_ASSIGN RETURN RPAREN SCAN SEMICOLON SHL SHL_ASSIGN SHR SHR_ASSIGN STRING STRING_LITERAL STRUCT SUB SUB_ASSIGN TRUE TYPE TYPECAST VAR XOR XOR_ASSIGNstart : SourceFileType : TypeToken\n                    | TypeLit\n                    | LPAREN Type RPARENTypeToken : INT\n                             | FLOAT\n                             | STRING\n                             | BOOL\n                             | TYPE IDENTTypeLit : ArrayType\n                       | StructType\n                       | PointerTypeArrayType : LBRACK ArrayLength RBRACK ElementType ArrayLength : INT_LITERAL\n                            | epsilon ElementType : Type StructType : STRUCT LBRACE structInit FieldDeclRep RBRACE structDeInitstructInit : epsilonstructDeInit : epsilon FieldDeclRep : FieldDeclRep FieldDecl SEMICOLON\n                                    | epsilon  FieldDecl : IdentifierList TypePointerType : MUL BaseTypeBaseType : TypeSignature : LPAREN ParameterListOpt RPAREN ResultOptResultOpt : Type\n                             | epsilonParameterListOpt : ParameterDeclCommaRep\n                                                     | epsilonParameterDeclCommaRep : ParameterDeclCommaRep COMMA ParameterDecl\n                                                     | ParameterDeclParameterDecl : IDENT Type Block : LBRACE StatementList RBRACEStatementList : StatementRepStatementRep : StatementRep Statement SEMICOLON\n                                    | epsilonDeclaration : ConstDecl\n                                   | TypeDecl\n                                   | VarDeclTopLevelDecl : Declaration\n                                    | FunctionDeclConstDecl : CONST ConstSpec\n                             | CONST LPAREN ConstSpecRep RPARENConstSpecRep : ConstSpecRep ConstSpec SEMICOLON\n                                    | epsilonConstSpec : IdentifierList Type ASSIGN ExpressionListIdentifierList : IDENT IdentifierRepIdentifierRep : IdentifierRep COMMA IDENT\n                                     | epsilonExpressionList : Expression ExpressionRepExpressionRep : ExpressionRep COMMA Expression\n                                     | epsilonTypeDecl : TYPE TypeSpec\n                            | TYPE LPAREN TypeSpecRep RPARENTypeSpecRep : TypeSpecRep TypeSpec SEMICOLON\n                               | epsilonTypeSpec : AliasDecl\n                            | TypeDefAliasDecl : IDENT ASSIGN TypeTypeDef : IDENT TypeVarDecl : VAR VarSpec\n                       | VAR LPAREN VarSpecRep RPARENVarSpecRep : VarSpecRep VarSpec SEMICOLON\n                              | epsilonVarSpec : IdentifierList Type ExpressionListOpt\n                       | IdentifierList ASSIGN ExpressionListExpressionListOpt : ASSIGN ExpressionList\n                                             | epsilon ShortVarDecl : IDENT DEFINE Expression FunctionDecl : FUNC FunctionName CreateScope Function EndScope FunctionName : IDENTFunction : Signature FunctionBodyFunctionBody : Block\n                    | epsilonCreateScope : EndScope : Operand : BasicLit\n                       | OperandName\n                       | LPAREN Expression RPARENBasicLit : IntLit\n                | FloatLit\n                | StringLit\n                | BoolLit\n                IntLit : INT_LITERALFloatLit : FLOAT_LITERALStringLit : STRING_LITERALBoolLit : TRUE\n                    | FALSEOperandName : IDENTPrimaryExpr : Operand\n                               | PrimaryExpr Selector\n                               | Conversion\n                               | PrimaryExpr Index\n                               | IDENT ArgumentsSelector : PERIOD IDENTIndex : LBRACK Expression RBRACKArguments : LPAREN ExpressionListTypeOpt RPARENExpressionListTypeOpt : ExpressionList\n                                                     | epsilonExpression : UnaryExpr\n                              | Expression BinaryOp ExpressionUnaryExpr : PrimaryExpr\n                             | UnaryOp UnaryExpr\n                             | NOT UnaryExprBinaryOp : LOR\n                            | LAND\n                            | RelOp\n                            | AddMulOpRelOp : EQL\n                     | NEQ\n                     | LSS\n                     | GTR\n                     | LEQ\n                     | GEQAddMulOp : UnaryOp\n                            | OR\n                            | XOR\n                            | QUO\n                            | REM\n                            | SHL\n                            | SHRUnaryOp : ADD\n                       | SUB\n                       | MUL\n                       | AND Conversion : TYPECAST Type LPAREN Expression RPARENStatement : Declaration\n                             | SimpleStmt\n                             | ReturnStmt\n                             | BreakStmt\n                             | ContinueStmt\n                             | CreateScope Block EndScope\n                             | IfStmt\n                             | ForStmt\n                             | PrintStmt\n                             | ScanStmt SimpleStmt : epsilon\n                                   | ExpressionStmt\n                                   | IncDecStmt\n                                   | Assignment\n                                   | ShortVarDecl  ExpressionStmt : Expression  IncDecStmt : Expression INC\n                                   | Expression DEC  Assignment : ExpressionList assign_op ExpressionList assign_op : AssignOp AssignOp : ADD_ASSIGN\n                             | SUB_ASSIGN\n                             | MUL_ASSIGN\n                             | QUO_ASSIGN\n                             | REM_ASSIGN\n                             | AND_ASSIGN\n                             | OR_ASSIGN\n                             | XOR_ASSIGN\n                             | SHL_ASSIGN\n                             | SHR_ASSIGN\n                             | ASSIGN  IfStmt : IF CreateScope Expression Block ElseOpt EndScope ElseOpt : ELSE CreateScope IfStmt EndScope\n                            | ELSE CreateScope Block EndScope\n                            | epsilon PrintStmt : PRINT ExpressionListScanStmt : SCAN ExpressionListForStmt : FOR CreateScope ConditionBlockOpt Block EndScopeConditionBlockOpt : epsilon\n                           | Condition\n                           | ForClauseCondition : ExpressionForClause : SimpleStmt SEMICOLON ConditionOpt SEMICOLON SimpleStmtConditionOpt : epsilon\n                    | ConditionReturnStmt : RETURN ExpressionListPureOptExpressionListPureOpt : ExpressionList\n                           | epsilonBreakStmt : BREAKContinueStmt : CONTINUESourceFile : PackageClause SEMICOLON ImportDeclRep TopLevelDeclRepImportDeclRep : epsilon\n                     | ImportDeclRep ImportDecl SEMICOLONTopLevelDeclRep : TopLevelDeclRep TopLevelDecl SEMICOLON\n                                           | epsilonPackageClause : PACKAGE PackageNamePackageName : IDENTImportDecl : IMPORT ImportSpec\n                    | IMPORT LPAREN ImportSpecRep RPAREN  ImportSpecRep : ImportSpecRep ImportSpec SEMICOLON\n                          | epsilon  ImportSpec : PackageNameDotOpt ImportPath  PackageNameDotOpt : PERIOD\n                                                  | PackageName\n                                                  | epsilon ImportPath : STRING_LITERAL epsilon : '
+    
+_lr_action_items = {'PACKAGE':([0,],[4,]),'$end':([1,2,5,8,9,10,12,24,31,],[0,-1,-193,-193,-178,-177,-181,-179,-180,]),'SEMICOLON':([3,6,7,11,14,15,16,17,18,19,25,34,38,40,41,43,48,49,54,55,57,58,59,60,62,63,64,73,76,78,79,80,81,83,84,87,92,93,95,96,97,98,99,100,102,103,104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,130,131,132,133,134,141,142,149,150,152,170,171,174,175,176,181,182,183,186,187,191,192,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,220,221,225,226,227,228,230,231,233,234,235,237,238,239,240,241,243,244,245,246,260,262,263,265,266,267,270,273,274,275,276,277,278,279,280,282,283,284,285,286,287,288,291,292,294,295,],[5,-182,-183,24,31,-40,-41,-37,-38,-39,-184,-42,-53,-57,-58,-61,-188,-192,-2,-3,-5,-6,-7,-8,-10,-11,-12,-60,-193,-185,129,-76,-193,-43,140,-9,-23,-24,-54,147,-59,-62,148,-65,-68,-66,-193,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-70,-72,-73,-74,-193,-46,-4,-67,-50,-52,-91,-93,-103,-104,-94,-193,-36,-193,-13,-16,-101,-95,-79,-33,237,-127,-128,-129,-130,-131,-133,-134,-135,-136,-137,-138,-139,-140,-141,-193,-175,-176,-142,-75,-89,-25,-26,-27,-193,264,-51,-96,-97,-35,-76,-172,-173,-174,-143,-144,-193,-162,-163,-17,-19,-22,-126,-132,-137,-142,279,-145,-69,-193,-76,-193,-76,-161,-164,290,-170,-171,-168,-158,-76,-76,-159,-160,]),'IDENT':([4,13,20,21,22,23,26,35,39,44,46,47,51,52,61,70,71,74,75,77,82,85,91,94,101,107,108,112,113,114,115,118,129,134,140,144,145,147,148,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,172,173,177,181,182,184,188,189,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,264,279,290,],[7,7,33,37,42,37,-193,-193,-193,-193,7,-187,37,-45,87,42,-56,37,-64,111,139,111,-193,146,111,111,111,-122,-123,-124,-125,111,-186,-193,-44,-193,-18,-55,-63,111,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,192,111,111,225,-36,139,37,-21,111,111,111,-75,-75,111,111,-35,111,225,111,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,111,-20,111,225,]),'IMPORT':([5,8,9,24,],[-193,13,-178,-179,]),'FUNC':([5,8,9,10,12,24,31,],[-193,-193,-178,20,-181,-179,-180,]),'CONST':([5,8,9,10,12,24,31,134,181,182,237,],[-193,-193,-178,21,-181,-179,-180,-193,21,-36,-35,]),'TYPE':([5,8,9,10,12,24,31,36,37,42,45,56,67,68,69,72,119,134,139,143,146,181,182,183,232,237,],[-193,-193,-178,22,-181,-179,-180,61,-193,61,61,61,61,-47,-49,61,61,-193,61,61,-48,22,-36,61,61,-35,]),'VAR':([5,8,9,10,12,24,31,134,181,182,237,],[-193,-193,-178,23,-181,-179,-180,-193,23,-36,-35,]),'STRING_LITERAL':([7,13,26,27,28,29,30,46,47,77,85,101,107,108,112,113,114,115,118,129,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[-183,-193,-193,49,-189,-190,-191,-193,-187,126,126,126,126,126,-122,-123,-124,-125,126,-186,-193,126,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,126,126,126,-36,126,126,126,-75,-75,126,126,-35,126,126,126,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,126,126,126,]),'LPAREN':([13,21,22,23,32,33,36,37,42,45,50,54,55,56,57,58,59,60,62,63,64,67,68,69,72,77,85,87,92,93,101,107,108,111,112,113,114,115,118,119,134,139,142,143,146,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,179,181,182,183,186,187,190,198,216,219,221,222,224,225,230,232,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,262,263,279,290,],[26,35,39,44,-75,-71,56,-193,56,56,82,-2,-3,56,-5,-6,-7,-8,-10,-11,-12,56,-47,-49,56,118,118,-9,-23,-24,118,118,118,177,-122,-123,-124,-125,118,56,-193,56,-4,56,-48,118,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,118,118,198,118,-36,56,-13,-16,118,118,118,-75,-75,118,118,177,-193,56,-35,118,118,118,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,118,-17,-19,118,118,]),'PERIOD':([13,26,46,47,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,129,170,171,176,192,197,225,234,235,266,],[28,-193,28,-187,172,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-186,-91,-93,-94,-95,-79,-89,-96,-97,-126,]),'RPAREN':([26,35,39,44,46,47,51,52,54,55,57,58,59,60,62,63,64,70,71,74,75,82,86,87,92,93,104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,129,135,136,137,138,140,142,147,148,150,152,170,171,174,175,176,177,178,185,186,187,191,192,194,195,196,197,229,230,233,234,235,236,262,263,266,],[-193,-193,-193,-193,78,-187,83,-45,-2,-3,-5,-6,-7,-8,-10,-11,-12,95,-56,98,-64,-193,142,-9,-23,-24,-193,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-186,183,-28,-29,-31,-44,-4,-55,-63,-50,-52,-91,-93,-103,-104,-94,-193,197,-32,-13,-16,-101,-95,235,-98,-99,-79,-30,-193,-51,-96,-97,266,-17,-19,-126,]),'INT':([36,37,42,45,56,67,68,69,72,119,139,143,146,183,232,],[57,-193,57,57,57,57,-47,-49,57,57,57,57,-48,57,57,]),'FLOAT':([36,37,42,45,56,67,68,69,72,119,139,143,146,183,232,],[58,-193,58,58,58,58,-47,-49,58,58,58,58,-48,58,58,]),'STRING':([36,37,42,45,56,67,68,69,72,119,139,143,146,183,232,],[59,-193,59,59,59,59,-47,-49,59,59,59,59,-48,59,59,]),'BOOL':([36,37,42,45,56,67,68,69,72,119,139,143,146,183,232,],[60,-193,60,60,60,60,-47,-49,60,60,60,60,-48,60,60,]),'LBRACK':([36,37,42,45,56,67,68,69,72,106,109,110,111,116,117,119,120,121,122,123,124,125,126,127,128,139,143,146,170,171,176,183,192,197,225,232,234,235,266,],[65,-193,65,65,65,65,-47,-49,65,173,-90,-92,-89,-77,-78,65,-80,-81,-82,-83,-84,-85,-86,-87,-88,65,65,-48,-91,-93,-94,65,-95,-79,-89,65,-96,-97,-126,]),'STRUCT':([36,37,42,45,56,67,68,69,72,119,139,143,146,183,232,],[66,-193,66,66,66,66,-47,-49,66,66,66,66,-48,66,66,]),'MUL':([36,37,42,45,56,67,68,69,72,77,85,101,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,134,139,143,146,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,178,181,182,183,190,191,192,193,197,198,216,219,220,221,222,224,225,232,233,234,235,236,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,266,268,273,276,279,287,290,],[67,-193,67,67,67,67,-47,-49,67,114,114,114,114,-100,-102,114,114,-90,-92,-89,-122,-123,-124,-125,-77,-78,114,67,-80,-81,-82,-83,-84,-85,-86,-87,-88,-193,67,67,-48,114,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-91,-93,114,-103,-104,-94,114,114,114,-36,67,114,114,-95,114,-79,114,114,-75,114,-75,114,114,-89,67,114,-96,-97,114,-35,114,114,114,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,114,-126,114,114,114,114,114,114,]),'COMMA':([37,54,55,57,58,59,60,62,63,64,68,69,87,92,93,104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,136,138,142,146,150,152,170,171,174,175,176,185,186,187,191,192,197,220,225,229,230,233,234,235,262,263,266,273,],[-193,-2,-3,-5,-6,-7,-8,-10,-11,-12,94,-49,-9,-23,-24,-193,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,184,-31,-4,-48,190,-52,-91,-93,-103,-104,-94,-32,-13,-16,-101,-95,-79,-193,-89,-30,-193,-51,-96,-97,-17,-19,-126,-193,]),'ASSIGN':([37,42,45,53,54,55,57,58,59,60,62,63,64,68,69,76,87,92,93,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,142,146,150,152,170,171,174,175,176,186,187,191,192,197,220,223,225,230,233,234,235,262,263,266,273,],[-193,72,77,85,-2,-3,-5,-6,-7,-8,-10,-11,-12,-47,-49,101,-9,-23,-24,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-4,-48,-50,-52,-91,-93,-103,-104,-94,-13,-16,-101,-95,-79,-193,259,-89,-193,-51,-96,-97,-17,-19,-126,-193,]),'LBRACE':([54,55,57,58,59,60,62,63,64,66,81,87,92,93,104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,134,142,150,152,170,171,174,175,176,181,182,183,186,187,191,192,197,206,211,212,213,214,215,220,221,225,226,227,228,230,233,234,235,237,243,244,245,262,263,266,268,269,270,271,272,273,275,276,281,289,290,293,],[-2,-3,-5,-6,-7,-8,-10,-11,-12,91,134,-9,-23,-24,-193,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-193,-4,-50,-52,-91,-93,-103,-104,-94,-75,-36,-193,-13,-16,-101,-95,-79,134,-137,-138,-139,-140,-141,-142,-75,-89,-25,-26,-27,-193,-51,-96,-97,-35,-143,-144,-193,-17,-19,-126,134,134,-165,-166,-167,-168,-145,-69,-75,134,-193,-169,]),'INT_LITERAL':([65,77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[89,124,124,124,124,124,-122,-123,-124,-125,124,-193,124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,124,124,124,-36,124,124,124,-75,-75,124,124,-35,124,124,124,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,124,124,124,]),'RBRACK':([65,88,89,90,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,191,192,193,197,234,235,266,],[-193,143,-14,-15,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,-101,-95,234,-79,-96,-97,-126,]),'NOT':([77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[108,108,108,108,108,-122,-123,-124,-125,108,-193,108,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,108,108,108,-36,108,108,108,-75,-75,108,108,-35,108,108,108,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,108,108,108,]),'ADD':([77,85,101,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,128,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,178,181,182,190,191,192,193,197,198,216,219,220,221,222,224,225,233,234,235,236,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,266,268,273,276,279,287,290,],[112,112,112,112,-100,-102,112,112,-90,-92,-89,-122,-123,-124,-125,-77,-78,112,-80,-81,-82,-83,-84,-85,-86,-87,-88,-193,112,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-91,-93,112,-103,-104,-94,112,112,112,-36,112,112,-95,112,-79,112,112,-75,112,-75,112,112,-89,112,-96,-97,112,-35,112,112,112,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,112,-126,112,112,112,112,112,112,]),'SUB':([77,85,101,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,128,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,178,181,182,190,191,192,193,197,198,216,219,220,221,222,224,225,233,234,235,236,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,266,268,273,276,279,287,290,],[113,113,113,113,-100,-102,113,113,-90,-92,-89,-122,-123,-124,-125,-77,-78,113,-80,-81,-82,-83,-84,-85,-86,-87,-88,-193,113,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-91,-93,113,-103,-104,-94,113,113,113,-36,113,113,-95,113,-79,113,113,-75,113,-75,113,113,-89,113,-96,-97,113,-35,113,113,113,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,113,-126,113,113,113,113,113,113,]),'AND':([77,85,101,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,121,122,123,124,125,126,127,128,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,178,181,182,190,191,192,193,197,198,216,219,220,221,222,224,225,233,234,235,236,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,266,268,273,276,279,287,290,],[115,115,115,115,-100,-102,115,115,-90,-92,-89,-122,-123,-124,-125,-77,-78,115,-80,-81,-82,-83,-84,-85,-86,-87,-88,-193,115,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-91,-93,115,-103,-104,-94,115,115,115,-36,115,115,-95,115,-79,115,115,-75,115,-75,115,115,-89,115,-96,-97,115,-35,115,115,115,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,115,-126,115,115,115,115,115,115,]),'TYPECAST':([77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[119,119,119,119,119,-122,-123,-124,-125,119,-193,119,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,119,119,119,-36,119,119,119,-75,-75,119,119,-35,119,119,119,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,119,119,119,]),'FLOAT_LITERAL':([77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[125,125,125,125,125,-122,-123,-124,-125,125,-193,125,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,125,125,125,-36,125,125,125,-75,-75,125,125,-35,125,125,125,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,125,125,125,]),'TRUE':([77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[127,127,127,127,127,-122,-123,-124,-125,127,-193,127,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,127,127,127,-36,127,127,127,-75,-75,127,127,-35,127,127,127,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,127,127,127,]),'FALSE':([77,85,101,107,108,112,113,114,115,118,134,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,173,177,181,182,190,198,216,219,221,222,224,237,242,245,247,248,249,250,251,252,253,254,255,256,257,258,259,261,279,290,],[128,128,128,128,128,-122,-123,-124,-125,128,-193,128,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,128,128,128,-36,128,128,128,-75,-75,128,128,-35,128,128,128,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-156,-157,128,128,128,]),'RBRACE':([91,134,144,145,180,181,182,188,189,237,264,],[-193,-193,-193,-18,199,-34,-36,230,-21,-35,-20,]),'LOR':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[153,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,153,153,-95,153,-79,153,-89,153,-96,-97,153,-126,153,153,153,153,]),'LAND':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[154,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,154,154,-95,154,-79,154,-89,154,-96,-97,154,-126,154,154,154,154,]),'EQL':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[157,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,157,157,-95,157,-79,157,-89,157,-96,-97,157,-126,157,157,157,157,]),'NEQ':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[158,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,158,158,-95,158,-79,158,-89,158,-96,-97,158,-126,158,158,158,158,]),'LSS':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[159,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,159,159,-95,159,-79,159,-89,159,-96,-97,159,-126,159,159,159,159,]),'GTR':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[160,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,160,160,-95,160,-79,160,-89,160,-96,-97,160,-126,160,160,160,160,]),'LEQ':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[161,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,161,161,-95,161,-79,161,-89,161,-96,-97,161,-126,161,161,161,161,]),'GEQ':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[162,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,162,162,-95,162,-79,162,-89,162,-96,-97,162,-126,162,162,162,162,]),'OR':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[164,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,164,164,-95,164,-79,164,-89,164,-96,-97,164,-126,164,164,164,164,]),'XOR':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[165,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,165,165,-95,165,-79,165,-89,165,-96,-97,165,-126,165,165,165,165,]),'QUO':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[166,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,166,166,-95,166,-79,166,-89,166,-96,-97,166,-126,166,166,166,166,]),'REM':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[167,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,167,167,-95,167,-79,167,-89,167,-96,-97,167,-126,167,167,167,167,]),'SHL':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[168,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,168,168,-95,168,-79,168,-89,168,-96,-97,168,-126,168,168,168,168,]),'SHR':([104,105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,178,191,192,193,197,220,225,233,234,235,236,266,268,273,276,287,],[169,-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,169,169,-95,169,-79,169,-89,169,-96,-97,169,-126,169,169,169,169,]),'INC':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,191,192,197,220,225,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,-101,-95,-79,243,-89,-96,-97,-126,243,]),'DEC':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,170,171,174,175,176,191,192,197,220,225,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-91,-93,-103,-104,-94,-101,-95,-79,244,-89,-96,-97,-126,244,]),'ADD_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,249,-89,-51,-96,-97,-126,-193,]),'SUB_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,250,-89,-51,-96,-97,-126,-193,]),'MUL_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,251,-89,-51,-96,-97,-126,-193,]),'QUO_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,252,-89,-51,-96,-97,-126,-193,]),'REM_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,253,-89,-51,-96,-97,-126,-193,]),'AND_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,254,-89,-51,-96,-97,-126,-193,]),'OR_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,255,-89,-51,-96,-97,-126,-193,]),'XOR_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,256,-89,-51,-96,-97,-126,-193,]),'SHL_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,257,-89,-51,-96,-97,-126,-193,]),'SHR_ASSIGN':([105,106,109,110,111,116,117,120,121,122,123,124,125,126,127,128,150,152,170,171,174,175,176,191,192,197,220,223,225,233,234,235,266,273,],[-100,-102,-90,-92,-89,-77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-50,-52,-91,-93,-103,-104,-94,-101,-95,-79,-193,258,-89,-51,-96,-97,-126,-193,]),'RETURN':([134,181,182,237,],[-193,216,-36,-35,]),'BREAK':([134,181,182,237,],[-193,217,-36,-35,]),'CONTINUE':([134,181,182,237,],[-193,218,-36,-35,]),'IF':([134,181,182,237,281,289,],[-193,219,-36,-35,-75,219,]),'FOR':([134,181,182,237,],[-193,221,-36,-35,]),'PRINT':([134,181,182,237,],[-193,222,-36,-35,]),'SCAN':([134,181,182,237,],[-193,224,-36,-35,]),'ELSE':([199,277,],[-33,281,]),'DEFINE':([225,],[261,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'SourceFile':([0,],[2,]),'PackageClause':([0,],[3,]),'PackageName':([4,13,46,],[6,29,29,]),'ImportDeclRep':([5,],[8,]),'epsilon':([5,8,13,26,35,37,39,44,46,65,76,81,82,91,104,134,144,177,181,183,216,220,230,245,273,277,279,290,],[9,12,30,47,52,69,71,75,30,90,102,133,137,145,152,182,189,196,211,228,241,152,263,270,152,282,285,211,]),'TopLevelDeclRep':([8,],[10,]),'ImportDecl':([8,],[11,]),'TopLevelDecl':([10,],[14,]),'Declaration':([10,181,],[15,201,]),'FunctionDecl':([10,],[16,]),'ConstDecl':([10,181,],[17,17,]),'TypeDecl':([10,181,],[18,18,]),'VarDecl':([10,181,],[19,19,]),'ImportSpec':([13,46,],[25,79,]),'PackageNameDotOpt':([13,46,],[27,27,]),'FunctionName':([20,],[32,]),'ConstSpec':([21,51,],[34,84,]),'IdentifierList':([21,23,51,74,188,],[36,45,36,45,232,]),'TypeSpec':([22,70,],[38,96,]),'AliasDecl':([22,70,],[40,40,]),'TypeDef':([22,70,],[41,41,]),'VarSpec':([23,74,],[43,99,]),'ImportSpecRep':([26,],[46,]),'ImportPath':([27,],[48,]),'CreateScope':([32,181,219,221,281,],[50,206,242,245,289,]),'ConstSpecRep':([35,],[51,]),'Type':([36,42,45,56,67,72,119,139,143,183,232,],[53,73,76,86,93,97,179,185,187,227,265,]),'TypeToken':([36,42,45,56,67,72,119,139,143,183,232,],[54,54,54,54,54,54,54,54,54,54,54,]),'TypeLit':([36,42,45,56,67,72,119,139,143,183,232,],[55,55,55,55,55,55,55,55,55,55,55,]),'ArrayType':([36,42,45,56,67,72,119,139,143,183,232,],[62,62,62,62,62,62,62,62,62,62,62,]),'StructType':([36,42,45,56,67,72,119,139,143,183,232,],[63,63,63,63,63,63,63,63,63,63,63,]),'PointerType':([36,42,45,56,67,72,119,139,143,183,232,],[64,64,64,64,64,64,64,64,64,64,64,]),'IdentifierRep':([37,],[68,]),'TypeSpecRep':([39,],[70,]),'VarSpecRep':([44,],[74,]),'Function':([50,],[80,]),'Signature':([50,],[81,]),'ArrayLength':([65,],[88,]),'BaseType':([67,],[92,]),'ExpressionListOpt':([76,],[100,]),'ExpressionList':([77,85,101,177,181,216,222,224,245,247,290,],[103,141,149,195,223,240,246,260,223,275,223,]),'Expression':([77,85,101,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[104,104,104,178,191,193,104,220,233,236,104,104,104,268,273,104,276,287,220,]),'UnaryExpr':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[105,105,105,174,175,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'PrimaryExpr':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'UnaryOp':([77,85,101,104,107,108,118,151,173,177,178,181,190,191,193,198,216,220,222,224,233,236,242,245,247,261,268,273,276,279,287,290,],[107,107,107,163,107,107,107,107,107,107,163,107,107,163,163,107,107,163,107,107,163,163,107,107,107,107,163,163,163,107,163,107,]),'Operand':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'Conversion':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,]),'BasicLit':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'OperandName':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'IntLit':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'FloatLit':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'StringLit':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,]),'BoolLit':([77,85,101,107,108,118,151,173,177,181,190,198,216,222,224,242,245,247,261,279,290,],[123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'EndScope':([80,238,278,280,291,292,],[130,267,283,288,294,295,]),'FunctionBody':([81,],[131,]),'Block':([81,206,268,269,289,],[132,238,277,278,292,]),'ParameterListOpt':([82,],[135,]),'ParameterDeclCommaRep':([82,],[136,]),'ParameterDecl':([82,184,],[138,229,]),'structInit':([91,],[144,]),'ExpressionRep':([104,220,273,],[150,150,150,]),'BinaryOp':([104,178,191,193,220,233,236,268,273,276,287,],[151,151,151,151,151,151,151,151,151,151,151,]),'RelOp':([104,178,191,193,220,233,236,268,273,276,287,],[155,155,155,155,155,155,155,155,155,155,155,]),'AddMulOp':([104,178,191,193,220,233,236,268,273,276,287,],[156,156,156,156,156,156,156,156,156,156,156,]),'Selector':([106,],[170,]),'Index':([106,],[171,]),'Arguments':([111,225,],[176,176,]),'StatementList':([134,],[180,]),'StatementRep':([134,],[181,]),'ElementType':([143,],[186,]),'FieldDeclRep':([144,],[188,]),'ExpressionListTypeOpt':([177,],[194,]),'Statement':([181,],[200,]),'SimpleStmt':([181,245,290,],[202,274,293,]),'ReturnStmt':([181,],[203,]),'BreakStmt':([181,],[204,]),'ContinueStmt':([181,],[205,]),'IfStmt':([181,289,],[207,291,]),'ForStmt':([181,],[208,]),'PrintStmt':([181,],[209,]),'ScanStmt':([181,],[210,]),'ExpressionStmt':([181,245,290,],[212,212,212,]),'IncDecStmt':([181,245,290,],[213,213,213,]),'Assignment':([181,245,290,],[214,214,214,]),'ShortVarDecl':([181,245,290,],[215,215,215,]),'ResultOpt':([183,],[226,]),'FieldDecl':([188,],[231,]),'ExpressionListPureOpt':([216,],[239,]),'assign_op':([223,],[247,]),'AssignOp':([223,],[248,]),'structDeInit':([230,],[262,]),'ConditionBlockOpt':([245,],[269,]),'Condition':([245,279,],[271,286,]),'ForClause':([245,],[272,]),'ElseOpt':([277,],[280,]),'ConditionOpt':([279,],[284,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> SourceFile','start',1,'p_start','parser.py',49),
+  ('Type -> TypeToken','Type',1,'p_type','parser.py',61),
+  ('Type -> TypeLit','Type',1,'p_type','parser.py',62),
+  ('Type -> LPAREN Type RPAREN','Type',3,'p_type','parser.py',63),
+  ('TypeToken -> INT','TypeToken',1,'p_type_token','parser.py',72),
+  ('TypeToken -> FLOAT','TypeToken',1,'p_type_token','parser.py',73),
+  ('TypeToken -> STRING','TypeToken',1,'p_type_token','parser.py',74),
+  ('TypeToken -> BOOL','TypeToken',1,'p_type_token','parser.py',75),
+  ('TypeToken -> TYPE IDENT','TypeToken',2,'p_type_token','parser.py',76),
+  ('TypeLit -> ArrayType','TypeLit',1,'p_type_lit','parser.py',87),
+  ('TypeLit -> StructType','TypeLit',1,'p_type_lit','parser.py',88),
+  ('TypeLit -> PointerType','TypeLit',1,'p_type_lit','parser.py',89),
+  ('ArrayType -> LBRACK ArrayLength RBRACK ElementType','ArrayType',4,'p_array_type','parser.py',98),
+  ('ArrayLength -> INT_LITERAL','ArrayLength',1,'p_array_length','parser.py',119),
+  ('ArrayLength -> epsilon','ArrayLength',1,'p_array_length','parser.py',120),
+  ('ElementType -> Type','ElementType',1,'p_element_type','parser.py',127),
+  ('StructType -> STRUCT LBRACE structInit FieldDeclRep RBRACE structDeInit','StructType',6,'p_struct_type','parser.py',136),
+  ('structInit -> epsilon','structInit',1,'p_structInit','parser.py',160),
+  ('structDeInit -> epsilon','structDeInit',1,'p_structDeInit','parser.py',164),
+  ('FieldDeclRep -> FieldDeclRep FieldDecl SEMICOLON','FieldDeclRep',3,'p_field_decl_rep','parser.py',168),
+  ('FieldDeclRep -> epsilon','FieldDeclRep',1,'p_field_decl_rep','parser.py',169),
+  ('FieldDecl -> IdentifierList Type','FieldDecl',2,'p_field_decl','parser.py',178),
+  ('PointerType -> MUL BaseType','PointerType',2,'p_point_type','parser.py',189),
+  ('BaseType -> Type','BaseType',1,'p_base_type','parser.py',197),
+  ('Signature -> LPAREN ParameterListOpt RPAREN ResultOpt','Signature',4,'p_sign','parser.py',206),
+  ('ResultOpt -> Type','ResultOpt',1,'p_result_opt','parser.py',223),
+  ('ResultOpt -> epsilon','ResultOpt',1,'p_result_opt','parser.py',224),
+  ('ParameterListOpt -> ParameterDeclCommaRep','ParameterListOpt',1,'p_param_list_opt','parser.py',231),
+  ('ParameterListOpt -> epsilon','ParameterListOpt',1,'p_param_list_opt','parser.py',232),
+  ('ParameterDeclCommaRep -> ParameterDeclCommaRep COMMA ParameterDecl','ParameterDeclCommaRep',3,'p_param_decl_comma_rep','parser.py',246),
+  ('ParameterDeclCommaRep -> ParameterDecl','ParameterDeclCommaRep',1,'p_param_decl_comma_rep','parser.py',247),
+  ('ParameterDecl -> IDENT Type','ParameterDecl',2,'p_param_decl','parser.py',259),
+  ('Block -> LBRACE StatementList RBRACE','Block',3,'p_block','parser.py',270),
+  ('StatementList -> StatementRep','StatementList',1,'p_stat_list','parser.py',277),
+  ('StatementRep -> StatementRep Statement SEMICOLON','StatementRep',3,'p_stat_rep','parser.py',283),
+  ('StatementRep -> epsilon','StatementRep',1,'p_stat_rep','parser.py',284),
+  ('Declaration -> ConstDecl','Declaration',1,'p_decl','parser.py',296),
+  ('Declaration -> TypeDecl','Declaration',1,'p_decl','parser.py',297),
+  ('Declaration -> VarDecl','Declaration',1,'p_decl','parser.py',298),
+  ('TopLevelDecl -> Declaration','TopLevelDecl',1,'p_toplevel_decl','parser.py',303),
+  ('TopLevelDecl -> FunctionDecl','TopLevelDecl',1,'p_toplevel_decl','parser.py',304),
+  ('ConstDecl -> CONST ConstSpec','ConstDecl',2,'p_const_decl','parser.py',312),
+  ('ConstDecl -> CONST LPAREN ConstSpecRep RPAREN','ConstDecl',4,'p_const_decl','parser.py',313),
+  ('ConstSpecRep -> ConstSpecRep ConstSpec SEMICOLON','ConstSpecRep',3,'p_const_spec_rep','parser.py',329),
+  ('ConstSpecRep -> epsilon','ConstSpecRep',1,'p_const_spec_rep','parser.py',330),
+  ('ConstSpec -> IdentifierList Type ASSIGN ExpressionList','ConstSpec',4,'p_const_spec','parser.py',341),
+  ('IdentifierList -> IDENT IdentifierRep','IdentifierList',2,'p_identifier_list','parser.py',361),
+  ('IdentifierRep -> IdentifierRep COMMA IDENT','IdentifierRep',3,'p_identifier_rep','parser.py',374),
+  ('IdentifierRep -> epsilon','IdentifierRep',1,'p_identifier_rep','parser.py',375),
+  ('ExpressionList -> Expression ExpressionRep','ExpressionList',2,'p_expr_list','parser.py',388),
+  ('ExpressionRep -> ExpressionRep COMMA Expression','ExpressionRep',3,'p_expr_rep','parser.py',398),
+  ('ExpressionRep -> epsilon','ExpressionRep',1,'p_expr_rep','parser.py',399),
+  ('TypeDecl -> TYPE TypeSpec','TypeDecl',2,'p_type_decl','parser.py',417),
+  ('TypeDecl -> TYPE LPAREN TypeSpecRep RPAREN','TypeDecl',4,'p_type_decl','parser.py',418),
+  ('TypeSpecRep -> TypeSpecRep TypeSpec SEMICOLON','TypeSpecRep',3,'p_type_spec_rep','parser.py',427),
+  ('TypeSpecRep -> epsilon','TypeSpecRep',1,'p_type_spec_rep','parser.py',428),
+  ('TypeSpec -> AliasDecl','TypeSpec',1,'p_type_spec','parser.py',437),
+  ('TypeSpec -> TypeDef','TypeSpec',1,'p_type_spec','parser.py',438),
+  ('AliasDecl -> IDENT ASSIGN Type','AliasDecl',3,'p_alias_decl','parser.py',444),
+  ('TypeDef -> IDENT Type','TypeDef',2,'p_type_def','parser.py',457),
+  ('VarDecl -> VAR VarSpec','VarDecl',2,'p_var_decl','parser.py',470),
+  ('VarDecl -> VAR LPAREN VarSpecRep RPAREN','VarDecl',4,'p_var_decl','parser.py',471),
+  ('VarSpecRep -> VarSpecRep VarSpec SEMICOLON','VarSpecRep',3,'p_var_spec_rep','parser.py',485),
+  ('VarSpecRep -> epsilon','VarSpecRep',1,'p_var_spec_rep','parser.py',486),
+  ('VarSpec -> IdentifierList Type ExpressionListOpt','VarSpec',3,'p_var_spec','parser.py',497),
+  ('VarSpec -> IdentifierList ASSIGN ExpressionList','VarSpec',3,'p_var_spec','parser.py',498),
+  ('ExpressionListOpt -> ASSIGN ExpressionList','ExpressionListOpt',2,'p_expr_list_opt','parser.py',533),
+  ('ExpressionListOpt -> epsilon','ExpressionListOpt',1,'p_expr_list_opt','parser.py',534),
+  ('ShortVarDecl -> IDENT DEFINE Expression','ShortVarDecl',3,'p_short_var_decl','parser.py',548),
+  ('FunctionDecl -> FUNC FunctionName CreateScope Function EndScope','FunctionDecl',5,'p_func_decl','parser.py',573),
+  ('FunctionName -> IDENT','FunctionName',1,'p_func_name','parser.py',593),
+  ('Function -> Signature FunctionBody','Function',2,'p_func','parser.py',599),
+  ('FunctionBody -> Block','FunctionBody',1,'p_func_body','parser.py',604),
+  ('FunctionBody -> epsilon','FunctionBody',1,'p_func_body','parser.py',605),
+  ('CreateScope -> <empty>','CreateScope',0,'p_create_scope','parser.py',612),
+  ('EndScope -> <empty>','EndScope',0,'p_delete_scope','parser.py',635),
+  ('Operand -> BasicLit','Operand',1,'p_operand','parser.py',643),
+  ('Operand -> OperandName','Operand',1,'p_operand','parser.py',644),
+  ('Operand -> LPAREN Expression RPAREN','Operand',3,'p_operand','parser.py',645),
+  ('BasicLit -> IntLit','BasicLit',1,'p_basic_lit','parser.py',654),
+  ('BasicLit -> FloatLit','BasicLit',1,'p_basic_lit','parser.py',655),
+  ('BasicLit -> StringLit','BasicLit',1,'p_basic_lit','parser.py',656),
+  ('BasicLit -> BoolLit','BasicLit',1,'p_basic_lit','parser.py',657),
+  ('IntLit -> INT_LITERAL','IntLit',1,'p_basic_lit_1','parser.py',663),
+  ('FloatLit -> FLOAT_LITERAL','FloatLit',1,'p_basic_lit_2','parser.py',673),
+  ('StringLit -> STRING_LITERAL','StringLit',1,'p_basic_lit_3','parser.py',682),
+  ('BoolLit -> TRUE','BoolLit',1,'p_basic_lit_4','parser.py',691),
+  ('BoolLit -> FALSE','BoolLit',1,'p_basic_lit_4','parser.py',692),
+  ('OperandName -> IDENT','OperandName',1,'p_operand_name','parser.py',703),
+  ('PrimaryExpr -> Operand','PrimaryExpr',1,'p_prim_expr','parser.py',717),
+  ('PrimaryExpr -> PrimaryExpr Selector','PrimaryExpr',2,'p_prim_expr','parser.py',718),
+  ('PrimaryExpr -> Conversion','PrimaryExpr',1,'p_prim_expr','parser.py',719),
+  ('PrimaryExpr -> PrimaryExpr Index','PrimaryExpr',2,'p_prim_expr','parser.py',720),
+  ('PrimaryExpr -> IDENT Arguments','PrimaryExpr',2,'p_prim_expr','parser.py',721),
+  ('Selector -> PERIOD IDENT','Selector',2,'p_selector','parser.py',811),
+  ('Index -> LBRACK Expression RBRACK','Index',3,'p_index','parser.py',816),
+  ('Arguments -> LPAREN ExpressionListTypeOpt RPAREN','Arguments',3,'p_argument','parser.py',823),
+  ('ExpressionListTypeOpt -> ExpressionList','ExpressionListTypeOpt',1,'p_expr_list_type_opt','parser.py',829),
+  ('ExpressionListTypeOpt -> epsilon','ExpressionListTypeOpt',1,'p_expr_list_type_opt','parser.py',830),
+  ('Expression -> UnaryExpr','Expression',1,'p_expr','parser.py',838),
+  ('Expression -> Expression BinaryOp Expression','Expression',3,'p_expr','parser.py',839),
+  ('UnaryExpr -> PrimaryExpr','UnaryExpr',1,'p_unary_expr','parser.py',877),
+  ('UnaryExpr -> UnaryOp UnaryExpr','UnaryExpr',2,'p_unary_expr','parser.py',878),
+  ('UnaryExpr -> NOT UnaryExpr','UnaryExpr',2,'p_unary_expr','parser.py',879),
+  ('BinaryOp -> LOR','BinaryOp',1,'p_binary_op','parser.py',936),
+  ('BinaryOp -> LAND','BinaryOp',1,'p_binary_op','parser.py',937),
+  ('BinaryOp -> RelOp','BinaryOp',1,'p_binary_op','parser.py',938),
+  ('BinaryOp -> AddMulOp','BinaryOp',1,'p_binary_op','parser.py',939),
+  ('RelOp -> EQL','RelOp',1,'p_rel_op','parser.py',954),
+  ('RelOp -> NEQ','RelOp',1,'p_rel_op','parser.py',955),
+  ('RelOp -> LSS','RelOp',1,'p_rel_op','parser.py',956),
+  ('RelOp -> GTR','RelOp',1,'p_rel_op','parser.py',957),
+  ('RelOp -> LEQ','RelOp',1,'p_rel_op','parser.py',958),
+  ('RelOp -> GEQ','RelOp',1,'p_rel_op','parser.py',959),
+  ('AddMulOp -> UnaryOp','AddMulOp',1,'p_add_mul_op','parser.py',974),
+  ('AddMulOp -> OR','AddMulOp',1,'p_add_mul_op','parser.py',975),
+  ('AddMulOp -> XOR','AddMulOp',1,'p_add_mul_op','parser.py',976),
+  ('AddMulOp -> QUO','AddMulOp',1,'p_add_mul_op','parser.py',977),
+  ('AddMulOp -> REM','AddMulOp',1,'p_add_mul_op','parser.py',978),
+  ('AddMulOp -> SHL','AddMulOp',1,'p_add_mul_op','parser.py',979),
+  ('AddMulOp -> SHR','AddMulOp',1,'p_add_mul_op','parser.py',980),
+  ('UnaryOp -> ADD','UnaryOp',1,'p_unary_op','parser.py',992),
+  ('UnaryOp -> SUB','UnaryOp',1,'p_unary_op','parser.py',993),
+  ('UnaryOp -> MUL','UnaryOp',1,'p_unary_op','parser.py',994),
+  ('UnaryOp -> AND','UnaryOp',1,'p_unary_op','parser.py',995),
+  ('Conversion -> TYPECAST Type LPAREN Expression RPAREN','Conversion',5,'p_conversion','parser.py',1008),
+  ('Statement -> Declaration','Statement',1,'p_statement','parser.py',1026),
+  ('Statement -> SimpleStmt','Statement',1,'p_statement','parser.py',1027),
+  ('Statement -> ReturnStmt','Statement',1,'p_statement','parser.py',1028),
+  ('Statement -> BreakStmt','Statement',1,'p_statement','parser.py',1029),
+  ('Statement -> ContinueStmt','Statement',1,'p_statement','parser.py',1030),
+  ('Statement -> CreateScope Block EndScope','Statement',3,'p_statement','parser.py',1031),
+  ('Statement -> IfStmt','Statement',1,'p_statement','parser.py',1032),
+  ('Statement -> ForStmt','Statement',1,'p_statement','parser.py',1033),
+  ('Statement -> PrintStmt','Statement',1,'p_statement','parser.py',1034),
+  ('Statement -> ScanStmt','Statement',1,'p_statement','parser.py',1035),
+  ('SimpleStmt -> epsilon','SimpleStmt',1,'p_simple_stmt','parser.py',1044),
+  ('SimpleStmt -> ExpressionStmt','SimpleStmt',1,'p_simple_stmt','parser.py',1045),
+  ('SimpleStmt -> IncDecStmt','SimpleStmt',1,'p_simple_stmt','parser.py',1046),
+  ('SimpleStmt -> Assignment','SimpleStmt',1,'p_simple_stmt','parser.py',1047),
+  ('SimpleStmt -> ShortVarDecl','SimpleStmt',1,'p_simple_stmt','parser.py',1048),
+  ('ExpressionStmt -> Expression','ExpressionStmt',1,'p_expression_stmt','parser.py',1054),
+  ('IncDecStmt -> Expression INC','IncDecStmt',2,'p_inc_dec','parser.py',1060),
+  ('IncDecStmt -> Expression DEC','IncDecStmt',2,'p_inc_dec','parser.py',1061),
+  ('Assignment -> ExpressionList assign_op ExpressionList','Assignment',3,'p_assignment','parser.py',1072),
+  ('assign_op -> AssignOp','assign_op',1,'p_assign_op','parser.py',1102),
+  ('AssignOp -> ADD_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1108),
+  ('AssignOp -> SUB_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1109),
+  ('AssignOp -> MUL_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1110),
+  ('AssignOp -> QUO_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1111),
+  ('AssignOp -> REM_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1112),
+  ('AssignOp -> AND_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1113),
+  ('AssignOp -> OR_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1114),
+  ('AssignOp -> XOR_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1115),
+  ('AssignOp -> SHL_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1116),
+  ('AssignOp -> SHR_ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1117),
+  ('AssignOp -> ASSIGN','AssignOp',1,'p_AssignOp','parser.py',1118),
+  ('IfStmt -> IF CreateScope Expression Block ElseOpt EndScope','IfStmt',6,'p_if_statement','parser.py',1130),
+  ('ElseOpt -> ELSE CreateScope IfStmt EndScope','ElseOpt',4,'p_else_opt','parser.py',1154),
+  ('ElseOpt -> ELSE CreateScope Block EndScope','ElseOpt',4,'p_else_opt','parser.py',1155),
+  ('ElseOpt -> epsilon','ElseOpt',1,'p_else_opt','parser.py',1156),
+  ('PrintStmt -> PRINT ExpressionList','PrintStmt',2,'p_print','parser.py',1170),
+  ('ScanStmt -> SCAN ExpressionList','ScanStmt',2,'p_scan','parser.py',1178),
+  ('ForStmt -> FOR CreateScope ConditionBlockOpt Block EndScope','ForStmt',5,'p_for','parser.py',1190),
+  ('ConditionBlockOpt -> epsilon','ConditionBlockOpt',1,'p_conditionblockopt','parser.py',1207),
+  ('ConditionBlockOpt -> Condition','ConditionBlockOpt',1,'p_conditionblockopt','parser.py',1208),
+  ('ConditionBlockOpt -> ForClause','ConditionBlockOpt',1,'p_conditionblockopt','parser.py',1209),
+  ('Condition -> Expression','Condition',1,'p_condition','parser.py',1225),
+  ('ForClause -> SimpleStmt SEMICOLON ConditionOpt SEMICOLON SimpleStmt','ForClause',5,'p_forclause','parser.py',1238),
+  ('ConditionOpt -> epsilon','ConditionOpt',1,'p_conditionopt','parser.py',1261),
+  ('ConditionOpt -> Condition','ConditionOpt',1,'p_conditionopt','parser.py',1262),
+  ('ReturnStmt -> RETURN ExpressionListPureOpt','ReturnStmt',2,'p_return','parser.py',1271),
+  ('ExpressionListPureOpt -> ExpressionList','ExpressionListPureOpt',1,'p_expressionlist_pure_opt','parser.py',1294),
+  ('ExpressionListPureOpt -> epsilon','ExpressionListPureOpt',1,'p_expressionlist_pure_opt','parser.py',1295),
+  ('BreakStmt -> BREAK','BreakStmt',1,'p_break','parser.py',1300),
+  ('ContinueStmt -> CONTINUE','ContinueStmt',1,'p_continue','parser.py',1311),
+  ('SourceFile -> PackageClause SEMICOLON ImportDeclRep TopLevelDeclRep','SourceFile',4,'p_source_file','parser.py',1326),
+  ('ImportDeclRep -> epsilon','ImportDeclRep',1,'p_import_decl_rep','parser.py',1331),
+  ('ImportDeclRep -> ImportDeclRep ImportDecl SEMICOLON','ImportDeclRep',3,'p_import_decl_rep','parser.py',1332),
+  ('TopLevelDeclRep -> TopLevelDeclRep TopLevelDecl SEMICOLON','TopLevelDeclRep',3,'p_toplevel_decl_rep','parser.py',1337),
+  ('TopLevelDeclRep -> epsilon','TopLevelDeclRep',1,'p_toplevel_decl_rep','parser.py',1338),
+  ('PackageClause -> PACKAGE PackageName','PackageClause',2,'p_package_clause','parser.py',1351),
+  ('PackageName -> IDENT','PackageName',1,'p_package_name','parser.py',1358),
+  ('ImportDecl -> IMPORT ImportSpec','ImportDecl',2,'p_import_decl','parser.py',1368),
+  ('ImportDecl -> IMPORT LPAREN ImportSpecRep RPAREN','ImportDecl',4,'p_import_decl','parser.py',1369),
+  ('ImportSpecRep -> ImportSpecRep ImportSpec SEMICOLON','ImportSpecRep',3,'p_import_spec_rep','parser.py',1373),
+  ('ImportSpecRep -> epsilon','ImportSpecRep',1,'p_import_spec_rep','parser.py',1374),
+  ('ImportSpec -> PackageNameDotOpt ImportPath','ImportSpec',2,'p_import_spec','parser.py',1379),
+  ('PackageNameDotOpt -> PERIOD','PackageNameDotOpt',1,'p_package_name_dot_opt','parser.py',1383),
+  ('PackageNameDotOpt -> PackageName','PackageNameDotOpt',1,'p_package_name_dot_opt','parser.py',1384),
+  ('PackageNameDotOpt -> epsilon','PackageNameDotOpt',1,'p_package_name_dot_opt','parser.py',1385),
+  ('ImportPath -> STRING_LITERAL','ImportPath',1,'p_import_path','parser.py',1390),
+  ('epsilon -> <empty>','epsilon',0,'p_empty','parser.py',1396),
+]
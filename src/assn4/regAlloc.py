@@ -0,0 +1,212 @@
+import bisect
+import re
+
+from cfg import ControlFlowGraph
+
+# edi and esi are the scratch registers of every emitter in codeGen.py, so
+# only these four are handed out to variables. Order decides preference.
+ALLOCATABLE = ['ebx', 'ecx', 'edx', 'eax']
+
+# opcodes whose emitters read and write their operands through
+# CodeGenerator.location(), ie. they work with a register in place of [ebp+off]
+REG_OPS = set([
+    '+int', '-int', '*int', '/int',
+    '==int', '!=int', '<=int', '>=int', '>int', '<int',
+    '||', '&&', 'if', '++', '--', '=', 'param', 'print_int', '+ptr',
+])
+
+RELOPS = set(['==int', '!=int', '<=int', '>=int', '>int', '<int'])
+FRELOPS = set(['==float', '!=float', '<=float', '>=float', '>float', '<float'])
+
+CALLER_SAVED = ['eax', 'ecx', 'edx']
+
+identRe = re.compile(r'[A-Za-z_][A-Za-z_0-9]*$')
+
+
+class RegisterAllocator:
+    r'''
+    Linear scan register allocation over the 3AC of a single function.
+    Liveness comes from the basic blocks of cfg.py, every variable gets the interval
+    between the first and last instruction it is live at, and intervals are
+    packed into ALLOCATABLE registers, avoiding registers that any emitter
+    inside the interval uses internally (calls, div, copy loops ...).
+    '''
+    def __init__(self, helper, code, scopeInfo):
+        self.helper = helper
+        self.code = code
+        self.scopeInfo = scopeInfo
+        self.stats = {'allocated': 0, 'spilled': 0}
+
+    def isVar(self, instr, scopeInfo, pos):
+        return (pos < len(instr) and pos < len(scopeInfo) and isinstance(instr[pos], str)
+                and isinstance(scopeInfo[pos], int)
+                and self.helper.symbolTables[scopeInfo[pos]].get(instr[pos]) is not None)
+
+    def info(self, key):
+        return self.helper.symbolTables[key[0]].get(key[1])
+
+    def isReference(self, key):
+        return 'reference' in self.info(key)
+
+    def baseType(self, key):
+        return self.helper.getBaseType(self.info(key)['type'])[0]
+
+    def isAggregateAdd(self, instr, scopeInfo):
+        # add_op takes the address arithmetic path when src1 is a struct/array object
+        return (instr[0] == '+int' and self.isVar(instr, scopeInfo, 2)
+                and self.baseType((scopeInfo[2], instr[2])) in ['struct', 'array'])
+
+    def isScalarAssign(self, instr, scopeInfo):
+        if instr[1][0] == '*' or not self.isVar(instr, scopeInfo, 1):
+            return False
+        if self.baseType((scopeInfo[1], instr[1])) in ['struct', 'array', 'float']:
+            return False
+        # conversions like (float)t3 are not plain variables
+        return not (isinstance(instr[2], str) and instr[2][:1] == '(')
+
+    def defUse(self, instr, scopeInfo):
+        # returns (defs, uses) as lists of (scope, ident) keys
+        op = instr[0]
+        defs = []
+        uses = []
+        if len(instr) == 1 or op in ['goto', 'call']:
+            return defs, uses
+        if op in ['if', 'param', 'return'] or op[:6] == 'print_':
+            if self.isVar(instr, scopeInfo, 1):
+                uses.append((scopeInfo[1], instr[1]))
+            return defs, uses
+
+        for pos in range(2, len(instr)):
+            if self.isVar(instr, scopeInfo, pos):
+                uses.append((scopeInfo[pos], instr[pos]))
+        if self.isVar(instr, scopeInfo, 1):
+            key = (scopeInfo[1], instr[1])
+            if op in ['++', '--', '+=', '-=', '*=', '/=', '+ptr']:
+                # read-modify-write
+                uses.append(key)
+                defs.append(key)
+            elif self.isReference(key) and not self.isAggregateAdd(instr, scopeInfo):
+                # the destination holds an address that is stored through
+                uses.append(key)
+            else:
+                defs.append(key)
+        return defs, uses
+
+    def clobbers(self, instr, scopeInfo):
+        op = instr[0]
+        if len(instr) == 1:
+            return []
+        if op == 'call':
+            return ALLOCATABLE
+        if op in RELOPS or op in FRELOPS or op == 'return':
+            return ['eax']
+        if op in ['/int', '/=']:
+            return ['eax', 'ebx', 'edx']
+        if op in ['retval', 'scan_string'] or op[:6] in ['print_', 'scan_i']:
+            return CALLER_SAVED
+        if op == '*pointer':
+            return ['ecx', 'edx']
+        if op == '+int' and self.isAggregateAdd(instr, scopeInfo):
+            return ['edx']
+        if op == 'param':
+            return ['ecx', 'edx']
+        if op == '=' and instr[1][0] != '*' and self.isVar(instr, scopeInfo, 1):
+            if self.baseType((scopeInfo[1], instr[1])) in ['struct', 'array']:
+                return ['ecx', 'edx']
+        return []
+
+    def liveness(self, start, end, defUse):
+        return ControlFlowGraph(self.code, start, end).liveness(defUse)
+
+    def candidates(self, start, end):
+        # variables that may live in a register: 4 byte scalars, not parameters,
+        # never address taken and only touched by register aware emitters
+        keys = set()
+        banned = set()
+        for idx in range(start, end):
+            instr = self.code[idx]
+            scopeInfo = self.scopeInfo[idx]
+            regAware = instr[0] in REG_OPS
+            if regAware and instr[0] == '=':
+                regAware = self.isScalarAssign(instr, scopeInfo)
+            for pos in range(1, len(instr)):
+                if not isinstance(instr[pos], str):
+                    continue
+                if self.isVar(instr, scopeInfo, pos) and regAware:
+                    keys.add((scopeInfo[pos], instr[pos]))
+                    continue
+                match = identRe.search(instr[pos])
+                if match is not None:
+                    banned.add(match.group(0))
+
+        result = set()
+        for key in keys:
+            if key[1] in banned or key[0] == 0:
+                continue
+            info = self.info(key)
+            if 'is_arg' in info or 'parent' in info or info.get('size') != 4:
+                continue
+            if self.baseType(key) not in ['int', 'bool', 'pointer']:
+                continue
+            result.add(key)
+        return result
+
+    def allocate(self, start, end, overrides={}):
+        r'''
+        start, end: range of 3AC indices forming the function body
+        overrides: index -> (defs, uses) for instructions the code generator
+        emits differently, eg. fused with their neighbour
+        returns a map (scope, ident) -> register
+        '''
+        defUse = {idx: self.defUse(self.code[idx], self.scopeInfo[idx]) for idx in range(start, end)}
+        defUse.update(overrides)
+        cands = self.candidates(start, end)
+        if len(cands) == 0:
+            return {}
+        liveIn, liveOut = self.liveness(start, end, defUse)
+
+        intervals = {}
+        clobberAt = {reg: [] for reg in ALLOCATABLE}
+        for idx in range(start, end):
+            for reg in self.clobbers(self.code[idx], self.scopeInfo[idx]):
+                clobberAt[reg].append(idx)
+            defs, uses = defUse[idx]
+            for key in (liveIn[idx] | liveOut[idx] | set(defs) | set(uses)) & cands:
+                if key in intervals:
+                    intervals[key][1] = idx
+                else:
+                    intervals[key] = [idx, idx]
+
+        def allowed(interval):
+            regs = []
+            for reg in ALLOCATABLE:
+                pos = bisect.bisect_left(clobberAt[reg], interval[0])
+                if pos == len(clobberAt[reg]) or clobberAt[reg][pos] > interval[1]:
+                    regs.append(reg)
+            return regs
+
+        regMap = {}
+        active = []
+        for key in sorted(intervals, key=lambda k: (intervals[k][0], k[1])):
+            interval = intervals[key]
+            active = [k for k in active if intervals[k][1] >= interval[0]]
+            regs = allowed(interval)
+            busy = set(regMap[k] for k in active)
+            free = [reg for reg in regs if reg not in busy]
+            if len(free) > 0:
+                regMap[key] = free[0]
+                active.append(key)
+                continue
+            # spill whichever interval ends last, if its register fits here
+            victims = [k for k in active if regMap[k] in regs and intervals[k][1] > interval[1]]
+            if len(victims) > 0:
+                victim = max(victims, key=lambda k: intervals[k][1])
+                regMap[key] = regMap.pop(victim)
+                active.remove(victim)
+                active.append(key)
+                self.stats['spilled'] += 1
+            else:
+                self.stats['spilled'] += 1
+
+        self.stats['allocated'] += len(regMap)
+        return regMap
@@ -10,8 +10,7 @@ do
     echo ""
     echo "==================================="
     echo $a$goFile
-    python3 parser.py --input=$a$goFile --csv="symTab.csv" --code="3AC.code"
-    python3 codeGen.py
+    python3 driver.py --input=$a$goFile --csv="symTab.csv" --code="3AC.code"
 
     nasm -f elf32 "assembly.asm" -o "assembly.o"
     gcc -m32 "assembly.o" -o "a.out"
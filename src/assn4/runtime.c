@@ -0,0 +1,169 @@
+/*
+ * Buffered I/O runtime for code generated with codeGen.py --io=buffered
+ *
+ *     gcc -m32 -O2 -c runtime.c -o runtime.o
+ *     gcc -m32 assembly.o runtime.o -o a.out
+ *
+ * Everything printed goes to one buffer that is written with write(2) when
+ * it fills up, before the program waits for input and once at exit. Input
+ * is read in blocks as well. The output matches the printf/puts/scanf code
+ * of the default --io=printf: "%i " for ints, "%f \n" for floats and a
+ * newline after strings.
+ */
+#include <stdarg.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+#define BUFFER_SIZE (1 << 16)
+/* longest "%f \n" of a double: 309 digits, sign, point, 6 decimals */
+#define FLOAT_SIZE 400
+#define LINE_SIZE 100
+
+static char out[BUFFER_SIZE];
+static int outLen;
+static char in[BUFFER_SIZE];
+static int inPos, inLen;
+
+void rt_flush(void)
+{
+    int done = 0;
+    while (done < outLen) {
+        int n = write(1, out + done, outLen - done);
+        if (n <= 0)
+            break;
+        done += n;
+    }
+    outLen = 0;
+}
+
+__attribute__((constructor)) static void rt_init(void)
+{
+    /* main returns into libc, which runs the atexit handlers */
+    atexit(rt_flush);
+}
+
+static void reserve(int size)
+{
+    if (outLen + size > BUFFER_SIZE)
+        rt_flush();
+}
+
+static void putInt(int value)
+{
+    char digits[10];
+    unsigned int rest = value < 0 ? 0u - (unsigned int)value : (unsigned int)value;
+    int count = 0;
+
+    reserve(12);
+    do {
+        digits[count++] = '0' + rest % 10;
+        rest /= 10;
+    } while (rest != 0);
+    if (value < 0)
+        out[outLen++] = '-';
+    while (count > 0)
+        out[outLen++] = digits[--count];
+    out[outLen++] = ' ';
+}
+
+static void putFloat(double value)
+{
+    reserve(FLOAT_SIZE);
+    outLen += snprintf(out + outLen, FLOAT_SIZE, "%f \n", value);
+}
+
+static void putString(const char *text)
+{
+    while (*text != '\0') {
+        reserve(1);
+        out[outLen++] = *text++;
+    }
+    reserve(1);
+    out[outLen++] = '\n';
+}
+
+/*
+ * Prints one value per character of kinds: 'i' an int, 'f' a double
+ * (floats are widened by the caller, as for printf) and 's' a string.
+ */
+void rt_print(const char *kinds, ...)
+{
+    va_list args;
+
+    va_start(args, kinds);
+    for (; *kinds != '\0'; kinds++) {
+        switch (*kinds) {
+        case 'i':
+            putInt(va_arg(args, int));
+            break;
+        case 'f':
+            putFloat(va_arg(args, double));
+            break;
+        case 's':
+            putString(va_arg(args, const char *));
+            break;
+        }
+    }
+    va_end(args);
+}
+
+static int peekByte(void)
+{
+    if (inPos == inLen) {
+        /* show pending output (prompts) before blocking on input */
+        rt_flush();
+        inPos = 0;
+        inLen = read(0, in, BUFFER_SIZE);
+        if (inLen <= 0) {
+            inLen = 0;
+            return EOF;
+        }
+    }
+    return (unsigned char)in[inPos];
+}
+
+/* scanf("%d", p): *p is left alone if no number follows */
+void rt_scan_int(int *p)
+{
+    unsigned int value = 0;
+    int negative = 0;
+    int c = peekByte();
+
+    while (c == ' ' || c == '\t' || c == '\n' || c == '\r') {
+        inPos++;
+        c = peekByte();
+    }
+    if (c == '-' || c == '+') {
+        negative = c == '-';
+        inPos++;
+        c = peekByte();
+    }
+    if (c < '0' || c > '9')
+        return;
+    while (c >= '0' && c <= '9') {
+        value = value * 10 + (c - '0');
+        inPos++;
+        c = peekByte();
+    }
+    *p = negative ? (int)(0u - value) : (int)value;
+}
+
+/* the rest of the current line (without the newline) in a new string */
+char *rt_scan_string(void)
+{
+    char *line = malloc(LINE_SIZE);
+    int len = 0;
+    int c = peekByte();
+
+    while (c != EOF && c != '\n') {
+        if (len < LINE_SIZE - 1)
+            line[len++] = c;
+        inPos++;
+        c = peekByte();
+    }
+    if (c == '\n')
+        inPos++;
+    line[len] = '\0';
+    return line;
+}
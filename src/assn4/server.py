@@ -0,0 +1,120 @@
+r'''
+Compile server: keeps the modules, the lexer and the parser loaded and
+compiles the Go sources that client.py sends over a UNIX socket, so a build
+compiling many small files pays the interpreter start and the PLY table
+loading once.
+Run from src/assn4:
+    python3 server.py [--socket=path]
+One request per connection: the client writes a JSON object and shuts down
+its side, the server answers with a JSON object and closes.
+request:  {"source": Go source, "asm": true to generate assembly,
+           "args": codeGen.py options like ["--backend=regalloc"]}
+response: {"status": "ok"/"error"/"crash", "errors": Errors entries,
+           "log": everything the compiler printed,
+           "csv", "code", "asm": the output files as text or null}
+Requests are compiled one at a time, see parser.Compiler.
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socketserver
+import tempfile
+import threading
+import traceback
+
+import parser as goParser
+from codeGen import addArguments, generate
+
+SOCKET = os.path.join(tempfile.gettempdir(), 'gocompile-%d.sock' % os.getuid())
+
+
+def codeGenOptions(args):
+    r'''
+    parses the codeGen.py options of a request, None for a bad option:
+    argparse reports it by printing the usage and raising SystemExit
+    '''
+    argParser = argparse.ArgumentParser(prog='codeGen options')
+    addArguments(argParser, singleFile=False)
+    try:
+        result = argParser.parse_args(args)
+    except SystemExit:
+        return None
+    # files are written by the client
+    result.dot = None
+    return result
+
+
+def compileRequest(compiler, request):
+    response = {'status': 'ok', 'errors': [], 'csv': None, 'code': None, 'asm': None}
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        options = codeGenOptions(request.get('args', []))
+        if options is None:
+            response['status'] = 'crash'
+        else:
+            try:
+                parsed = compiler.compile(request['source'])
+                if parsed is None:
+                    response['status'] = 'error'
+                    response['errors'] = compiler.errors.error
+                else:
+                    helper, rootNode = parsed
+                    csv_file = io.StringIO()
+                    goParser.generateCSV(csv_file, helper)
+                    response['csv'] = csv_file.getvalue()
+                    response['code'] = ''.join(goParser.getCodeString(code_) + '\n' for code_ in rootNode.code)
+                    if request.get('asm', True):
+                        response['asm'] = ''.join(line + '\n' for line in generate(helper, rootNode, options))
+            except Exception:
+                response['status'] = 'crash'
+                traceback.print_exc()
+    response['log'] = log.getvalue()
+    return response
+
+
+class CompileHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.read().decode('utf-8'))
+        except ValueError as err_:
+            response = {'status': 'crash', 'errors': [], 'log': 'bad request: ' + str(err_) + '\n'}
+        else:
+            response = compileRequest(self.server.compiler, request)
+        self.wfile.write(json.dumps(response).encode('utf-8'))
+
+
+class CompileServer(socketserver.UnixStreamServer):
+    def __init__(self, path):
+        # the lexer and the parser are built before the first connection
+        self.compiler = goParser.Compiler()
+        if os.path.exists(path):
+            os.remove(path)
+        socketserver.UnixStreamServer.__init__(self, path, CompileHandler)
+
+
+def main():
+    argParser = argparse.ArgumentParser(description='Compiles the Go sources sent by client.py')
+    argParser.add_argument('--socket', dest='socket', help='path of the UNIX socket', default=SOCKET)
+    result = argParser.parse_args()
+
+    server = CompileServer(result.socket)
+    # a build system stops the server with SIGTERM. shutdown() waits for
+    # serve_forever to return, so it runs in another thread and the request
+    # being compiled is answered first.
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    print('listening on ' + result.socket, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(result.socket)
+
+
+if __name__ == '__main__':
+    main()
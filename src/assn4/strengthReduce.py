@@ -0,0 +1,142 @@
+from cfg import ControlFlowGraph, functionRanges
+from regAlloc import RegisterAllocator
+
+
+class StrengthReducer:
+    r'''
+    Induction variable strength reduction over the 3AC, run after
+    JumpThreader (loops are rotated and have a preheader) and before
+    DeadCodeEliminator.
+    Inside a loop whose only write to i is '++ i i' (or '-- i i'), the
+    element address 'mul t2, i, size / add t1, array, t2' is computed once
+    before the loop, and '+ptr t1 size' after the increment keeps t1
+    pointing at array[i], so a sequential array walk becomes a pointer
+    increment. t1 must only be read right after its definition (in the same
+    block and before the increment), which is how the parser indexes arrays.
+    '''
+    def __init__(self, helper, rootNode):
+        self.helper = helper
+        self.rootNode = rootNode
+        self.stats = {'reduced': 0}
+        self.addressTaken = set()
+        for instr, scopeInfo in zip(rootNode.code, rootNode.scopeInfo):
+            if instr[0][:1] == '&' and len(instr) > 2:
+                self.addressTaken.add((scopeInfo[2], instr[2]))
+
+    def isInduction(self, allocator, key):
+        if key[0] == 0 or key in self.addressTaken or allocator.isReference(key):
+            return False
+        return allocator.baseType(key) == 'int'
+
+    def candidate(self, allocator, code, scopeInfo, idx):
+        r'''
+        returns (index, address) keys if code[idx:idx+2] computes the address
+        of an element of a local array from a variable index, else None
+        '''
+        mul = code[idx]
+        add = code[idx + 1]
+        if mul[0] != '*int' or len(mul) != 4 or scopeInfo[idx][3] != 'literal' or type(mul[3]) != int:
+            return None
+        if add[0] != '+int' or len(add) != 4 or add[3] != mul[1] or scopeInfo[idx + 1][3] != scopeInfo[idx][1]:
+            return None
+        if not allocator.isVar(mul, scopeInfo[idx], 2) or not allocator.isAggregateAdd(add, scopeInfo[idx + 1]):
+            return None
+        array = (scopeInfo[idx + 1][2], add[2])
+        if allocator.baseType(array) != 'array' or allocator.isReference(array):
+            # an array behind a pointer may move
+            return None
+        return (scopeInfo[idx][2], mul[2]), (scopeInfo[idx + 1][1], add[1])
+
+    def reduce(self, code, scopeInfo):
+        r'''
+        rewrites one array walk of code (a function body), returns the new
+        lists or None
+        '''
+        allocator = RegisterAllocator(self.helper, code, scopeInfo)
+        defUse = [allocator.defUse(code[idx], scopeInfo[idx]) for idx in range(len(code))]
+        defs = {}
+        uses = {}
+        for idx, (defs_, uses_) in enumerate(defUse):
+            for key in defs_:
+                defs.setdefault(key, []).append(idx)
+            for key in uses_:
+                uses.setdefault(key, []).append(idx)
+
+        graph = ControlFlowGraph(code, 0, len(code))
+        loops = {}
+        for header, blocks in graph.naturalLoops():
+            loops.setdefault(header.index, set()).update(blocks)
+
+        for headerIndex, blocks in sorted(loops.items()):
+            header = graph.blocks[headerIndex]
+            # the preheader is the block falling into the header
+            outside = [pred for pred in header.pred if pred.index not in blocks]
+            if header.index == 0 or outside != [graph.blocks[header.index - 1]]:
+                continue
+            last = code[outside[0].end - 1]
+            if last[0] in ['goto', 'return'] or (last[0] == 'if' and last[5] == header.label):
+                continue
+
+            inLoop = set()
+            for index in blocks:
+                inLoop.update(range(graph.blocks[index].start, graph.blocks[index].end))
+            for idx in sorted(inLoop):
+                if idx + 1 not in inLoop or graph.blockOf[idx + 1] is not graph.blockOf[idx]:
+                    continue
+                keys = self.candidate(allocator, code, scopeInfo, idx)
+                if keys is None:
+                    continue
+                index, address = keys
+                product = (scopeInfo[idx][1], code[idx][1])
+                steps = [pos for pos in defs.get(index, []) if pos in inLoop]
+                if len(steps) != 1 or code[steps[0]][0] not in ['++', '--'] or not self.isInduction(allocator, index):
+                    continue
+                step = steps[0]
+                if defs.get(product) != [idx] or uses.get(product) != [idx + 1] or defs.get(address) != [idx + 1]:
+                    continue
+                block = graph.blockOf[idx]
+                reads = uses.get(address, [])
+                if any(graph.blockOf[pos] is not block or pos <= idx + 1 for pos in reads):
+                    continue
+                if graph.blockOf[step] is block and any(idx + 1 < step < pos for pos in reads):
+                    continue
+                return self.rewrite(code, scopeInfo, idx, step, header.start)
+        return None
+
+    def rewrite(self, code, scopeInfo, idx, step, preheader):
+        size = code[idx][3] if code[step][0] == '++' else -code[idx][3]
+        address = code[idx + 1][1]
+        newCode = []
+        newScope = []
+        for pos in range(len(code)):
+            if pos == preheader:
+                # address of the element at the index the loop starts with
+                newCode += [code[idx], code[idx + 1]]
+                newScope += [scopeInfo[idx], scopeInfo[idx + 1]]
+            if pos not in [idx, idx + 1]:
+                newCode.append(code[pos])
+                newScope.append(scopeInfo[pos])
+            if pos == step:
+                newCode.append(['+ptr', address, size])
+                newScope.append(['', scopeInfo[idx + 1][1], 'literal'])
+        self.stats['reduced'] += 1
+        return newCode, newScope
+
+    def run(self):
+        code = self.rootNode.code
+        scopeInfo = self.rootNode.scopeInfo
+        newCode = []
+        newScopeInfo = []
+        for name, start, end in functionRanges(code):
+            # code[start] is the function marker
+            body, bodyScope = code[start + 1:end], scopeInfo[start + 1:end]
+            while True:
+                result = self.reduce(body, bodyScope)
+                if result is None:
+                    break
+                body, bodyScope = result
+            newCode += [code[start]] + body
+            newScopeInfo += [scopeInfo[start]] + bodyScope
+        code[:] = newCode
+        scopeInfo[:] = newScopeInfo
+        return self.stats
@@ -0,0 +1,16 @@
+package main;
+
+func main(){
+	for i:=0;i<5;i++{
+		for j:=0;j<5;j++{
+			k := i * j;
+			if k == 6{
+				print i;
+				print j;
+				return;
+			};
+		};
+		print i;
+	};
+	print "Not Found";
+};